@@ -0,0 +1,363 @@
+// Headless benchmark for the per-frame animation kernels.
+//
+//   npm run bench                      compare against baseline.json
+//   npm run bench -- --update          record a new baseline
+//   npm run bench -- --filter=dots     run matching cases only
+//   npm run bench -- --tolerance=0.5   allow 50% slower before failing
+//   npm run bench -- --require-baseline  fail if a case has no baseline (CI)
+//
+// Each case runs a kernel for a fixed number of frames at one viewport
+// size and pointer trace, drawing into a mock 2D context that counts
+// calls. Reported per case: nanoseconds per point (per sample for noise),
+// heap bytes allocated per frame, and draw calls per frame. Exits with 1
+// when a case regresses against the stored baseline, or with
+// --require-baseline when the baseline or a case's entry is missing, so CI
+// can't pass by never comparing anything. Timings are machine
+// specific: record the baseline on the machine that runs the check.
+
+import { readFile, writeFile } from "node:fs/promises";
+import path from "node:path";
+import { fileURLToPath } from "node:url";
+import { Noise } from "@/lib/animation/noise";
+import { PointerTracker } from "@/lib/animation/pointerTracker";
+import { WaveField } from "@/lib/animation/waveField";
+import { DotsScene, WavesScene } from "@/lib/animation/scenes";
+
+const BASELINE_PATH = path.join(
+  path.dirname(fileURLToPath(import.meta.url)),
+  "baseline.json"
+);
+
+const args = process.argv.slice(2);
+const flag = (name) => args.includes(`--${name}`);
+const option = (name, fallback) => {
+  const match = args.find((arg) => arg.startsWith(`--${name}=`));
+  return match ? match.slice(name.length + 3) : fallback;
+};
+
+const UPDATE = flag("update");
+const REQUIRE_BASELINE = flag("require-baseline") && !UPDATE;
+const FILTER = option("filter", "");
+const TOLERANCE = Number(option("tolerance", "0.3"));
+const WARMUP_FRAMES = 120;
+const MEASURE_FRAMES = Number(option("frames", "600"));
+const ALLOC_FRAMES = 200;
+
+const VIEWPORTS = {
+  mobile: [390, 844],
+  laptop: [1440, 900],
+  wide: [2560, 1440],
+};
+
+// Pointer position for a frame, or null when the pointer is away
+const TRACES = {
+  idle: () => null,
+  sweep: (frame, width, height) => ({
+    x: (frame * 12) % width,
+    y: height / 2 + (Math.sin(frame / 20) * height) / 4,
+  }),
+  circle: (frame, width, height) => {
+    const radius = Math.min(width, height) / 4;
+    return {
+      x: width / 2 + Math.cos(frame * 0.05) * radius,
+      y: height / 2 + Math.sin(frame * 0.05) * radius,
+    };
+  },
+};
+
+// Waves props as used on the home page, plus an animated variant that
+// exercises the noise pass
+const WAVES_CONFIG = {
+  lineColor: "rgba(255, 255, 255, 0.1)",
+  waveSpeedX: 0,
+  waveSpeedY: 0,
+  waveAmpX: 0,
+  waveAmpY: 0,
+  friction: 0.89,
+  tension: 0.0009,
+  maxCursorMove: 100,
+  xGap: 25,
+  yGap: 25,
+  dotSpacing: 25,
+  dotSize: 3,
+  gradientRadius: 250,
+  gradientFalloff: 100,
+};
+const WAVES_ANIMATED_CONFIG = {
+  ...WAVES_CONFIG,
+  waveSpeedX: 0.00059,
+  waveSpeedY: 0.00059,
+  waveAmpX: 32,
+  waveAmpY: 16,
+};
+
+/** 2D context stand-in that counts the calls the renderers make */
+class MockContext2D {
+  globalAlpha = 1;
+  fillStyle = "";
+  fills = 0;
+  strokes = 0;
+  images = 0;
+
+  get drawCalls() {
+    return this.fills + this.strokes + this.images;
+  }
+
+  reset() {
+    this.fills = this.strokes = this.images = 0;
+  }
+
+  fill() {
+    this.fills++;
+  }
+  stroke() {
+    this.strokes++;
+  }
+  drawImage() {
+    this.images++;
+  }
+  setTransform() {}
+  clearRect() {}
+  beginPath() {}
+  closePath() {}
+  moveTo() {}
+  lineTo() {}
+  arc() {}
+  rect() {}
+  save() {}
+  restore() {}
+}
+
+// Each factory returns { points, frame(index, time) } for one case
+const KERNELS = {
+  "noise.perlin2": (width, height) => {
+    const noise = new Noise(0.5);
+    const cols = Math.ceil(width / 25);
+    const rows = Math.ceil(height / 25);
+    let sink = 0;
+    return {
+      points: cols * rows,
+      frame: (_index, time) => {
+        for (let i = 0; i < cols; i++) {
+          for (let j = 0; j < rows; j++) {
+            sink += noise.perlin2(i * 0.05 + time * 1e-4, j * 0.05);
+          }
+        }
+        return sink;
+      },
+    };
+  },
+
+  "waveField.step": (width, height, trace, config = WAVES_CONFIG) => {
+    const field = new WaveField(0.5);
+    const pointer = new PointerTracker();
+    field.resize(width, height, config.xGap, config.yGap);
+    return {
+      points: field.count,
+      frame: (index, time) => {
+        const position = trace(index, width, height);
+        if (position) pointer.move(position.x, position.y);
+        pointer.update();
+        field.step(time, pointer, config);
+      },
+    };
+  },
+
+  "wavesScene.render": (width, height, trace, config = WAVES_CONFIG) => {
+    const scene = new WavesScene(config);
+    scene.resize(width, height, 2);
+    return {
+      points: scene.pointCount,
+      render: (index, time, ctx) => {
+        const position = trace(index, width, height);
+        if (position) scene.pointerMove(position.x, position.y);
+        return scene.render(time, ctx);
+      },
+    };
+  },
+
+  "dotsScene.render": (width, height, trace) => {
+    const scene = new DotsScene();
+    scene.resize(width, height, 2);
+    return {
+      points: scene.dotCount,
+      render: (index, time, ctx) => {
+        const position = trace(index, width, height);
+        if (position) scene.pointerMove(position.x, position.y);
+        else scene.pointerLeave();
+        return scene.render(time, ctx);
+      },
+    };
+  },
+};
+
+function cases() {
+  const list = [];
+  for (const [viewport, [width, height]] of Object.entries(VIEWPORTS)) {
+    list.push({
+      name: `noise.perlin2/${viewport}`,
+      create: () => KERNELS["noise.perlin2"](width, height),
+    });
+    for (const [traceName, trace] of Object.entries(TRACES)) {
+      for (const kernel of [
+        "waveField.step",
+        "wavesScene.render",
+        "dotsScene.render",
+      ]) {
+        list.push({
+          name: `${kernel}/${viewport}/${traceName}`,
+          create: () => KERNELS[kernel](width, height, trace),
+        });
+      }
+    }
+    list.push({
+      name: `wavesScene.render/${viewport}/animated`,
+      create: () =>
+        KERNELS["wavesScene.render"](
+          width,
+          height,
+          TRACES.sweep,
+          WAVES_ANIMATED_CONFIG
+        ),
+    });
+  }
+  return list.filter((c) => c.name.includes(FILTER));
+}
+
+function runFrames(instance, ctx, from, count) {
+  let drawCalls = 0;
+  for (let index = from; index < from + count; index++) {
+    const time = index * (1000 / 60);
+    if (instance.render) drawCalls += instance.render(index, time, ctx);
+    else instance.frame(index, time);
+  }
+  return drawCalls;
+}
+
+function measure(testCase) {
+  const instance = testCase.create();
+  const ctx = new MockContext2D();
+  runFrames(instance, ctx, 0, WARMUP_FRAMES);
+
+  ctx.reset();
+  const start = process.hrtime.bigint();
+  const reported = runFrames(instance, ctx, WARMUP_FRAMES, MEASURE_FRAMES);
+  const elapsed = Number(process.hrtime.bigint() - start);
+  const drawCalls = ctx.drawCalls;
+
+  // Renderers report their own draw calls; cross-check with the mock
+  if (instance.render && reported !== drawCalls) {
+    throw new Error(
+      `${testCase.name}: reported ${reported} draw calls, ` +
+        `context saw ${drawCalls}`
+    );
+  }
+
+  // Heap growth over a short run with collection forced beforehand. Needs
+  // --expose-gc; a young-generation GC during the run can only make the
+  // number smaller, so treat it as a lower bound.
+  let bytesPerFrame = null;
+  if (typeof globalThis.gc === "function") {
+    globalThis.gc();
+    const before = process.memoryUsage().heapUsed;
+    runFrames(instance, ctx, WARMUP_FRAMES + MEASURE_FRAMES, ALLOC_FRAMES);
+    const after = process.memoryUsage().heapUsed;
+    bytesPerFrame = Math.max(0, Math.round((after - before) / ALLOC_FRAMES));
+  }
+
+  return {
+    points: instance.points,
+    nsPerPoint: elapsed / MEASURE_FRAMES / Math.max(1, instance.points),
+    bytesPerFrame,
+    drawCalls: drawCalls / MEASURE_FRAMES,
+  };
+}
+
+function regressions(name, result, base) {
+  if (!base) return [];
+  const problems = [];
+  if (result.nsPerPoint > base.nsPerPoint * (1 + TOLERANCE)) {
+    problems.push(
+      `ns/point ${result.nsPerPoint.toFixed(2)} > ` +
+        `${base.nsPerPoint.toFixed(2)} +${TOLERANCE * 100}%`
+    );
+  }
+  // Draw calls depend only on the batching, so allow a little noise from
+  // randomized dot opacities and nothing more
+  if (result.drawCalls > base.drawCalls * 1.1 + 1) {
+    problems.push(
+      `draw calls/frame ${result.drawCalls.toFixed(1)} > ` +
+        `${base.drawCalls.toFixed(1)}`
+    );
+  }
+  if (
+    result.bytesPerFrame !== null &&
+    base.bytesPerFrame !== null &&
+    result.bytesPerFrame >
+      base.bytesPerFrame + Math.max(1024, base.bytesPerFrame)
+  ) {
+    problems.push(
+      `alloc ${result.bytesPerFrame} B/frame > ${base.bytesPerFrame} B/frame`
+    );
+  }
+  return problems.map((problem) => `${name}: ${problem}`);
+}
+
+async function main() {
+  let baseline = {};
+  try {
+    baseline = JSON.parse(await readFile(BASELINE_PATH, "utf8"));
+  } catch {
+    if (REQUIRE_BASELINE) {
+      console.error(
+        `No baseline at ${path.relative(process.cwd(), BASELINE_PATH)}; ` +
+          "record one with --update."
+      );
+      process.exitCode = 1;
+      return;
+    }
+    if (!UPDATE) console.warn("No baseline yet; run with --update to record.");
+  }
+  if (typeof globalThis.gc !== "function") {
+    console.warn("Run node with --expose-gc to measure allocations.");
+  }
+
+  const results = {};
+  const rows = [];
+  const failures = [];
+  for (const testCase of cases()) {
+    const result = measure(testCase);
+    results[testCase.name] = result;
+    const base = baseline[testCase.name];
+    failures.push(...regressions(testCase.name, result, base));
+    if (!base && REQUIRE_BASELINE) {
+      failures.push(`${testCase.name}: no baseline entry`);
+    }
+    rows.push({
+      case: testCase.name,
+      points: result.points,
+      "ns/point": result.nsPerPoint.toFixed(2),
+      "B/frame": result.bytesPerFrame ?? "-",
+      "draws/frame": result.drawCalls.toFixed(1),
+      "vs baseline": base
+        ? `${((result.nsPerPoint / base.nsPerPoint - 1) * 100).toFixed(0)}%`
+        : "new",
+    });
+  }
+  console.table(rows);
+
+  if (UPDATE) {
+    const next = { ...baseline, ...results };
+    await writeFile(BASELINE_PATH, JSON.stringify(next, null, 2) + "\n");
+    const where = path.relative(process.cwd(), BASELINE_PATH);
+    console.log(`Baseline written to ${where}`);
+    return;
+  }
+  if (failures.length > 0) {
+    console.error(`\n${failures.length} failure(s):`);
+    failures.forEach((failure) => console.error(`  ${failure}`));
+    process.exitCode = 1;
+  }
+}
+
+await main();
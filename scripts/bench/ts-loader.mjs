@@ -0,0 +1,60 @@
+// Minimal Node module hooks so the benchmark and `npm test` can import the
+// app's TypeScript sources directly: resolves the "@/" path alias and
+// extensionless relative imports, and transpiles .ts files with the
+// project's own TypeScript compiler (no type checking).
+
+import { existsSync, statSync } from "node:fs";
+import { readFile } from "node:fs/promises";
+import path from "node:path";
+import { fileURLToPath, pathToFileURL } from "node:url";
+import ts from "typescript";
+
+const SRC_DIR = path.resolve(
+  path.dirname(fileURLToPath(import.meta.url)),
+  "../../src"
+);
+const EXTENSIONS = [".ts", ".tsx", "/index.ts", "/index.tsx"];
+
+function probe(base) {
+  if (existsSync(base) && statSync(base).isFile()) return base;
+  for (const extension of EXTENSIONS) {
+    if (existsSync(base + extension)) return base + extension;
+  }
+  return null;
+}
+
+export async function resolve(specifier, context, nextResolve) {
+  let base = null;
+  if (specifier.startsWith("@/")) {
+    base = path.join(SRC_DIR, specifier.slice(2));
+  } else if (
+    specifier.startsWith(".") &&
+    context.parentURL?.startsWith("file:") &&
+    /\.tsx?$/.test(context.parentURL)
+  ) {
+    base = path.resolve(
+      path.dirname(fileURLToPath(context.parentURL)),
+      specifier
+    );
+  }
+  const file = base && probe(base);
+  if (file) {
+    return { url: pathToFileURL(file).href, shortCircuit: true };
+  }
+  return nextResolve(specifier, context);
+}
+
+export async function load(url, context, nextLoad) {
+  if (!/\.tsx?$/.test(url)) return nextLoad(url, context);
+  const source = await readFile(fileURLToPath(url), "utf8");
+  const { outputText } = ts.transpileModule(source, {
+    fileName: fileURLToPath(url),
+    compilerOptions: {
+      module: ts.ModuleKind.ESNext,
+      target: ts.ScriptTarget.ES2022,
+      jsx: ts.JsxEmit.ReactJSX,
+      verbatimModuleSyntax: false,
+    },
+  });
+  return { format: "module", source: outputText, shortCircuit: true };
+}
@@ -0,0 +1,155 @@
+#!/usr/bin/env node
+// JavaScript size budget for the app routes. Runs after `next build`
+// (npm's postbuild hook) and reports routes whose initial JS has grown
+// past their budget.
+//
+//   npm run build                      build, then check
+//   npm run bundle:check               check an existing build
+//   npm run bundle:check -- --strict   exit with 1 when over budget
+//
+// The budgets below are provisional until a baseline has been measured
+// from a production build, so by default going over only warns. Pass
+// --strict (or set BUNDLE_BUDGET_STRICT=1, e.g. in CI) to make it fatal
+// once the numbers are set from real measurements.
+//
+// "Initial JS" is what a route loads before any dynamic import: the
+// shared runtime chunks plus the chunks of the route's layouts and page,
+// measured gzipped. Code behind next/dynamic or React.lazy is not
+// counted, which is the point: heavy islands should stay out of it.
+
+import { readFile } from "node:fs/promises";
+import path from "node:path";
+import { fileURLToPath } from "node:url";
+import { gzipSync } from "node:zlib";
+
+const ROOT = path.resolve(
+  path.dirname(fileURLToPath(import.meta.url)),
+  "../.."
+);
+const NEXT_DIR = path.join(ROOT, ".next");
+
+// Gzipped KB of initial JS per route; routes not listed get the default.
+// Provisional: replace with measured sizes plus headroom. After that,
+// raise a budget deliberately, in the same change that needs it.
+const ROUTE_BUDGETS_KB = {
+  "/": 170,
+};
+const DEFAULT_BUDGET_KB = 200;
+
+const STRICT =
+  process.argv.includes("--strict") ||
+  process.env.BUNDLE_BUDGET_STRICT === "1";
+
+async function readJson(file) {
+  try {
+    return JSON.parse(await readFile(file, "utf8"));
+  } catch {
+    throw new Error(
+      `${path.relative(ROOT, file)} not found; run \`next build\` first.`
+    );
+  }
+}
+
+/** "/blog/[slug]/page" -> "/blog/[slug]", route groups dropped */
+function routeName(entry) {
+  const segments = entry
+    .split("/")
+    .slice(1, -1)
+    .filter((segment) => !/^\(.*\)$/.test(segment));
+  return "/" + segments.join("/");
+}
+
+/** Layout entries wrapping a page entry, outermost first */
+function layoutEntries(entry) {
+  const segments = entry.split("/").slice(1, -1);
+  const layouts = ["/layout"];
+  for (let i = 1; i <= segments.length; i++) {
+    layouts.push(`/${segments.slice(0, i).join("/")}/layout`);
+  }
+  return layouts;
+}
+
+const sizes = new Map();
+async function fileSize(file) {
+  if (!sizes.has(file)) {
+    const contents = await readFile(path.join(NEXT_DIR, file));
+    sizes.set(file, {
+      raw: contents.length,
+      gzip: gzipSync(contents, { level: 9 }).length,
+    });
+  }
+  return sizes.get(file);
+}
+
+const kb = (bytes) => bytes / 1024;
+
+async function main() {
+  const buildManifest = await readJson(
+    path.join(NEXT_DIR, "build-manifest.json")
+  );
+  const appManifest = await readJson(
+    path.join(NEXT_DIR, "app-build-manifest.json")
+  );
+  const shared = buildManifest.rootMainFiles ?? [];
+
+  const rows = [];
+  const failures = [];
+  const pages = Object.keys(appManifest.pages)
+    .filter((entry) => entry.endsWith("/page"))
+    .sort();
+
+  for (const entry of pages) {
+    const files = new Set(shared);
+    for (const layout of layoutEntries(entry)) {
+      appManifest.pages[layout]?.forEach((file) => files.add(file));
+    }
+    appManifest.pages[entry].forEach((file) => files.add(file));
+
+    let raw = 0;
+    let gzip = 0;
+    const chunks = [];
+    for (const file of files) {
+      if (!file.endsWith(".js")) continue;
+      const size = await fileSize(file);
+      raw += size.raw;
+      gzip += size.gzip;
+      chunks.push({ file, ...size });
+    }
+
+    const route = routeName(entry);
+    const budget = ROUTE_BUDGETS_KB[route] ?? DEFAULT_BUDGET_KB;
+    const over = kb(gzip) > budget;
+    rows.push({
+      route,
+      chunks: chunks.length,
+      "raw KB": kb(raw).toFixed(1),
+      "gzip KB": kb(gzip).toFixed(1),
+      "budget KB": budget,
+      status: over ? "OVER" : "ok",
+    });
+    if (over) {
+      const largest = chunks
+        .sort((a, b) => b.gzip - a.gzip)
+        .slice(0, 5)
+        .map((chunk) => `    ${kb(chunk.gzip).toFixed(1)} KB  ${chunk.file}`);
+      failures.push(
+        `${route}: ${kb(gzip).toFixed(1)} KB gzipped, budget ${budget} KB. ` +
+          `Largest chunks:\n${largest.join("\n")}`
+      );
+    }
+  }
+
+  console.table(rows);
+  if (failures.length > 0) {
+    const report = STRICT ? console.error : console.warn;
+    report("\nJS budget exceeded:");
+    failures.forEach((failure) => report(`  ${failure}`));
+    if (STRICT) process.exitCode = 1;
+    else report("\n(warning only; pass --strict to fail)");
+  }
+}
+
+main().catch((error) => {
+  console.error(error.message ?? error);
+  process.exit(1);
+});
@@ -0,0 +1,358 @@
+#!/usr/bin/env node
+// Offline media pipeline: generates optimized derivatives of the images
+// and videos in public/ and writes src/lib/media/media-manifest.json.
+//
+//   npm run media            build what changed since the last run
+//   npm run media -- --force rebuild everything
+//
+// Images (sharp): WebP and AVIF at a few widths plus a base64 blur
+// placeholder. Videos (ffmpeg/ffprobe on PATH): a first-frame poster with
+// the same image derivatives, and H.264 renditions on a resolution and
+// bitrate ladder. Without ffmpeg, videos are skipped with a warning.
+//
+// Outputs go to public/media/ and are named after the source's content
+// hash, so an unchanged file is never re-encoded and a changed one gets
+// fresh, cache-safe URLs. Assets referenced by src/content/
+// case-studies.json must exist; missing ones are reported.
+
+import { execFile } from "node:child_process";
+import { createHash } from "node:crypto";
+import { createReadStream, existsSync } from "node:fs";
+import {
+  mkdir,
+  readFile,
+  readdir,
+  rm,
+  stat,
+  writeFile,
+} from "node:fs/promises";
+import path from "node:path";
+import { fileURLToPath } from "node:url";
+import { promisify } from "node:util";
+
+const run = promisify(execFile);
+
+const ROOT = path.resolve(
+  path.dirname(fileURLToPath(import.meta.url)),
+  "../.."
+);
+const PUBLIC_DIR = path.join(ROOT, "public");
+const OUTPUT_DIR = path.join(PUBLIC_DIR, "media");
+const MANIFEST_PATH = path.join(ROOT, "src/lib/media/media-manifest.json");
+const CASE_STUDIES_PATH = path.join(ROOT, "src/content/case-studies.json");
+const CACHE_PATH = path.join(ROOT, "node_modules/.cache/media-pipeline.json");
+
+const IMAGE_EXTENSIONS = new Set([".png", ".jpg", ".jpeg"]);
+const VIDEO_EXTENSIONS = new Set([".mp4", ".mov", ".webm"]);
+
+const IMAGE_WIDTHS = [320, 640, 1280, 1920];
+const IMAGE_FORMATS = [
+  { format: "avif", options: { quality: 50, effort: 4 } },
+  { format: "webp", options: { quality: 75 } },
+];
+const BLUR_WIDTH = 16;
+
+// Heights with target bitrates (kbit/s); only rungs at or below the
+// source height are encoded. All site videos play muted, so audio is
+// dropped.
+const VIDEO_LADDER = [
+  { height: 360, bitrate: 800 },
+  { height: 720, bitrate: 2500 },
+  { height: 1080, bitrate: 5000 },
+];
+
+const force = process.argv.includes("--force");
+
+async function loadSharp() {
+  try {
+    return (await import("sharp")).default;
+  } catch {
+    throw new Error(
+      "sharp is required for image processing; run `npm install` to get " +
+        "the version pinned in devDependencies."
+    );
+  }
+}
+
+async function hasFfmpeg() {
+  try {
+    await run("ffmpeg", ["-version"]);
+    await run("ffprobe", ["-version"]);
+    return true;
+  } catch {
+    return false;
+  }
+}
+
+async function readJson(file, fallback) {
+  try {
+    return JSON.parse(await readFile(file, "utf8"));
+  } catch {
+    return fallback;
+  }
+}
+
+async function walk(dir) {
+  const files = [];
+  for (const entry of await readdir(dir, { withFileTypes: true })) {
+    const full = path.join(dir, entry.name);
+    if (entry.isDirectory()) {
+      if (full !== OUTPUT_DIR) files.push(...(await walk(full)));
+    } else {
+      files.push(full);
+    }
+  }
+  return files;
+}
+
+function hashFile(file) {
+  return new Promise((resolve, reject) => {
+    const hash = createHash("sha256");
+    createReadStream(file)
+      .on("data", (chunk) => hash.update(chunk))
+      .on("error", reject)
+      .on("end", () => resolve(hash.digest("hex").slice(0, 12)));
+  });
+}
+
+/** "/case-image-1.png" style key for a file under public/ */
+const publicUrl = (file) =>
+  "/" + path.relative(PUBLIC_DIR, file).split(path.sep).join("/");
+
+/** Output file name: <source name>-<hash>-<suffix> */
+function outputName(file, hash, suffix) {
+  const base = path
+    .basename(file, path.extname(file))
+    .toLowerCase()
+    .replace(/[^a-z0-9]+/g, "-")
+    .replace(/^-|-$/g, "");
+  return `${base}-${hash}-${suffix}`;
+}
+
+const outputUrl = (name) => `/media/${name}`;
+const outputPath = (name) => path.join(OUTPUT_DIR, name);
+
+// Every generated file an asset entry points at, to validate cache hits
+function assetFiles(asset) {
+  const files = [];
+  const image = (entry) => entry?.variants.forEach((v) => files.push(v.src));
+  if ("renditions" in asset) {
+    image(asset.poster);
+    asset.renditions.forEach((r) => files.push(r.src));
+  } else {
+    image(asset);
+  }
+  return files.map((src) => path.join(PUBLIC_DIR, src));
+}
+
+async function buildImage(sharp, input, label, hash) {
+  const source = sharp(input, { failOn: "none" }).rotate();
+  const { width, height } = await source.metadata();
+  if (!width || !height) throw new Error(`${label}: unreadable image`);
+
+  const widths = IMAGE_WIDTHS.filter((w) => w < width);
+  widths.push(Math.min(width, IMAGE_WIDTHS.at(-1)));
+
+  const variants = [];
+  for (const { format, options } of IMAGE_FORMATS) {
+    for (const w of widths) {
+      const h = Math.round((height * w) / width);
+      const name = outputName(label, hash, `${w}.${format}`);
+      if (force || !existsSync(outputPath(name))) {
+        const resized = source.clone().resize(w);
+        await resized[format](options).toFile(outputPath(name));
+      }
+      variants.push({ src: outputUrl(name), width: w, height: h, format });
+    }
+  }
+
+  const blur = await source
+    .clone()
+    .resize(BLUR_WIDTH)
+    .webp({ quality: 40 })
+    .toBuffer();
+
+  return {
+    width,
+    height,
+    blurDataURL: `data:image/webp;base64,${blur.toString("base64")}`,
+    variants,
+  };
+}
+
+async function probeVideo(file) {
+  const { stdout } = await run("ffprobe", [
+    "-v",
+    "error",
+    "-select_streams",
+    "v:0",
+    "-show_entries",
+    "stream=width,height",
+    "-of",
+    "json",
+    file,
+  ]);
+  const [stream] = JSON.parse(stdout).streams ?? [];
+  if (!stream) throw new Error(`${publicUrl(file)}: no video stream`);
+  return { width: stream.width, height: stream.height };
+}
+
+async function buildVideo(sharp, file, hash) {
+  const { width, height } = await probeVideo(file);
+
+  const { stdout: frame } = await run(
+    "ffmpeg",
+    [
+      "-v", "error",
+      "-i", file,
+      "-frames:v", "1",
+      "-f", "image2pipe",
+      "-c:v", "png",
+      "-",
+    ],
+    { encoding: "buffer", maxBuffer: 64 * 1024 * 1024 }
+  );
+  const poster = await buildImage(sharp, frame, file, `${hash}-poster`);
+
+  const rungs = VIDEO_LADDER.filter((rung) => rung.height < height);
+  // Sources smaller than the top rung also get a rendition at their own
+  // size, with the bitrate of the rung they fall under
+  const top = VIDEO_LADDER.find((rung) => rung.height >= height);
+  if (top) rungs.push({ height, bitrate: top.bitrate });
+
+  const renditions = [];
+  for (const { height: h, bitrate } of rungs) {
+    // Even dimensions are required by H.264 4:2:0
+    const outHeight = h - (h % 2);
+    const outWidth = Math.round((width * outHeight) / height / 2) * 2;
+    const name = outputName(file, hash, `${outHeight}p.mp4`);
+    if (force || !existsSync(outputPath(name))) {
+      await run(
+        "ffmpeg",
+        [
+          "-v", "error", "-y",
+          "-i", file,
+          "-vf", `scale=${outWidth}:${outHeight}`,
+          "-c:v", "libx264",
+          "-profile:v", "high",
+          "-pix_fmt", "yuv420p",
+          "-preset", "slow",
+          "-b:v", `${bitrate}k`,
+          "-maxrate", `${Math.round(bitrate * 1.5)}k`,
+          "-bufsize", `${bitrate * 2}k`,
+          "-movflags", "+faststart",
+          "-an",
+          outputPath(name),
+        ],
+        { maxBuffer: 16 * 1024 * 1024 }
+      );
+    }
+    renditions.push({
+      src: outputUrl(name),
+      width: outWidth,
+      height: outHeight,
+      bitrate,
+      type: 'video/mp4; codecs="avc1.640028"',
+    });
+  }
+
+  return { width, height, poster, renditions };
+}
+
+async function checkCaseStudies(sources) {
+  const caseStudies = await readJson(CASE_STUDIES_PATH, []);
+  const missing = new Set();
+  for (const study of caseStudies) {
+    for (const url of [study.videoUrl, study.thumbnailUrl]) {
+      if (url && !sources.has(decodeURI(url))) missing.add(url);
+    }
+  }
+  missing.forEach((url) =>
+    console.warn(`case-studies.json references missing file: public${url}`)
+  );
+}
+
+async function main() {
+  const sharp = await loadSharp();
+  const ffmpeg = await hasFfmpeg();
+  if (!ffmpeg) {
+    console.warn("ffmpeg/ffprobe not found on PATH; skipping videos.");
+  }
+
+  await mkdir(OUTPUT_DIR, { recursive: true });
+  const previous = await readJson(MANIFEST_PATH, { images: {}, videos: {} });
+  // path -> { size, mtimeMs, hash } so unchanged files aren't re-hashed
+  const cache = force ? {} : await readJson(CACHE_PATH, {});
+  const manifest = { version: 1, images: {}, videos: {} };
+
+  const files = (await walk(PUBLIC_DIR)).sort();
+  const sources = new Set(files.map(publicUrl));
+  await checkCaseStudies(sources);
+
+  let built = 0;
+  let reused = 0;
+  for (const file of files) {
+    const ext = path.extname(file).toLowerCase();
+    const isImage = IMAGE_EXTENSIONS.has(ext);
+    const isVideo = VIDEO_EXTENSIONS.has(ext);
+    if (!isImage && !isVideo) continue;
+
+    const key = publicUrl(file);
+    const group = isImage ? "images" : "videos";
+    const { size, mtimeMs } = await stat(file);
+    const cached = cache[key];
+    const hash =
+      cached && cached.size === size && cached.mtimeMs === mtimeMs
+        ? cached.hash
+        : await hashFile(file);
+    cache[key] = { size, mtimeMs, hash };
+
+    // Output names embed the content hash, so an entry whose files all
+    // exist under the current hash is up to date
+    const prior = previous[group]?.[key];
+    const upToDate =
+      !force &&
+      prior &&
+      assetFiles(prior).every(
+        (output) =>
+          path.basename(output).includes(`-${hash}-`) && existsSync(output)
+      );
+    if (upToDate) {
+      manifest[group][key] = prior;
+      reused++;
+      continue;
+    }
+
+    if (isVideo && !ffmpeg) {
+      // Keep whatever a machine with ffmpeg produced earlier
+      if (prior) manifest.videos[key] = prior;
+      continue;
+    }
+
+    console.log(`processing ${key}`);
+    manifest[group][key] = isImage
+      ? await buildImage(sharp, file, file, hash)
+      : await buildVideo(sharp, file, hash);
+    built++;
+  }
+
+  // Remove derivatives no manifest entry points at any more
+  const live = new Set(
+    [...Object.values(manifest.images), ...Object.values(manifest.videos)]
+      .flatMap(assetFiles)
+      .map((file) => path.basename(file))
+  );
+  for (const name of await readdir(OUTPUT_DIR)) {
+    if (!live.has(name)) await rm(outputPath(name));
+  }
+
+  await writeFile(MANIFEST_PATH, JSON.stringify(manifest, null, 2) + "\n");
+  await mkdir(path.dirname(CACHE_PATH), { recursive: true });
+  await writeFile(CACHE_PATH, JSON.stringify(cache));
+  console.log(`media: ${built} built, ${reused} unchanged`);
+}
+
+main().catch((error) => {
+  console.error(error.message ?? error);
+  process.exit(1);
+});
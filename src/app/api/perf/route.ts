@@ -0,0 +1,41 @@
+import { appendFile, mkdir } from "node:fs/promises";
+import path from "node:path";
+
+// Collects reports from the runtime perf monitor (src/lib/perf) as one
+// JSON object per line. Meant for local and staging runs: production
+// builds only accept reports when PERF_LOG_FILE is set explicitly.
+
+export const runtime = "nodejs";
+
+const LOG_FILE = process.env.PERF_LOG_FILE ?? ".perf/metrics.ndjson";
+const MAX_BODY_BYTES = 16 * 1024;
+
+export async function POST(request: Request) {
+  if (process.env.NODE_ENV === "production" && !process.env.PERF_LOG_FILE) {
+    return new Response(null, { status: 404 });
+  }
+
+  const text = await request.text();
+  if (text.length > MAX_BODY_BYTES) {
+    return new Response(null, { status: 413 });
+  }
+  let report: unknown;
+  try {
+    report = JSON.parse(text);
+  } catch {
+    return new Response(null, { status: 400 });
+  }
+  if (typeof report !== "object" || report === null || Array.isArray(report)) {
+    return new Response(null, { status: 400 });
+  }
+
+  const line = JSON.stringify({
+    ...report,
+    receivedAt: new Date().toISOString(),
+    userAgent: request.headers.get("user-agent"),
+  });
+  const file = path.resolve(process.cwd(), LOG_FILE);
+  await mkdir(path.dirname(file), { recursive: true });
+  await appendFile(file, line + "\n");
+  return new Response(null, { status: 204 });
+}
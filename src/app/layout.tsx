@@ -2,6 +2,7 @@ import type { Metadata } from "next";
 import { JetBrains_Mono } from "next/font/google";
 import "./globals.css";
 import CursorFollower from "@/components/animations/CursorFollower";
+import PerfOverlay from "@/components/debug/PerfOverlay";
 
 const jetbrainsMono = JetBrains_Mono({
   variable: "--font-jetbrains-mono",
@@ -23,6 +24,7 @@ export default function RootLayout({
       <body className={`${jetbrainsMono.variable} antialiased bg-black`}>
         {/*  <CursorFollower /> */}
         {children}
+        <PerfOverlay />
       </body>
     </html>
   );
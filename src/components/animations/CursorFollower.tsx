@@ -2,6 +2,7 @@
 
 import { motion, Transition } from 'framer-motion';
 import { useMousePosition } from '@/lib/hooks/useMousePosition';
+import { inputBus } from '@/lib/scheduler/inputBus';
 import { useState, useEffect } from 'react';
 
 export interface CursorFollowerProps {
@@ -37,34 +38,22 @@ export default function CursorFollower({
     };
 
     checkTouch();
-    window.addEventListener('resize', checkTouch);
-    
-    return () => window.removeEventListener('resize', checkTouch);
+    return inputBus.onResize(checkTouch);
   }, []);
 
-  // Track mouse press state
+  // Track press state and hovered elements for adaptive sizing
   useEffect(() => {
     if (isTouchDevice) return;
 
-    const handleMouseDown = () => setIsPressed(true);
-    const handleMouseUp = () => setIsPressed(false);
+    let lastTarget: Element | null = null;
 
-    window.addEventListener('mousedown', handleMouseDown);
-    window.addEventListener('mouseup', handleMouseUp);
+    return inputBus.onPointer(({ pressed, target }) => {
+      setIsPressed(pressed);
 
-    return () => {
-      window.removeEventListener('mousedown', handleMouseDown);
-      window.removeEventListener('mouseup', handleMouseUp);
-    };
-  }, [isTouchDevice]);
+      // Only classify when the pointer moves onto a different element
+      if (!adaptiveSize || !target || target === lastTarget) return;
+      lastTarget = target;
 
-  // Track hovered elements for adaptive sizing
-  useEffect(() => {
-    if (isTouchDevice || !adaptiveSize) return;
-
-    const handleMouseOver = (e: MouseEvent) => {
-      const target = e.target as HTMLElement;
-      
       // Check if hovering over EmeraldDotsButton or its children
       const emeraldButton = target.closest('[data-emerald-dots-button]');
       
@@ -77,13 +66,7 @@ export default function CursorFollower({
       } else {
         setHoveredElement(null);
       }
-    };
-
-    document.addEventListener('mouseover', handleMouseOver);
-
-    return () => {
-      document.removeEventListener('mouseover', handleMouseOver);
-    };
+    });
   }, [isTouchDevice, adaptiveSize]);
 
   // Hide on touch devices if specified
@@ -0,0 +1,26 @@
+"use client";
+
+import { useEffect, useState } from "react";
+import dynamic from "next/dynamic";
+import { isPerfMonitorEnabled } from "@/lib/perf/perfFlag";
+
+// The panel brings in the monitor and the frame scheduler; fetched only
+// once the overlay has been enabled
+const PerfPanel = dynamic(() => import("./PerfPanel"), { ssr: false });
+
+/**
+ * Frame time and web vitals readout, opted into with `?perf` (for the
+ * rest of the session) or NEXT_PUBLIC_PERF_OVERLAY=1. Renders, loads and
+ * collects nothing otherwise.
+ */
+export default function PerfOverlay() {
+  const [enabled, setEnabled] = useState(false);
+
+  // Decided after mount: the query string and storage don't exist on the
+  // server, and the markup has to match for hydration
+  useEffect(() => {
+    setEnabled(isPerfMonitorEnabled());
+  }, []);
+
+  return enabled ? <PerfPanel /> : null;
+}
@@ -0,0 +1,32 @@
+"use client";
+
+import { usePerfMonitor } from "@/lib/hooks/usePerfMonitor";
+
+const ms = (value: number | null) =>
+  value === null ? "–" : `${value.toFixed(1)}ms`;
+
+/** Live metrics readout; loaded by PerfOverlay once monitoring is enabled */
+export default function PerfPanel() {
+  const perf = usePerfMonitor();
+
+  return (
+    <div className="fixed bottom-4 left-4 z-[10000] pointer-events-none bg-black/80 text-white p-2 rounded shadow-lg">
+      <div className="text-xs font-mono leading-5">
+        <div>
+          {perf.fps} fps · p50 {ms(perf.frameP50)} · p95 {ms(perf.frameP95)}
+        </div>
+        <div>
+          work p95 {ms(perf.workP95)} · slow {perf.slowFrames} · quality{" "}
+          {perf.qualityLevel}
+        </div>
+        <div>
+          long tasks {perf.longTasks} ({perf.longTaskMs}ms) · bg skipped{" "}
+          {perf.skippedBackground}
+        </div>
+        <div>
+          LCP {ms(perf.lcp)} · INP {ms(perf.inp)} · CLS {perf.cls.toFixed(3)}
+        </div>
+      </div>
+    </div>
+  );
+}
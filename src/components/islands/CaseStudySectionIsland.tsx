@@ -0,0 +1,31 @@
+"use client";
+
+import { useRef, type HTMLAttributes, type ReactElement } from "react";
+import dynamic from "next/dynamic";
+import { useDeferredMount } from "@/lib/hooks/useDeferredMount";
+
+const CaseStudyCarousel = dynamic(
+  () => import("@/components/sections/CaseStudyCarousel"),
+  { ssr: false }
+);
+
+/**
+ * Section wrapper around the server-rendered case studies. The carousel
+ * behaviour (embla, the navigation buttons, the pooled hover videos) is
+ * fetched when the section comes within a viewport of the screen and
+ * attached to the markup already on the page.
+ */
+export function CaseStudySectionIsland({
+  children,
+  ...props
+}: HTMLAttributes<HTMLElement>): ReactElement {
+  const sectionRef = useRef<HTMLElement>(null);
+  const ready = useDeferredMount("visible", sectionRef);
+
+  return (
+    <section ref={sectionRef} {...props}>
+      {children}
+      {ready && <CaseStudyCarousel rootRef={sectionRef} />}
+    </section>
+  );
+}
@@ -0,0 +1,30 @@
+"use client";
+
+import { useEffect, useState, type ReactElement } from "react";
+import dynamic from "next/dynamic";
+import { useDeferredMount } from "@/lib/hooks/useDeferredMount";
+import type {
+  CursorFollowerProps,
+} from "@/components/animations/CursorFollower";
+
+const CursorFollower = dynamic(
+  () => import("@/components/animations/CursorFollower"),
+  { ssr: false }
+);
+
+/**
+ * CursorFollower (and framer-motion with it), fetched once the page is
+ * idle and only on devices with a fine pointer.
+ */
+export function CursorFollowerIsland(
+  props: CursorFollowerProps
+): ReactElement | null {
+  const ready = useDeferredMount("idle");
+  const [finePointer, setFinePointer] = useState(false);
+
+  useEffect(() => {
+    setFinePointer(window.matchMedia("(pointer: fine)").matches);
+  }, []);
+
+  return ready && finePointer ? <CursorFollower {...props} /> : null;
+}
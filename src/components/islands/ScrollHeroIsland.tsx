@@ -0,0 +1,29 @@
+"use client";
+
+import type { ReactElement } from "react";
+import dynamic from "next/dynamic";
+import { useDeferredMount } from "@/lib/hooks/useDeferredMount";
+import { useScrollExpandInput } from "@/lib/hooks/useScrollExpandInput";
+import type {
+  ScrollHeroControllerProps,
+} from "@/components/organisms/ScrollHeroController";
+
+const ScrollHeroController = dynamic(
+  () => import("@/components/organisms/ScrollHeroController"),
+  { ssr: false }
+);
+
+/**
+ * Scroll expansion for the server-rendered ScrollHero. The wheel/touch
+ * handling and the scroll pin are bound as soon as this hydrates, so the
+ * first gesture never scrolls the page; the geometry that draws the
+ * expansion is fetched once the page is idle or the user first scrolls
+ * or touches it.
+ */
+export function ScrollHeroIsland(
+  props: Omit<ScrollHeroControllerProps, "input">
+): ReactElement | null {
+  const input = useScrollExpandInput();
+  const ready = useDeferredMount("idle");
+  return ready ? <ScrollHeroController {...props} input={input} /> : null;
+}
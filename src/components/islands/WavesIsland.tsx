@@ -0,0 +1,42 @@
+"use client";
+
+import { useMemo, type ComponentProps, type ReactElement } from "react";
+import dynamic from "next/dynamic";
+import { useDeferredMount } from "@/lib/hooks/useDeferredMount";
+import type WavesComponent from "@/components/organisms/Waves";
+
+const Waves = dynamic(() => import("@/components/organisms/Waves"), {
+  ssr: false,
+});
+
+type WavesIslandProps = Omit<
+  ComponentProps<typeof WavesComponent>,
+  "visibilityRef"
+> & {
+  /** Id of the element whose visibility keeps the animation running */
+  visibilityTargetId?: string;
+};
+
+/**
+ * Waves background, fetched and started once the page is idle. A server
+ * component can't hand over a ref, so the element that gates the
+ * animation is passed by id.
+ */
+export function WavesIsland({
+  visibilityTargetId,
+  ...props
+}: WavesIslandProps): ReactElement | null {
+  const ready = useDeferredMount("idle");
+  // Only resolved once mounted on the client, when the element exists
+  const visibilityRef = useMemo(
+    () => ({
+      current:
+        ready && visibilityTargetId
+          ? document.getElementById(visibilityTargetId)
+          : null,
+    }),
+    [ready, visibilityTargetId]
+  );
+
+  return ready ? <Waves {...props} visibilityRef={visibilityRef} /> : null;
+}
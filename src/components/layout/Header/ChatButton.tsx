@@ -1,7 +1,6 @@
 "use client";
 
 import React, { useState } from "react";
-import { motion, AnimatePresence } from "framer-motion";
 
 interface ChatButtonProps {
   className?: string;
@@ -17,17 +16,15 @@ export function ChatButton({
   return (
     <div className={`relative ${className}`}>
       {/* Tooltip */}
-      <AnimatePresence>
-        {showTooltip && (
-          <motion.div className="absolute bottom-full right-0 mb-2 px-3 py-2 text-sm text-white bg-gray-900 rounded-lg shadow-lg whitespace-nowrap z-50">
-            Start chat
-            <div className="absolute top-full right-4 w-0 h-0 border-l-4 border-r-4 border-t-4 border-l-transparent border-r-transparent border-t-gray-900" />
-          </motion.div>
-        )}
-      </AnimatePresence>
+      {showTooltip && (
+        <div className="absolute bottom-full right-0 mb-2 px-3 py-2 text-sm text-white bg-gray-900 rounded-lg shadow-lg whitespace-nowrap z-50">
+          Start chat
+          <div className="absolute top-full right-4 w-0 h-0 border-l-4 border-r-4 border-t-4 border-l-transparent border-r-transparent border-t-gray-900" />
+        </div>
+      )}
 
       {/* Chat Button */}
-      <motion.button
+      <button
         onClick={onClick}
         onMouseEnter={() => setShowTooltip(true)}
         onMouseLeave={() => setShowTooltip(false)}
@@ -61,32 +58,18 @@ export function ChatButton({
         </div>
 
         {/* Notification dot with pulse animation - positioned per Figma design */}
-        <motion.div
-          className="absolute w-[11.14px] h-[11.14px] rounded-full"
+        <div
+          className="absolute w-[11.14px] h-[11.14px] rounded-full animate-chat-pulse"
           style={{
             left: "36.21px",
             top: "0.93px",
             background: "var(--Color-Emerald-500, #13BC7F)",
           }}
-          animate={{
-            scale: [1, 1.2, 1],
-            opacity: [1, 0.8, 1],
-          }}
-          transition={{
-            duration: 2,
-            repeat: Infinity,
-            ease: "easeInOut",
-          }}
         />
 
         {/* Ripple effect on click */}
-        <motion.div
-          className="absolute inset-0 rounded-full border-2 border-white/20"
-          initial={{ scale: 0, opacity: 0.5 }}
-          animate={{ scale: [0, 1.5], opacity: [0.5, 0] }}
-          transition={{ duration: 0.6, repeat: Infinity, repeatDelay: 1.5 }}
-        />
-      </motion.button>
+        <div className="absolute inset-0 rounded-full border-2 border-white/20 animate-chat-ripple" />
+      </button>
     </div>
   );
 }
@@ -1,8 +1,5 @@
-"use client";
-
 import React from "react";
 import Link from "next/link";
-import { motion } from "framer-motion";
 
 interface LogoProps {
   className?: string;
@@ -11,7 +8,7 @@ interface LogoProps {
 export function Logo({ className = "" }: LogoProps): React.ReactElement {
   return (
     <Link href="/" className={`flex items-center flex-shrink-0 ${className}`}>
-      <motion.div className="flex items-center">
+      <div className="flex items-center">
         {/* AV Center Logo SVG */}
         <svg
           width="129"
@@ -68,7 +65,7 @@ export function Logo({ className = "" }: LogoProps): React.ReactElement {
 
         {/* Accessible text for screen readers */}
         <span className="sr-only">AV CENTER</span>
-      </motion.div>
+      </div>
     </Link>
   );
 }
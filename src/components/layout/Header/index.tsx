@@ -1,42 +1,13 @@
 "use client";
 
 import React, { useState } from "react";
-import { motion, type Variants } from "framer-motion";
 import { Home, Briefcase, User, FileText } from "lucide-react";
 import { Logo } from "./Logo";
 import { ChatButton } from "./ChatButton";
 import { NavBar } from "@/components/molecules/NavBar";
-import { useScrollPosition } from "@/lib/hooks/useScrollPosition";
 
 export function Header(): React.ReactElement {
   const [isChatOpen, setIsChatOpen] = useState(false);
-  const { isScrolled, isVisible } = useScrollPosition({
-    threshold: 10,
-    hideOnScrollDown: false, // Keep header always visible for better UX
-  });
-
-  const headerVariants: Variants = {
-    visible: {
-      y: 0,
-      opacity: 1,
-    },
-    hidden: {
-      y: -100,
-      opacity: 0,
-    },
-  };
-
-  const backgroundVariants: Variants = {
-    transparent: {
-      backgroundColor: "rgba(0, 0, 0, 0.8)",
-      boxShadow: "none",
-    },
-    solid: {
-      backgroundColor: "rgba(0, 0, 0, 0.95)",
-      boxShadow:
-        "0 4px 6px -1px rgba(0, 0, 0, 0.1), 0 2px 4px -1px rgba(0, 0, 0, 0.06)",
-    },
-  };
 
   const navItems = [
     { name: "Salg", url: "#services", icon: Home },
@@ -52,19 +23,8 @@ export function Header(): React.ReactElement {
   };
 
   return (
-    <motion.header
-      variants={headerVariants}
-      initial="visible"
-      animate={isVisible ? "visible" : "hidden"}
-      transition={{ duration: 0.3, ease: "easeInOut" }}
-      className="fixed top-0 left-0 right-0 z-30 w-full"
-    >
-      <motion.div
-        initial="transparent"
-        animate={isScrolled ? "solid" : "transparent"}
-        transition={{ duration: 0.3, ease: "easeInOut" }}
-        className="px-6 md:px-10 lg:px-16"
-      >
+    <header className="fixed top-0 left-0 right-0 z-30 w-full opacity-100">
+      <div className="px-6 md:px-10 lg:px-16">
         <nav className="flex justify-between mx-auto mt-8 px-6 md:px-8 min-[1220px]:px-12">
           {/* Logo Section */}
           <Logo />
@@ -84,8 +44,8 @@ export function Header(): React.ReactElement {
             <ChatButton onClick={handleChatClick} />
           </div>
         </nav>
-      </motion.div>
-    </motion.header>
+      </div>
+    </header>
   );
 }
 
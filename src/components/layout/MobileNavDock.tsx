@@ -0,0 +1,38 @@
+"use client";
+
+import React from "react";
+import { Briefcase, FileText, Home, User } from "lucide-react";
+import { NavBar } from "@/components/molecules/NavBar";
+import { cn } from "@/lib/utils/cn";
+import { useIsScrolled } from "@/lib/hooks/useScrollSelector";
+
+const navItems = [
+  { name: "Salg", url: "#services", icon: Home },
+  { name: "Udlejning", url: "#rental", icon: Briefcase },
+  { name: "Om Os", url: "#about", icon: User },
+  { name: "Lokationer", url: "#locations", icon: FileText },
+  { name: "Kontakt", url: "#contact", icon: FileText },
+];
+
+/**
+ * Mobile-only NavBar. Starts fixed at the bottom of the screen and sticks
+ * below the header once the page scrolls.
+ */
+export function MobileNavDock(): React.ReactElement {
+  const isScrolled = useIsScrolled(10);
+
+  return (
+    <div className="md:hidden sticky top-[72px] z-40 flex justify-center pointer-events-none">
+      <div
+        className={cn(
+          isScrolled ? "relative" : "fixed bottom-4 left-1/2 -translate-x-1/2",
+          "pointer-events-auto"
+        )}
+      >
+        <NavBar items={navItems} />
+      </div>
+    </div>
+  );
+}
+
+export default MobileNavDock;
@@ -1,7 +1,4 @@
-"use client";
-
-import React, { useState } from "react";
-import { motion } from "framer-motion";
+import React from "react";
 import { cn } from "@/lib/utils/cn";
 
 export interface LinkListItem {
@@ -24,8 +21,7 @@ export function LinkList({
     { id: "5", title: "Support" },
   ],
 }: LinkListProps): React.ReactElement {
-  const [hoveredItem, setHoveredItem] = useState<string | null>(null);
-
+  // Server component: the hover animation on the dots is plain CSS
   return (
     <div className={cn("w-full", className)}>
       <div className="grid grid-cols-1 lg:grid-cols-[1fr_1fr] gap-8 lg:gap-12">
@@ -56,11 +52,7 @@ export function LinkList({
 
           {linkItems.map((item) => (
             <React.Fragment key={item.id}>
-              <div
-                className="self-stretch relative flex justify-between items-end align-center cursor-pointer py-4"
-                onMouseEnter={() => setHoveredItem(item.id)}
-                onMouseLeave={() => setHoveredItem(null)}
-              >
+              <div className="group self-stretch relative flex justify-between items-end align-center cursor-pointer py-4">
                 <div className="text-white text-base font-mono font-normal">
                   {item.title}
                 </div>
@@ -89,24 +81,21 @@ export function LinkList({
                     const animationGroup = getAnimationGroup(i);
                     const pos = positions[i];
 
+                    // Groups light up left to right on hover and fade
+                    // out right to left
+                    const delays = {
+                      "--dot-delay-in": `${animationGroup * 80}ms`,
+                      "--dot-delay-out": `${(3 - animationGroup) * 80}ms`,
+                    } as React.CSSProperties;
+
                     return (
-                      <motion.div
+                      <div
                         key={i}
-                        className="w-[2.4px] h-[2.4px] absolute bg-emerald-500 rounded-full"
+                        className="w-[2.4px] h-[2.4px] absolute bg-emerald-500 rounded-full opacity-30 transition-[opacity,scale] duration-150 [transition-delay:var(--dot-delay-out)] group-hover:opacity-80 group-hover:scale-120 group-hover:[transition-delay:var(--dot-delay-in)]"
                         style={{
                           left: `${(pos.x / 380) * 100}%`,
                           top: `${pos.y}px`,
-                        }}
-                        animate={{
-                          opacity: hoveredItem === item.id ? 0.8 : 0.3,
-                          scale: hoveredItem === item.id ? 1.2 : 1,
-                        }}
-                        transition={{
-                          duration: 0.15,
-                          delay:
-                            hoveredItem === item.id
-                              ? animationGroup * 0.08
-                              : (3 - animationGroup) * 0.08,
+                          ...delays,
                         }}
                       />
                     );
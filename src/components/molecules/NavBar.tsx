@@ -1,11 +1,40 @@
-"use client";
-
 import React from "react";
 
-const imgVector =
-  "http://localhost:3845/assets/86fa93c8f8ec0bde2eae7635e0b56ab772cc32b6.svg";
-const img =
-  "http://localhost:3845/assets/5106cbe612ebc3b785ff65d31c27923f3388cc20.svg";
+// Icons are inline SVG so they ship with the HTML; the Figma export
+// pointed at assets on the local Figma dev server.
+
+// Top-left corners of the 2.4px dots in each 24px icon, from Figma
+// prettier-ignore
+const SEARCH_DOTS = [
+  [8.4, 2.4], [4.8, 3.6], [12, 3.6], [14.4, 7.2], [2.4, 10.8], [4.8, 14.4],
+  [8.4, 15.6], [14.4, 10.8], [12, 14.4], [2.4, 7.2], [15.6, 15.6], [18, 18],
+];
+const MENU_DOTS = [3.6, 7.2, 10.8, 14.4, 18].flatMap((x) =>
+  [4.8, 10.8, 16.8].map((y) => [x, y])
+);
+const DOT_SIZE = 2.4;
+
+function DotsIcon({ dots, id }: { dots: number[][]; id: string }) {
+  return (
+    <svg
+      viewBox="0 0 24 24"
+      fill="currentColor"
+      aria-hidden
+      className="relative shrink-0 size-6 text-white"
+      data-name="Icon"
+      id={id}
+    >
+      {dots.map(([x, y]) => (
+        <circle
+          key={`${x}-${y}`}
+          cx={x + DOT_SIZE / 2}
+          cy={y + DOT_SIZE / 2}
+          r={DOT_SIZE / 2}
+        />
+      ))}
+    </svg>
+  );
+}
 
 interface IconChevronProps {
   orientation?: "down" | "up";
@@ -24,7 +53,20 @@ function IconChevron({ orientation = "up" }: IconChevronProps) {
           data-name="Vector"
           data-node-id="393:1770"
         >
-          <img alt="" className="block max-w-none size-full" src={imgVector} />
+          <svg
+            viewBox="0 0 14 8"
+            fill="none"
+            aria-hidden
+            className="block size-full"
+          >
+            <path
+              d="M1 1l6 6 6-6"
+              stroke="white"
+              strokeWidth="1.5"
+              strokeLinecap="round"
+              strokeLinejoin="round"
+            />
+          </svg>
         </div>
       </div>
     );
@@ -128,84 +170,7 @@ export function NavBar({ items, inline, className }: NavBarProps) {
             data-name="Item"
             id="node-I434_2598-434_2183"
           >
-            <div
-              className="relative shrink-0 size-6"
-              data-name="Icon"
-              id="node-I434_2598-434_2184"
-            >
-              <div
-                className="absolute left-[8.4px] size-[2.4px] top-[2.4px]"
-                id="node-I434_2598-434_2184-91_981"
-              >
-                <img alt="" className="block max-w-none size-full" src={img} />
-              </div>
-              <div
-                className="absolute left-[4.8px] size-[2.4px] top-[3.6px]"
-                id="node-I434_2598-434_2184-91_982"
-              >
-                <img alt="" className="block max-w-none size-full" src={img} />
-              </div>
-              <div
-                className="absolute left-3 size-[2.4px] top-[3.6px]"
-                id="node-I434_2598-434_2184-91_983"
-              >
-                <img alt="" className="block max-w-none size-full" src={img} />
-              </div>
-              <div
-                className="absolute left-[14.4px] size-[2.4px] top-[7.2px]"
-                id="node-I434_2598-434_2184-91_984"
-              >
-                <img alt="" className="block max-w-none size-full" src={img} />
-              </div>
-              <div
-                className="absolute left-[2.4px] size-[2.4px] top-[10.8px]"
-                id="node-I434_2598-434_2184-91_985"
-              >
-                <img alt="" className="block max-w-none size-full" src={img} />
-              </div>
-              <div
-                className="absolute left-[4.8px] size-[2.4px] top-[14.4px]"
-                id="node-I434_2598-434_2184-91_986"
-              >
-                <img alt="" className="block max-w-none size-full" src={img} />
-              </div>
-              <div
-                className="absolute left-[8.4px] size-[2.4px] top-[15.6px]"
-                id="node-I434_2598-434_2184-91_987"
-              >
-                <img alt="" className="block max-w-none size-full" src={img} />
-              </div>
-              <div
-                className="absolute left-[14.4px] size-[2.4px] top-[10.8px]"
-                id="node-I434_2598-434_2184-91_988"
-              >
-                <img alt="" className="block max-w-none size-full" src={img} />
-              </div>
-              <div
-                className="absolute left-3 size-[2.4px] top-[14.4px]"
-                id="node-I434_2598-434_2184-91_989"
-              >
-                <img alt="" className="block max-w-none size-full" src={img} />
-              </div>
-              <div
-                className="absolute left-[2.4px] size-[2.4px] top-[7.2px]"
-                id="node-I434_2598-434_2184-91_990"
-              >
-                <img alt="" className="block max-w-none size-full" src={img} />
-              </div>
-              <div
-                className="absolute left-[15.6px] size-[2.4px] top-[15.6px]"
-                id="node-I434_2598-434_2184-91_991"
-              >
-                <img alt="" className="block max-w-none size-full" src={img} />
-              </div>
-              <div
-                className="absolute left-[18px] size-[2.4px] top-[18px]"
-                id="node-I434_2598-434_2184-91_992"
-              >
-                <img alt="" className="block max-w-none size-full" src={img} />
-              </div>
-            </div>
+            <DotsIcon dots={SEARCH_DOTS} id="node-I434_2598-434_2184" />
           </div>
 
           <div
@@ -213,102 +178,7 @@ export function NavBar({ items, inline, className }: NavBarProps) {
             data-name="Item"
             id="node-I434_2598-434_2185"
           >
-            <div
-              className="relative shrink-0 size-6"
-              data-name="Icon"
-              id="node-I434_2598-434_2186"
-            >
-              <div
-                className="absolute left-[10.8px] size-[2.4px] top-[10.8px]"
-                id="node-I434_2598-434_2186-91_2206"
-              >
-                <img alt="" className="block max-w-none size-full" src={img} />
-              </div>
-              <div
-                className="absolute left-[10.8px] size-[2.4px] top-[4.8px]"
-                id="node-I434_2598-434_2186-91_2216"
-              >
-                <img alt="" className="block max-w-none size-full" src={img} />
-              </div>
-              <div
-                className="absolute left-[10.8px] size-[2.4px] top-[16.8px]"
-                id="node-I434_2598-434_2186-91_2221"
-              >
-                <img alt="" className="block max-w-none size-full" src={img} />
-              </div>
-              <div
-                className="absolute left-[14.4px] size-[2.4px] top-[10.8px]"
-                id="node-I434_2598-434_2186-91_2207"
-              >
-                <img alt="" className="block max-w-none size-full" src={img} />
-              </div>
-              <div
-                className="absolute left-[14.4px] size-[2.4px] top-[4.8px]"
-                id="node-I434_2598-434_2186-91_2217"
-              >
-                <img alt="" className="block max-w-none size-full" src={img} />
-              </div>
-              <div
-                className="absolute left-[14.4px] size-[2.4px] top-[16.8px]"
-                id="node-I434_2598-434_2186-91_2222"
-              >
-                <img alt="" className="block max-w-none size-full" src={img} />
-              </div>
-              <div
-                className="absolute left-[18px] size-[2.4px] top-[10.8px]"
-                id="node-I434_2598-434_2186-91_2215"
-              >
-                <img alt="" className="block max-w-none size-full" src={img} />
-              </div>
-              <div
-                className="absolute left-[18px] size-[2.4px] top-[4.8px]"
-                id="node-I434_2598-434_2186-91_2218"
-              >
-                <img alt="" className="block max-w-none size-full" src={img} />
-              </div>
-              <div
-                className="absolute left-[18px] size-[2.4px] top-[16.8px]"
-                id="node-I434_2598-434_2186-91_2223"
-              >
-                <img alt="" className="block max-w-none size-full" src={img} />
-              </div>
-              <div
-                className="absolute left-[3.6px] size-[2.4px] top-[10.8px]"
-                id="node-I434_2598-434_2186-91_2209"
-              >
-                <img alt="" className="block max-w-none size-full" src={img} />
-              </div>
-              <div
-                className="absolute left-[3.6px] size-[2.4px] top-[4.8px]"
-                id="node-I434_2598-434_2186-91_2219"
-              >
-                <img alt="" className="block max-w-none size-full" src={img} />
-              </div>
-              <div
-                className="absolute left-[3.6px] size-[2.4px] top-[16.8px]"
-                id="node-I434_2598-434_2186-91_2224"
-              >
-                <img alt="" className="block max-w-none size-full" src={img} />
-              </div>
-              <div
-                className="absolute left-[7.2px] size-[2.4px] top-[10.8px]"
-                id="node-I434_2598-434_2186-91_2214"
-              >
-                <img alt="" className="block max-w-none size-full" src={img} />
-              </div>
-              <div
-                className="absolute left-[7.2px] size-[2.4px] top-[4.8px]"
-                id="node-I434_2598-434_2186-91_2220"
-              >
-                <img alt="" className="block max-w-none size-full" src={img} />
-              </div>
-              <div
-                className="absolute left-[7.2px] size-[2.4px] top-[16.8px]"
-                id="node-I434_2598-434_2186-91_2225"
-              >
-                <img alt="" className="block max-w-none size-full" src={img} />
-              </div>
-            </div>
+            <DotsIcon dots={MENU_DOTS} id="node-I434_2598-434_2186" />
           </div>
         </div>
       </div>
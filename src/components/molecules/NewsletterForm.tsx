@@ -0,0 +1,38 @@
+"use client";
+
+import * as React from "react";
+import { DotsArrow } from "@/components/atoms/DotsArrow";
+
+/** Email field and submit arrow for the footer newsletter signup */
+export function NewsletterForm(): React.ReactElement {
+  const [email, setEmail] = React.useState("");
+
+  const handleNewsletterSubmit = (e: React.FormEvent) => {
+    e.preventDefault();
+    // TODO: Implement newsletter subscription
+    console.log("Newsletter subscription:", email);
+  };
+
+  return (
+    <form onSubmit={handleNewsletterSubmit} className="relative">
+      <div className="flex flex-row gap-2 items-center px-0 py-1.5 w-full border-b border-emerald-200">
+        <input
+          type="email"
+          value={email}
+          onChange={(e) => setEmail(e.target.value)}
+          placeholder="Skriv din e-mail"
+          className="font-mono font-normal text-sm text-emerald-400 bg-transparent border-none outline-none flex-1 placeholder:text-emerald-400"
+        />
+        <button
+          type="submit"
+          className="relative h-5 w-20 group"
+          aria-label="Tilmeld nyhedsbrev"
+        >
+          <DotsArrow className="w-20 h-5 opacity-70 group-hover:opacity-100 transition-opacity" />
+        </button>
+      </div>
+    </form>
+  );
+}
+
+export default NewsletterForm;
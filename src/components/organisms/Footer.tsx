@@ -1,8 +1,6 @@
-"use client";
-
 import * as React from "react";
 import { cn } from "@/lib/utils/cn";
-import { DotsArrow } from "@/components/atoms/DotsArrow";
+import { NewsletterForm } from "@/components/molecules/NewsletterForm";
 
 interface DepartmentInfo {
   name: string;
@@ -59,21 +57,13 @@ const AVCenterLogo = () => (
   </div>
 );
 
-export const Footer = React.forwardRef<
-  HTMLElement,
-  React.HTMLAttributes<HTMLElement>
->(({ className, ...props }, ref) => {
-  const [email, setEmail] = React.useState("");
-
-  const handleNewsletterSubmit = (e: React.FormEvent) => {
-    e.preventDefault();
-    // TODO: Implement newsletter subscription
-    console.log("Newsletter subscription:", email);
-  };
-
+// Server component; only the newsletter form hydrates
+export function Footer({
+  className,
+  ...props
+}: React.HTMLAttributes<HTMLElement>): React.ReactElement {
   return (
     <footer
-      ref={ref}
       className={cn(
         "bg-gray-cold-900 text-white px-16 pt-[100px] pb-12",
         className
@@ -94,24 +84,7 @@ export const Footer = React.forwardRef<
               </p>
 
               {/* Email Input with Dots Arrow */}
-              <form onSubmit={handleNewsletterSubmit} className="relative">
-                <div className="flex flex-row gap-2 items-center px-0 py-1.5 w-full border-b border-emerald-200">
-                  <input
-                    type="email"
-                    value={email}
-                    onChange={(e) => setEmail(e.target.value)}
-                    placeholder="Skriv din e-mail"
-                    className="font-mono font-normal text-sm text-emerald-400 bg-transparent border-none outline-none flex-1 placeholder:text-emerald-400"
-                  />
-                  <button
-                    type="submit"
-                    className="relative h-5 w-20 group"
-                    aria-label="Tilmeld nyhedsbrev"
-                  >
-                    <DotsArrow className="w-20 h-5 opacity-70 group-hover:opacity-100 transition-opacity" />
-                  </button>
-                </div>
-              </form>
+              <NewsletterForm />
             </div>
           </div>
 
@@ -224,6 +197,4 @@ export const Footer = React.forwardRef<
       </div>
     </footer>
   );
-});
-
-Footer.displayName = "Footer";
+}
@@ -1,8 +1,11 @@
-"use client";
-
-import React, { useEffect, useRef, useState } from "react";
+import React from "react";
 import Image from "next/image";
-import { motion } from "framer-motion";
+import {
+  getVideoAsset,
+  videoPosterSrc,
+  videoSources,
+} from "@/lib/media/mediaManifest";
+import { ScrollHeroIsland } from "@/components/islands/ScrollHeroIsland";
 
 interface ScrollExpandMediaProps {
   mediaType?: "video" | "image";
@@ -12,6 +15,13 @@ interface ScrollExpandMediaProps {
   textBlend?: boolean;
 }
 
+const MEDIA_ID = "scroll-hero-media";
+const OVERLAY_ID = "scroll-hero-overlay";
+
+// Server-rendered, so the heading and media paint without waiting for
+// JavaScript. The .scroll-hero-media styles in globals.css show the
+// collapsed starting frame. ScrollHeroIsland binds the scroll input as it
+// hydrates, and ScrollHeroController takes over the mask once it loads.
 const ScrollExpandMedia = ({
   mediaType = "video",
   mediaSrc,
@@ -19,218 +29,20 @@ const ScrollExpandMedia = ({
   title,
   textBlend,
 }: ScrollExpandMediaProps): React.ReactElement => {
-  const [scrollProgress, setScrollProgress] = useState<number>(0);
-  const [mediaFullyExpanded, setMediaFullyExpanded] = useState<boolean>(false);
-  const [touchStartY, setTouchStartY] = useState<number>(0);
-  const [extraScrollBuffer, setExtraScrollBuffer] = useState<number>(0);
-  const SCROLL_BUFFER_THRESHOLD = 40; // 40px extra scroll required
-
-  const sectionRef = useRef<HTMLDivElement | null>(null);
-  const wrapperRef = useRef<HTMLDivElement | null>(null);
-  const [containerSize, setContainerSize] = useState<{
-    width: number;
-    height: number;
-  }>({ width: 0, height: 0 });
-
-  useEffect(() => {
-    setScrollProgress(0);
-    setMediaFullyExpanded(false);
-    setExtraScrollBuffer(0); // Reset buffer when media type changes
-  }, [mediaType]);
-
-  useEffect(() => {
-    let rafId: number | null = null;
-    const handleWheel = (e: Event): void => {
-      const wheelEvent = e as WheelEvent;
-
-      if (mediaFullyExpanded) {
-        // Handle scrolling when video is fully expanded
-        if (wheelEvent.deltaY < 0 && window.scrollY <= 5) {
-          // Scrolling up - contract the video
-          setMediaFullyExpanded(false);
-          setExtraScrollBuffer(0); // Reset buffer
-          e.preventDefault();
-        } else if (
-          wheelEvent.deltaY > 0 &&
-          extraScrollBuffer < SCROLL_BUFFER_THRESHOLD
-        ) {
-          // Scrolling down - accumulate buffer before allowing page scroll
-          e.preventDefault();
-          setExtraScrollBuffer((prev) =>
-            Math.min(
-              prev + Math.abs(wheelEvent.deltaY),
-              SCROLL_BUFFER_THRESHOLD
-            )
-          );
-        }
-        // If buffer is satisfied, allow normal scrolling (don't prevent default)
-      } else if (!mediaFullyExpanded) {
-        // Handle expansion animation
-        e.preventDefault();
-        const performUpdate = () => {
-          const scrollDelta = wheelEvent.deltaY * 0.0009;
-          setScrollProgress((prev) => {
-            const next = Math.min(Math.max(prev + scrollDelta, 0), 1);
-            if (next >= 1) {
-              setMediaFullyExpanded(true);
-              setExtraScrollBuffer(0); // Reset buffer when expanding
-            }
-            return next;
-          });
-          rafId = null;
-        };
-        if (rafId == null) rafId = requestAnimationFrame(performUpdate);
-      }
-    };
-
-    const handleTouchStart = (e: Event): void => {
-      const touchEvent = e as TouchEvent;
-      setTouchStartY(touchEvent.touches[0].clientY);
-    };
-
-    const handleTouchMove = (e: Event): void => {
-      const touchEvent = e as TouchEvent;
-      if (!touchStartY) return;
-
-      const touchY = touchEvent.touches[0].clientY;
-      const deltaY = touchStartY - touchY;
-
-      if (mediaFullyExpanded) {
-        // Handle touch scrolling when video is fully expanded
-        if (deltaY < -20 && window.scrollY <= 5) {
-          // Swiping down - contract the video
-          setMediaFullyExpanded(false);
-          setExtraScrollBuffer(0); // Reset buffer
-          e.preventDefault();
-        } else if (deltaY > 0 && extraScrollBuffer < SCROLL_BUFFER_THRESHOLD) {
-          // Swiping up - accumulate buffer before allowing page scroll
-          e.preventDefault();
-          setExtraScrollBuffer((prev) =>
-            Math.min(prev + Math.abs(deltaY), SCROLL_BUFFER_THRESHOLD)
-          );
-          setTouchStartY(touchY);
-        } else if (deltaY > 0 && extraScrollBuffer >= SCROLL_BUFFER_THRESHOLD) {
-          // Buffer satisfied, allow normal scrolling
-          setTouchStartY(touchY);
-        }
-      } else if (!mediaFullyExpanded) {
-        // Handle expansion animation
-        e.preventDefault();
-        const update = () => {
-          const scrollFactor = deltaY < 0 ? 0.008 : 0.005;
-          const scrollDelta = deltaY * scrollFactor;
-          setScrollProgress((prev) => {
-            const next = Math.min(Math.max(prev + scrollDelta, 0), 1);
-            if (next >= 1) {
-              setMediaFullyExpanded(true);
-              setExtraScrollBuffer(0); // Reset buffer when expanding
-            }
-            return next;
-          });
-          setTouchStartY(touchY);
-        };
-        requestAnimationFrame(update);
-      }
-    };
-
-    const handleTouchEnd = (): void => {
-      setTouchStartY(0);
-    };
-
-    const handleScroll = (): void => {
-      if (!mediaFullyExpanded) {
-        window.scrollTo(0, 0);
-      }
-    };
-
-    window.addEventListener("wheel", handleWheel, { passive: false });
-    window.addEventListener("scroll", handleScroll);
-    window.addEventListener("touchstart", handleTouchStart, { passive: false });
-    window.addEventListener("touchmove", handleTouchMove, { passive: false });
-    window.addEventListener("touchend", handleTouchEnd);
-
-    return () => {
-      if (rafId != null) cancelAnimationFrame(rafId);
-      window.removeEventListener("wheel", handleWheel);
-      window.removeEventListener("scroll", handleScroll);
-      window.removeEventListener("touchstart", handleTouchStart);
-      window.removeEventListener("touchmove", handleTouchMove);
-      window.removeEventListener("touchend", handleTouchEnd);
-    };
-  }, [
-    scrollProgress,
-    mediaFullyExpanded,
-    touchStartY,
-    extraScrollBuffer,
-    SCROLL_BUFFER_THRESHOLD,
-  ]);
-
-  // Measure the wrapper's pixel size (100% width with 16/9 aspect)
-  useEffect(() => {
-    const measure = (): void => {
-      if (!wrapperRef.current) return;
-      const rect = wrapperRef.current.getBoundingClientRect();
-      const width = rect.width;
-      const height = rect.height > 0 ? rect.height : width * (9 / 16);
-      setContainerSize({ width, height });
-    };
-    measure();
-    window.addEventListener("resize", measure);
-    return () => window.removeEventListener("resize", measure);
-  }, []);
-
-  // Pixel-accurate mask: compute from measured width/height (16/9). Start as 1/1 circle, morph to 16/9 rounded rect.
-  const { width: containerWidthPx, height: containerHeightPx } = containerSize;
-
-  // Responsive circle scale based on screen width
-  const getInitialCircleScale = () => {
-    if (containerWidthPx < 768) return 0.4; // mobile
-    if (containerWidthPx < 1280) return 0.45; // small laptop
-    if (containerWidthPx < 1536) return 0.5; // laptop
-    return 0.6; // desktop
-  };
-
-  const initialCircleScale = getInitialCircleScale();
-  const initialSquarePx = Math.max(
-    50,
-    Math.min(containerHeightPx, containerWidthPx) * initialCircleScale
-  );
-  const insetXStartPx = Math.max((containerWidthPx - initialSquarePx) / 2, 0);
-  const insetYStartPx = Math.max((containerHeightPx - initialSquarePx) / 2, 0);
-  const insetXPx = insetXStartPx * (1 - scrollProgress);
-  const insetYPx = insetYStartPx * (1 - scrollProgress);
-  const startCornerPx = initialSquarePx / 2; // perfect circle at start
-  const endCornerPx = 60; // rounded-rect corner at end
-  const cornerRadiusPx =
-    startCornerPx + (endCornerPx - startCornerPx) * scrollProgress;
-  const clipPathValue = `inset(${insetYPx}px ${insetXPx}px ${insetYPx}px ${insetXPx}px round ${cornerRadiusPx}px)`;
-
-  // Responsive position: adjust starting position based on screen size
-  const getStartPosition = () => {
-    if (containerWidthPx < 768) return 75; // mobile - further down
-    if (containerWidthPx < 1280) return 70; // small laptop - lower to avoid text
-    if (containerWidthPx < 1536) return 67; // laptop
-    return 65; // desktop
-  };
-
-  const startPercent = getStartPosition();
-  const endPercent = 50;
-  const topPercent =
-    startPercent + (endPercent - startPercent) * scrollProgress;
-  const leftPercent =
-    startPercent + (endPercent - startPercent) * scrollProgress;
+  // Overlay opacity at progress 0; it fades by 0.3 over the expansion
+  const overlayBase = mediaType === "image" ? 0.7 : 0.5;
+  // Renditions and a local poster from the media pipeline, when built
+  const videoAsset = getVideoAsset(mediaSrc);
+  const heroPoster = videoPosterSrc(mediaSrc, 1280) ?? posterSrc;
 
   return (
-    <div
-      ref={sectionRef}
-      className="transition-colors duration-700 ease-in-out overflow-x-hidden"
-    >
+    <div className="transition-colors duration-700 ease-in-out overflow-x-hidden">
       <section className="relative flex flex-col items-center justify-start min-h-[100dvh]">
         <div className="relative w-full flex flex-col items-center min-h-[100dvh]">
           <div className="absolute inset-0 z-0 h-full" />
           <div className="container mx-auto flex flex-col items-center justify-start relative z-10">
             <div className="flex flex-col items-center justify-center w-full h-[100dvh] relative">
-              <div className="w-full h-[60dvh] absolute">
+              <div className="w-full h-[60dvh] absolute @container">
                 <div className="flex flex-col items-center w-full h-[100%] relative">
                   <div
                     className={`flex gap-4 w-full relative z-10 transition-none flex-col ${
@@ -242,21 +54,16 @@ const ScrollExpandMedia = ({
                     </div>
                   </div>
                   <div
-                    className="absolute z-20 top-1/2 left-1/2"
+                    id={MEDIA_ID}
+                    className="scroll-hero-media absolute z-20"
                     style={{
-                      top: `${topPercent}%`,
-                      left: `${leftPercent}%`,
+                      // clip-path, top, left and filter are written per
+                      // frame by ScrollHeroController
                       width: "100%",
                       aspectRatio: "16 / 9",
                       transform: "translate(-50%, -50%)",
                       willChange: "clip-path, filter, top, left",
-                      clipPath: clipPathValue,
-                      filter:
-                        scrollProgress > 0.7
-                          ? "drop-shadow(0 10px 30px rgba(0,0,0,0.35))"
-                          : "none",
                     }}
-                    ref={wrapperRef}
                   >
                     {mediaType === "video" ? (
                       mediaSrc.includes("youtube.com") ? (
@@ -282,18 +89,16 @@ const ScrollExpandMedia = ({
                             style={{ pointerEvents: "none" }}
                           />
 
-                          <motion.div
+                          <div
+                            id={OVERLAY_ID}
                             className="absolute inset-0"
-                            initial={{ opacity: 0.7 }}
-                            animate={{ opacity: 0.5 - scrollProgress * 0.3 }}
-                            transition={{ duration: 0.2 }}
+                            style={{ opacity: overlayBase }}
                           />
                         </div>
                       ) : (
                         <div className="relative w-full h-full pointer-events-none">
                           <video
-                            src={mediaSrc}
-                            poster={posterSrc}
+                            poster={heroPoster}
                             autoPlay
                             muted
                             loop
@@ -303,17 +108,29 @@ const ScrollExpandMedia = ({
                             controls={false}
                             disablePictureInPicture
                             disableRemotePlayback
-                          />
+                          >
+                            {videoAsset ? (
+                              videoSources(videoAsset).map((source) => (
+                                <source
+                                  key={source.src}
+                                  src={source.src}
+                                  type={source.type}
+                                  media={source.media}
+                                />
+                              ))
+                            ) : (
+                              <source src={mediaSrc} />
+                            )}
+                          </video>
                           <div
                             className="absolute inset-0 z-10"
                             style={{ pointerEvents: "none" }}
                           />
 
-                          <motion.div
+                          <div
+                            id={OVERLAY_ID}
                             className="absolute inset-0"
-                            initial={{ opacity: 0.7 }}
-                            animate={{ opacity: 0.5 - scrollProgress * 0.3 }}
-                            transition={{ duration: 0.2 }}
+                            style={{ opacity: overlayBase }}
                           />
                         </div>
                       )
@@ -327,11 +144,10 @@ const ScrollExpandMedia = ({
                           className="w-full h-full object-cover"
                         />
 
-                        <motion.div
+                        <div
+                          id={OVERLAY_ID}
                           className="absolute inset-0"
-                          initial={{ opacity: 0.7 }}
-                          animate={{ opacity: 0.7 - scrollProgress * 0.3 }}
-                          transition={{ duration: 0.2 }}
+                          style={{ opacity: overlayBase }}
                         />
                       </div>
                     )}
@@ -342,6 +158,11 @@ const ScrollExpandMedia = ({
           </div>
         </div>
       </section>
+      <ScrollHeroIsland
+        mediaId={MEDIA_ID}
+        overlayId={OVERLAY_ID}
+        overlayBase={overlayBase}
+      />
     </div>
   );
 };
@@ -388,15 +209,9 @@ const sampleMediaContent: MediaContentCollection = {
 };
 
 export default function ScrollHero(): React.ReactElement {
-  const [mediaType] = useState<"video" | "image">("video");
+  const mediaType: "video" | "image" = "video";
   const currentMedia = sampleMediaContent[mediaType];
 
-  useEffect(() => {
-    window.scrollTo(0, 0);
-    const resetEvent = new Event("resetSection");
-    window.dispatchEvent(resetEvent);
-  }, [mediaType]);
-
   return (
     <div className="min-h-screen">
       <ScrollExpandMedia
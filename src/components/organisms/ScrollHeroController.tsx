@@ -0,0 +1,90 @@
+"use client";
+
+import { useLayoutEffect } from "react";
+import { expandFrame } from "@/lib/animation/scrollExpand";
+import type { ScrollExpandInput } from "@/lib/hooks/useScrollExpandInput";
+import { inputBus } from "@/lib/scheduler/inputBus";
+
+export interface ScrollHeroControllerProps {
+  /** Gesture bound by the island at hydration */
+  input: ScrollExpandInput;
+  /** Element id of the media box to expand */
+  mediaId: string;
+  /** Element id of the darkening overlay over the media, if any */
+  overlayId?: string;
+  /** Overlay opacity at progress 0; it fades by 0.3 over the expansion */
+  overlayBase: number;
+}
+
+/**
+ * Geometry for the server-rendered ScrollHero markup, loaded after the
+ * input is already bound. Renders nothing: it finds the media box by id and
+ * writes clip-path, position, filter and overlay opacity for the gesture's
+ * progress straight to the DOM at most once per frame, so nothing
+ * re-renders while the gesture runs.
+ */
+export default function ScrollHeroController({
+  input,
+  mediaId,
+  overlayId,
+  overlayBase,
+}: ScrollHeroControllerProps): null {
+  useLayoutEffect(() => {
+    const wrapper = document.getElementById(mediaId);
+    const overlay = overlayId ? document.getElementById(overlayId) : null;
+    if (!wrapper) return;
+
+    const { gesture } = input;
+    const size = { width: 0, height: 0 };
+    // Last values written, so unchanged frames cost nothing
+    let writtenProgress = -1;
+    let writtenWidth = -1;
+    let writtenShadow: boolean | null = null;
+
+    const measure = (): void => {
+      // 100% width with a 16/9 aspect ratio
+      const rect = wrapper.getBoundingClientRect();
+      size.width = rect.width;
+      size.height = rect.height > 0 ? rect.height : rect.width * (9 / 16);
+    };
+
+    const write = (): void => {
+      const { progress } = gesture;
+      if (progress === writtenProgress && size.width === writtenWidth) return;
+      writtenProgress = progress;
+      writtenWidth = size.width;
+
+      const geometry = expandFrame(progress, size.width, size.height);
+      const { style } = wrapper;
+      style.clipPath = geometry.clipPath;
+      style.top = `${geometry.topPercent}%`;
+      style.left = `${geometry.leftPercent}%`;
+      if (geometry.shadow !== writtenShadow) {
+        writtenShadow = geometry.shadow;
+        style.filter = geometry.shadow
+          ? "drop-shadow(0 10px 30px rgba(0,0,0,0.35))"
+          : "none";
+      }
+      if (overlay) {
+        overlay.style.opacity = String(overlayBase - progress * 0.3);
+      }
+    };
+
+    // Catch up with whatever the gesture did before this loaded
+    measure();
+    write();
+    input.setRenderer(write);
+
+    const unsubscribeResize = inputBus.onResize(() => {
+      measure();
+      input.invalidate();
+    });
+
+    return () => {
+      unsubscribeResize();
+      input.setRenderer(null);
+    };
+  }, [input, mediaId, overlayId, overlayBase]);
+
+  return null;
+}
@@ -0,0 +1,222 @@
+"use client";
+
+import * as React from "react";
+import { createPortal } from "react-dom";
+import useEmblaCarousel from "embla-carousel-react";
+import type { CarouselApi } from "@/components/ui/carousel";
+import { EmeraldDotsButton } from "@/components/atoms/DotsButton";
+import { useManagedVideo } from "@/lib/hooks/useManagedVideo";
+import { observeElementVisibility } from "@/lib/scheduler/visibility";
+
+interface CaseStudyCarouselProps {
+  /** Section containing the server-rendered CaseStudySlider markup */
+  rootRef: React.RefObject<HTMLElement | null>;
+}
+
+interface CardVideo {
+  /** Slide index of the card */
+  index: number;
+  src: string;
+  host: HTMLElement;
+}
+
+interface CarouselParts {
+  region: HTMLElement;
+  viewport: HTMLElement;
+  nav: HTMLElement | null;
+  videos: CardVideo[];
+}
+
+function findParts(root: HTMLElement): CarouselParts | null {
+  const region = root.querySelector<HTMLElement>("[data-carousel]");
+  const viewport = root.querySelector<HTMLElement>(
+    "[data-carousel-viewport]"
+  );
+  const container = viewport?.firstElementChild;
+  if (!region || !viewport || !container) return null;
+
+  const videos: CardVideo[] = [];
+  Array.from(container.children).forEach((slide, index) => {
+    const host = slide.querySelector<HTMLElement>("[data-video-src]");
+    if (host?.dataset.videoSrc) {
+      videos.push({ index, src: host.dataset.videoSrc, host });
+    }
+  });
+  return {
+    region,
+    viewport,
+    nav: root.querySelector<HTMLElement>("[data-carousel-nav]"),
+    videos,
+  };
+}
+
+function CaseStudyNav({ api }: { api: CarouselApi }) {
+  const [canScrollPrev, setCanScrollPrev] = React.useState(false);
+  const [canScrollNext, setCanScrollNext] = React.useState(false);
+
+  React.useEffect(() => {
+    if (!api) return;
+
+    const updateScrollButtons = () => {
+      setCanScrollPrev(api.canScrollPrev());
+      setCanScrollNext(api.canScrollNext());
+    };
+
+    updateScrollButtons();
+    api.on("select", updateScrollButtons);
+    api.on("reInit", updateScrollButtons);
+
+    return () => {
+      api.off("select", updateScrollButtons);
+      api.off("reInit", updateScrollButtons);
+    };
+  }, [api]);
+
+  return (
+    <>
+      <EmeraldDotsButton
+        direction="left"
+        onClick={() => api?.scrollPrev()}
+        disabled={!canScrollPrev}
+      />
+      <EmeraldDotsButton
+        direction="right"
+        onClick={() => api?.scrollNext()}
+        disabled={!canScrollNext}
+      />
+    </>
+  );
+}
+
+// Plays the pooled hover video in a card's video host while the card is
+// hovered, and marks the host ready so its CSS can fade it in
+function CaseStudyCardVideo({
+  src,
+  host,
+  preload,
+}: CardVideo & { preload: boolean }) {
+  const [hovered, setHovered] = React.useState(false);
+  const hostRef = React.useMemo(() => ({ current: host }), [host]);
+  // The video element comes from a shared pool and is only moved in here
+  // while the card is hovered; hovering also starts its download.
+  const state = useManagedVideo(src, hostRef, { preload, playing: hovered });
+
+  React.useEffect(() => {
+    const card = host.parentElement;
+    if (!card) return;
+    const enter = () => setHovered(true);
+    const leave = () => setHovered(false);
+    // The pointer may already be over the card when this attaches
+    setHovered(card.matches(":hover"));
+    card.addEventListener("mouseenter", enter);
+    card.addEventListener("mouseleave", leave);
+    return () => {
+      card.removeEventListener("mouseenter", enter);
+      card.removeEventListener("mouseleave", leave);
+    };
+  }, [host]);
+
+  React.useEffect(() => {
+    host.toggleAttribute("data-ready", state === "ready");
+  }, [host, state]);
+
+  return null;
+}
+
+/**
+ * Interactive half of the case-study section, loaded when it nears the
+ * viewport: attaches Embla to the server-rendered slider, portals the
+ * navigation buttons into the header, and drives the card hover videos.
+ * Renders no markup of its own.
+ */
+export default function CaseStudyCarousel({
+  rootRef,
+}: CaseStudyCarouselProps) {
+  const [emblaRef, api] = useEmblaCarousel({
+    align: "start",
+    slidesToScroll: 1,
+    containScroll: "trimSnaps",
+  });
+  const [parts, setParts] = React.useState<CarouselParts | null>(null);
+  // Slide indices whose hover videos are worth preloading: those in the
+  // Embla viewport plus one on either side, while the slider is on screen
+  const [preloadSlides, setPreloadSlides] = React.useState<
+    ReadonlySet<number>
+  >(() => new Set());
+
+  React.useLayoutEffect(() => {
+    const root = rootRef.current;
+    const found = root && findParts(root);
+    if (!found) return;
+    setParts(found);
+    emblaRef(found.viewport);
+    return () => emblaRef(null);
+  }, [rootRef, emblaRef]);
+
+  React.useEffect(() => {
+    if (!api || !parts) return;
+    const { region } = parts;
+
+    const handleKeyDown = (event: KeyboardEvent) => {
+      if (event.key === "ArrowLeft") {
+        event.preventDefault();
+        api.scrollPrev();
+      } else if (event.key === "ArrowRight") {
+        event.preventDefault();
+        api.scrollNext();
+      }
+    };
+    region.addEventListener("keydown", handleKeyDown, true);
+    return () => region.removeEventListener("keydown", handleKeyDown, true);
+  }, [api, parts]);
+
+  React.useEffect(() => {
+    if (!api || !parts) return;
+
+    let onScreen = false;
+    const update = () => {
+      const next = new Set<number>();
+      if (onScreen) {
+        const lastSlide = api.slideNodes().length - 1;
+        api.slidesInView().forEach((index) => {
+          next.add(index);
+          if (index > 0) next.add(index - 1);
+          if (index < lastSlide) next.add(index + 1);
+        });
+      }
+      setPreloadSlides((current) =>
+        current.size === next.size &&
+        [...next].every((index) => current.has(index))
+          ? current
+          : next
+      );
+    };
+
+    const unobserve = observeElementVisibility(parts.region, (visible) => {
+      onScreen = visible;
+      update();
+    });
+    api.on("slidesInView", update);
+    api.on("reInit", update);
+
+    return () => {
+      unobserve();
+      api.off("slidesInView", update);
+      api.off("reInit", update);
+    };
+  }, [api, parts]);
+
+  if (!parts) return null;
+  return (
+    <>
+      {parts.nav && createPortal(<CaseStudyNav api={api} />, parts.nav)}
+      {parts.videos.map((video) => (
+        <CaseStudyCardVideo
+          key={video.index}
+          {...video}
+          preload={preloadSlides.has(video.index)}
+        />
+      ))}
+    </>
+  );
+}
@@ -1,10 +1,8 @@
-"use client";
-
 import * as React from "react";
 import { cn } from "@/lib/utils/cn";
 import { CaseStudySlider } from "./CaseStudySlider";
 import { type CaseStudyCardProps } from "@/components/ui/CaseStudyCard";
-import { type CarouselApi } from "@/components/ui/carousel";
+import { CaseStudySectionIsland } from "@/components/islands/CaseStudySectionIsland";
 
 interface CaseStudySectionProps {
   caseStudies?: CaseStudyCardProps[];
@@ -13,42 +11,39 @@ interface CaseStudySectionProps {
   linkHref?: string;
 }
 
-export const CaseStudySection = React.forwardRef<
-  HTMLElement,
-  CaseStudySectionProps & React.HTMLAttributes<HTMLElement>
->(({ caseStudies, title, linkText, linkHref, className, ...props }, ref) => {
-  const [carouselApi, setCarouselApi] = React.useState<CarouselApi>();
-
+// Server component: titles, clients and links are in the HTML. The island
+// around it adds the carousel, the navigation and the hover videos.
+export function CaseStudySection({
+  caseStudies,
+  title,
+  linkText,
+  linkHref,
+  className,
+  ...props
+}: CaseStudySectionProps & React.HTMLAttributes<HTMLElement>) {
   return (
-    <section
-      ref={ref}
+    <CaseStudySectionIsland
       className={cn("w-full py-20 md:py-24", className)}
       {...props}
     >
       {/* Header - constrained to max-width */}
       <div className="max-w-[1220px] mx-auto px-6 md:px-8 lg:px-12">
         <div className="w-full mb-8">
-          <CaseStudySlider.Header carouselApi={carouselApi} />
+          <CaseStudySlider.Header />
         </div>
       </div>
 
       {/* Full-width slider with content as first slide */}
       <div className="w-full overflow-hidden">
-        {/* Add left padding to align start position with SectionContainer */}
-        <div className="">
-          <CaseStudySlider
-            caseStudies={caseStudies}
-            showHeader={false}
-            onApiChange={setCarouselApi}
-            includeContentSlide={true}
-            contentTitle={title}
-            contentLinkText={linkText}
-            contentLinkHref={linkHref}
-          />
-        </div>
+        <CaseStudySlider
+          caseStudies={caseStudies}
+          showHeader={false}
+          includeContentSlide={true}
+          contentTitle={title}
+          contentLinkText={linkText}
+          contentLinkHref={linkHref}
+        />
       </div>
-    </section>
+    </CaseStudySectionIsland>
   );
-});
-
-CaseStudySection.displayName = "CaseStudySection";
+}
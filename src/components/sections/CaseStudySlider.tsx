@@ -1,59 +1,27 @@
-"use client";
-
 import * as React from "react";
 import { cn } from "@/lib/utils/cn";
-import {
-  Carousel,
-  CarouselContent,
-  CarouselItem,
-  type CarouselApi,
-} from "@/components/ui/carousel";
 import {
   CaseStudyCard,
   type CaseStudyCardProps,
 } from "@/components/ui/CaseStudyCard";
-import { EmeraldDotsButton } from "@/components/atoms/DotsButton";
 import { CaseStudyContent } from "./CaseStudyContent";
+import caseStudiesManifest from "@/content/case-studies.json";
 
-interface CaseStudyHeaderProps {
-  carouselApi?: CarouselApi;
-}
-
-const CaseStudyHeader = React.forwardRef<
-  HTMLDivElement,
-  CaseStudyHeaderProps & React.HTMLAttributes<HTMLDivElement>
->(({ carouselApi, className, ...props }, ref) => {
-  const [canScrollPrev, setCanScrollPrev] = React.useState(false);
-  const [canScrollNext, setCanScrollNext] = React.useState(false);
-
-  React.useEffect(() => {
-    if (!carouselApi) return;
-
-    const updateScrollButtons = () => {
-      setCanScrollPrev(carouselApi.canScrollPrev());
-      setCanScrollNext(carouselApi.canScrollNext());
-    };
+// Sample data if no case studies provided - using actual files from the
+// public folder. The same manifest feeds the media build script.
+const defaultCaseStudies: CaseStudyCardProps[] = caseStudiesManifest;
 
-    updateScrollButtons();
-    carouselApi.on("select", updateScrollButtons);
-    carouselApi.on("reInit", updateScrollButtons);
+// Server-rendered slider markup: the same structure as ui/carousel, so
+// CaseStudyCarousel can attach Embla to it (and portal the navigation
+// buttons into the header) once the section is near the viewport.
+const SLIDE_CLASS = "min-w-0 shrink-0 grow-0 basis-auto";
 
-    return () => {
-      carouselApi.off("select", updateScrollButtons);
-      carouselApi.off("reInit", updateScrollButtons);
-    };
-  }, [carouselApi]);
-
-  const onPrev = React.useCallback(() => {
-    carouselApi?.scrollPrev();
-  }, [carouselApi]);
-
-  const onNext = React.useCallback(() => {
-    carouselApi?.scrollNext();
-  }, [carouselApi]);
+function CaseStudyHeader({
+  className,
+  ...props
+}: React.HTMLAttributes<HTMLDivElement>) {
   return (
     <div
-      ref={ref}
       className={cn(
         "w-full flex items-center justify-between gap-2 mb-8",
         className
@@ -71,170 +39,58 @@ const CaseStudyHeader = React.forwardRef<
         <div className="flex-1 h-[0.5px] bg-emerald-700" />
       </div>
 
-      {/* Navigation buttons */}
-      <div className="flex items-center gap-5 pl-6">
-        <EmeraldDotsButton
-          direction="left"
-          onClick={onPrev}
-          disabled={!canScrollPrev}
-        />
-        <EmeraldDotsButton
-          direction="right"
-          onClick={onNext}
-          disabled={!canScrollNext}
-        />
-      </div>
+      {/* Navigation buttons, sized to the two 24px buttons they receive */}
+      <div
+        data-carousel-nav
+        className="flex items-center gap-5 pl-6 h-6 w-[68px] box-content"
+      />
     </div>
   );
-});
-
-CaseStudyHeader.displayName = "CaseStudyHeader";
+}
 
 interface CaseStudySliderProps {
   caseStudies?: CaseStudyCardProps[];
   showHeader?: boolean;
-  onApiChange?: (api: CarouselApi) => void;
   includeContentSlide?: boolean;
   contentTitle?: string;
   contentLinkText?: string;
   contentLinkHref?: string;
 }
 
-const CaseStudySliderComponent = React.forwardRef<
-  HTMLDivElement,
-  CaseStudySliderProps & React.HTMLAttributes<HTMLDivElement>
->(
-  (
-    {
-      caseStudies = [],
-      showHeader = true,
-      onApiChange,
-      includeContentSlide = true,
-      contentTitle,
-      contentLinkText,
-      contentLinkHref,
-      className,
-      ...props
-    },
-    ref
-  ) => {
-    const [api, setApi] = React.useState<CarouselApi>();
+function CaseStudySliderComponent({
+  caseStudies = [],
+  showHeader = true,
+  includeContentSlide = true,
+  contentTitle,
+  contentLinkText,
+  contentLinkHref,
+  className,
+  ...props
+}: CaseStudySliderProps & React.HTMLAttributes<HTMLDivElement>) {
+  const displayCaseStudies =
+    caseStudies.length > 0 ? caseStudies : defaultCaseStudies;
 
-    React.useEffect(() => {
-      if (!api) return;
-
-      // Call onApiChange when api is available
-      if (onApiChange) {
-        onApiChange(api);
-      }
-    }, [api, onApiChange]);
-
-    // Sample data if no case studies provided - using actual files from public folder
-    const defaultCaseStudies: CaseStudyCardProps[] = [
-      {
-        id: "1",
-        title: "Fleksibel kantine og innovative møderum",
-        client: "Universal Robots",
-        year: 2024,
-        category: "Conference",
-        videoUrl: "/case_video-1.mp4",
-        thumbnailUrl: "/case-image-1.png",
-        slug: "universal-robots-case",
-      },
-      {
-        id: "2",
-        title: "Digital transformation og moderne arbejdsplads",
-        client: "Würth",
-        year: 2024,
-        category: "Corporate",
-        videoUrl: "/case-video-2.mp4",
-        thumbnailUrl: "/case-image-2.png",
-        slug: "wurth-case",
-      },
-      {
-        id: "3",
-        title: "Bæredygtig produktion og grøn teknologi",
-        client: "Universal Robots",
-        year: 2023,
-        category: "Technology",
-        videoUrl: "/case_video-1.mp4", // Reusing video 1
-        thumbnailUrl: "/case-image-1.png", // Reusing image 1
-        slug: "universal-robots-sustainability",
-      },
-      {
-        id: "4",
-        title: "Effektiv lagerstyring og automatisering",
-        client: "Würth",
-        year: 2023,
-        category: "Logistics",
-        videoUrl: "/case-video-2.mp4", // Reusing video 2
-        thumbnailUrl: "/case-image-2.png", // Reusing image 2
-        slug: "wurth-automation",
-      },
-      {
-        id: "5",
-        title: "Bæredygtig produktion og grøn teknologi",
-        client: "Universal Robots",
-        year: 2023,
-        category: "Technology",
-        videoUrl: "/case_video-1.mp4", // Reusing video 1
-        thumbnailUrl: "/case-image-1.png", // Reusing image 1
-        slug: "universal-robots-sustainability",
-      },
-      {
-        id: "6",
-        title: "Effektiv lagerstyring og automatisering",
-        client: "Würth",
-        year: 2023,
-        category: "Logistics",
-        videoUrl: "/case-video-2.mp4", // Reusing video 2
-        thumbnailUrl: "/case-image-2.png", // Reusing image 2
-        slug: "wurth-automation",
-      },
-      {
-        id: "7",
-        title: "Bæredygtig produktion og grøn teknologi",
-        client: "Universal Robots",
-        year: 2023,
-        category: "Technology",
-        videoUrl: "/case_video-1.mp4", // Reusing video 1
-        thumbnailUrl: "/case-image-1.png", // Reusing image 1
-        slug: "universal-robots-sustainability",
-      },
-      {
-        id: "8",
-        title: "Effektiv lagerstyring og automatisering",
-        client: "Würth",
-        year: 2023,
-        category: "Logistics",
-        videoUrl: "/case-video-2.mp4", // Reusing video 2
-        thumbnailUrl: "/case-image-2.png", // Reusing image 2
-        slug: "wurth-automation",
-      },
-    ];
-
-    const displayCaseStudies =
-      caseStudies.length > 0 ? caseStudies : defaultCaseStudies;
-
-    return (
-      <div ref={ref} className={cn("w-full", className)} {...props}>
-        {showHeader && <CaseStudyHeader carouselApi={api} />}
-
-        <Carousel
-          setApi={setApi}
-          opts={{
-            align: "start",
-            slidesToScroll: 1,
-            containScroll: "trimSnaps",
-          }}
-          className="w-full"
-        >
-          <CarouselContent className="pr-6">
+  return (
+    <div className={cn("w-full", className)} {...props}>
+      {showHeader && <CaseStudyHeader />}
+
+      <div
+        data-carousel
+        role="region"
+        aria-roledescription="carousel"
+        className="relative w-full"
+      >
+        <div data-carousel-viewport className="overflow-hidden">
+          <div className="flex -ml-4 pr-6">
             {/* Content slide as first item with custom width */}
             {includeContentSlide && (
-              <CarouselItem
-                key="content-slide"
-                className="basis-auto pl-10 md:pl-12 lg:pl-16 first-carousel-item"
+              <div
+                role="group"
+                aria-roledescription="slide"
+                className={cn(
+                  SLIDE_CLASS,
+                  "pl-10 md:pl-12 lg:pl-16 first-carousel-item"
+                )}
               >
                 <div className="h-full flex">
                   <CaseStudyContent
@@ -245,36 +101,30 @@ const CaseStudySliderComponent = React.forwardRef<
                     style={{ width: "578px" }}
                   />
                 </div>
-              </CarouselItem>
+              </div>
             )}
 
             {/* Case study cards */}
             {displayCaseStudies.map((caseStudy, index) => (
-              <CarouselItem
+              <div
                 key={caseStudy.id}
+                role="group"
+                aria-roledescription="slide"
                 className={cn(
-                  "basis-auto pl-6",
+                  SLIDE_CLASS,
+                  "pl-6",
                   index === displayCaseStudies.length - 1 && "pr-20"
                 )}
               >
                 <CaseStudyCard {...caseStudy} />
-              </CarouselItem>
+              </div>
             ))}
-          </CarouselContent>
-        </Carousel>
-        <style jsx global>{`
-          @media screen and (min-width: 1220px) {
-            .first-carousel-item {
-              padding-left: calc((100vw - 1220px) / 2 + 60px) !important;
-            }
-          }
-        `}</style>
+          </div>
+        </div>
       </div>
-    );
-  }
-);
-
-CaseStudySliderComponent.displayName = "CaseStudySlider";
+    </div>
+  );
+}
 
 // Export the slider with the header as a sub-component
 export const CaseStudySlider = Object.assign(CaseStudySliderComponent, {
@@ -1,70 +1,40 @@
-"use client";
-
-import React, { useEffect, useState } from "react";
-import BackgroundDotsCanvas from "../organisms/BackgroundDotsCanvas";
+import React from "react";
 import Header from "../organisms/Header";
 import ScrollHero from "../organisms/ScrollHero";
-import Waves from "../organisms/Waves";
-import { NavBar } from "@/components/molecules/NavBar";
 import { LinkList } from "@/components/molecules/LinkList";
-import { CaseStudySection } from "@/components/sections/CaseStudySection";
 import { SectionContainer } from "@/components/layout/SectionContainer";
+import { MobileNavDock } from "@/components/layout/MobileNavDock";
 import { Footer } from "@/components/organisms/Footer";
-import { Briefcase, FileText, Home, User } from "lucide-react";
-import { cn } from "@/lib/utils/cn";
-import CursorFollower from "@/components/animations/CursorFollower";
+import { CaseStudySection } from "@/components/sections/CaseStudySection";
+import { CursorFollowerIsland } from "@/components/islands/CursorFollowerIsland";
+import { WavesIsland } from "@/components/islands/WavesIsland";
 
+// Server component. Static sections render to HTML only; the interactive
+// parts are client islands, and the heavy ones (canvas, cursor, scroll
+// expansion, carousel) load after the page is interactive.
 export default function HomeTemplate(): React.ReactElement {
-  const [isScrolled, setIsScrolled] = useState<boolean>(false);
-
-  useEffect(() => {
-    const onScroll = () => setIsScrolled(window.scrollY > 10);
-    onScroll();
-    window.addEventListener("scroll", onScroll, { passive: true });
-    return () => window.removeEventListener("scroll", onScroll);
-  }, []);
-
-  const navItems = [
-    { name: "Salg", url: "#services", icon: Home },
-    { name: "Udlejning", url: "#rental", icon: Briefcase },
-    { name: "Om Os", url: "#about", icon: User },
-    { name: "Lokationer", url: "#locations", icon: FileText },
-    { name: "Kontakt", url: "#contact", icon: FileText },
-  ];
-
   return (
     <div className="bg-black text-gray-300 min-h-screen relative">
-      <CursorFollower />
+      <CursorFollowerIsland />
       {/*  <BackgroundDotsCanvas /> */}
 
       {/* Fixed Waves background that becomes absolute when scrolled past */}
       <div className="fixed top-0 left-0 w-full h-screen pointer-events-none z-0">
-        <Waves
+        <WavesIsland
           lineColor="rgba(255, 255, 255, 0.1)"
           waveSpeedX={0.0}
           waveSpeedY={0.0}
           gradientRadius={250}
           gradientFalloff={100}
           className="pointer-events-auto"
+          visibilityTargetId="home-content"
         />
       </div>
 
-      {/* Main content before CaseStudySection */}
-      <div className="relative z-10">
+      {/* Main content before CaseStudySection; Waves pauses once it scrolls away */}
+      <div id="home-content" className="relative z-10">
         <Header />
-        {/* Mobile-only sticky-from-bottom NavBar. Starts fixed at bottom, sticks below header on scroll */}
-        <div className="md:hidden sticky top-[72px] z-40 flex justify-center pointer-events-none">
-          <div
-            className={cn(
-              isScrolled
-                ? "relative"
-                : "fixed bottom-4 left-1/2 -translate-x-1/2",
-              "pointer-events-auto"
-            )}
-          >
-            <NavBar items={navItems} />
-          </div>
-        </div>
+        <MobileNavDock />
 
         {/* ScrollHero - wrapped in SectionContainer */}
         <SectionContainer variant="default">
@@ -1,9 +1,10 @@
-"use client";
-
-import * as React from "react";
 import { cn } from "@/lib/utils/cn";
 import Link from "next/link";
 import Image from "next/image";
+import { getImageAsset, resolveVideoSrc } from "@/lib/media/mediaManifest";
+
+// Smallest rendition worth playing in the 426px-tall card
+const CARD_VIDEO_HEIGHT = 720;
 
 export interface CaseStudyCardProps {
   id: string;
@@ -16,109 +17,67 @@ export interface CaseStudyCardProps {
   slug: string;
 }
 
-export const CaseStudyCard = React.forwardRef<
-  HTMLDivElement,
-  CaseStudyCardProps & React.HTMLAttributes<HTMLDivElement>
->(
-  (
-    { title, client, videoUrl, thumbnailUrl, slug, className, ...props },
-    ref
-  ) => {
-    const [isHovered, setIsHovered] = React.useState(false);
-    const [isVideoLoaded, setIsVideoLoaded] = React.useState(false);
-    const videoRef = React.useRef<HTMLVideoElement>(null);
-
-    // Preload video when component mounts
-    React.useEffect(() => {
-      if (videoRef.current) {
-        videoRef.current.load();
-      }
-    }, [videoUrl]);
+/**
+ * Server-rendered card markup; the hover states are CSS. The hover video
+ * is added by CaseStudyCarousel, which finds the host by its
+ * `data-video-src` and marks it `data-ready` once the video can play.
+ */
+export function CaseStudyCard({
+  title,
+  client,
+  videoUrl,
+  thumbnailUrl,
+  slug,
+  className,
+}: CaseStudyCardProps & { className?: string }) {
+  const thumbnail = getImageAsset(thumbnailUrl);
 
-    React.useEffect(() => {
-      if (isHovered && videoRef.current && isVideoLoaded) {
-        videoRef.current.play().catch((e) => {
-          console.log("Video autoplay failed:", e);
-        });
-      } else if (!isHovered && videoRef.current) {
-        videoRef.current.pause();
-        videoRef.current.currentTime = 0;
-      }
-    }, [isHovered, isVideoLoaded]);
+  return (
+    <Link href={`/cases/${slug}`} className="block">
+      <div
+        className={cn(
+          "relative w-[279px] h-[426px] overflow-hidden bg-gray-900 cursor-pointer group",
+          className
+        )}
+      >
+        {/* Background Image - Always visible but behind video when hovering */}
+        <Image
+          src={thumbnailUrl}
+          alt={title}
+          fill
+          sizes="279px"
+          className="object-cover"
+          {...(thumbnail && {
+            placeholder: "blur" as const,
+            blurDataURL: thumbnail.blurDataURL,
+          })}
+        />
 
-    return (
-      <Link href={`/cases/${slug}`} className="block">
+        {/* Background Video - Brought to front on hover once it can play */}
         <div
-          ref={ref}
-          className={cn(
-            "relative w-[279px] h-[426px] overflow-hidden bg-gray-900 cursor-pointer group",
-            className
-          )}
-          onMouseEnter={() => setIsHovered(true)}
-          onMouseLeave={() => setIsHovered(false)}
-          {...props}
-        >
-          {/* Background Image - Always visible but behind video when hovering */}
-          <Image src={thumbnailUrl} alt={title} fill className="object-cover" />
+          data-video-src={resolveVideoSrc(videoUrl, CARD_VIDEO_HEIGHT)}
+          className="absolute inset-0 w-full h-full transition-opacity duration-500 opacity-0 z-0 group-hover:data-ready:opacity-100 group-hover:data-ready:z-10"
+        />
 
-          {/* Background Video - Brought to front on hover with z-index */}
-          <video
-            ref={videoRef}
-            className={cn(
-              "absolute inset-0 w-full h-full object-cover transition-opacity duration-500",
-              isHovered && isVideoLoaded ? "opacity-100 z-10" : "opacity-0 z-0"
-            )}
-            src={videoUrl}
-            muted
-            loop
-            playsInline
-            preload="auto"
-            onLoadedData={() => {
-              console.log(`Video loaded: ${videoUrl}`);
-              setIsVideoLoaded(true);
-            }}
-            onError={(e) => {
-              console.error(`Video failed to load: ${videoUrl}`, e);
-            }}
-          />
+        {/* Gradient Overlay - Always on top with z-20 */}
+        <div className="absolute inset-0 bg-gradient-to-t from-black/80 via-black/20 to-transparent transition-opacity duration-300 z-20 opacity-70 group-hover:opacity-100" />
 
-          {/* Gradient Overlay - Always on top with z-20 */}
-          <div
-            className={cn(
-              "absolute inset-0 bg-gradient-to-t from-black/80 via-black/20 to-transparent transition-opacity duration-300 z-20",
-              isHovered ? "opacity-100" : "opacity-70"
-            )}
-          />
+        {/* Content Overlay - Always on top with z-30 */}
+        <div className="absolute inset-0 p-6 flex flex-col justify-end overflow-hidden z-30">
+          {/* Single container for both texts that moves together */}
+          <div className="transition-transform duration-500 ease-out translate-y-[calc(100%-22px)] group-hover:translate-y-0">
+            {/* Client name on top */}
+            <p className="text-base font-jetbrains font-normal text-white leading-normal transition-all duration-500 mb-3 group-hover:mb-2">
+              {client}
+            </p>
 
-          {/* Content Overlay - Always on top with z-30 */}
-          <div className="absolute inset-0 p-6 flex flex-col justify-end overflow-hidden z-30">
-            {/* Single container for both texts that moves together */}
-            <div
-              className={cn(
-                "transition-transform duration-500 ease-out",
-                isHovered ? "translate-y-0" : "translate-y-[calc(100%-22px)]"
-              )}
-            >
-              {/* Client name on top */}
-              <p
-                className={cn(
-                  "text-base font-jetbrains font-normal text-white leading-normal transition-all duration-500",
-                  isHovered ? "mb-2" : " mb-3"
-                )}
-              >
-                {client}
-              </p>
-
-              {/* Title below client - initially hidden below the card edge */}
-              <h3 className="text-white text-2xl font-neulis font-normal leading-normal">
-                {title}
-              </h3>
-            </div>
+            {/* Title below client - initially hidden below the card edge */}
+            <h3 className="text-white text-2xl font-neulis font-normal leading-normal">
+              {title}
+            </h3>
           </div>
         </div>
-      </Link>
-    );
-  }
-);
-
-CaseStudyCard.displayName = "CaseStudyCard";
+      </div>
+    </Link>
+  );
+}
@@ -0,0 +1,203 @@
+import { frameScheduler } from "@/lib/scheduler/frameScheduler";
+import { createScene, type SceneConfigs, type SceneName } from "./scenes";
+import { SceneLoop } from "./sceneLoop";
+import {
+  POINTER_BUFFER_BYTES,
+  SharedPointer,
+  WorkerOp,
+  encodeDensity,
+  encodeDispose,
+  encodePointer,
+  encodePointerLeave,
+  encodeResize,
+  encodeVisibility,
+  onWorkerFailure,
+  type ConfigMessage,
+  type InitMessage,
+} from "./worker/protocol";
+import {
+  detectCanvasCapabilities,
+  selectRenderMode,
+  type CanvasRenderMode,
+} from "./worker/renderMode";
+
+/** Main-thread handle for a background canvas, wherever it renders */
+export interface CanvasSceneController<Config> {
+  readonly mode: CanvasRenderMode;
+  resize(width: number, height: number, dpr: number): void;
+  pointerMove(x: number, y: number): void;
+  pointerLeave(): void;
+  setDensity(density: number): void;
+  setVisible(visible: boolean): void;
+  setConfig(config: Config): void;
+  dispose(): void;
+}
+
+export interface MountCanvasSceneOptions<Name extends SceneName> {
+  scene: Name;
+  config: SceneConfigs[Name];
+  width: number;
+  height: number;
+  dpr: number;
+  /** Opt in to rendering inside a worker when the browser supports it */
+  worker?: boolean;
+  /** Called on the main thread once per frame, in either mode */
+  onFrame?: (time: number) => void;
+  /**
+   * Called if the worker fails after the canvas was transferred. The
+   * controller is already disposed; the canvas can't render again, so
+   * remount on a fresh one with `worker: false`.
+   */
+  onWorkerError?: (error: unknown) => void;
+}
+
+type Controller<Name extends SceneName> = CanvasSceneController<
+  SceneConfigs[Name]
+>;
+
+function mountOnMainThread<Name extends SceneName>(
+  canvas: HTMLCanvasElement,
+  options: MountCanvasSceneOptions<Name>
+): Controller<Name> | null {
+  const ctx = canvas.getContext("2d");
+  if (!ctx) return null;
+
+  const scene = createScene(options.scene, options.config);
+  const loop = new SceneLoop(
+    canvas,
+    ctx,
+    scene,
+    options.onFrame,
+    frameScheduler
+  );
+  loop.resize(options.width, options.height, options.dpr);
+  loop.start();
+
+  return {
+    mode: "main",
+    resize: (width, height, dpr) => loop.resize(width, height, dpr),
+    pointerMove: (x, y) => scene.pointerMove(x, y),
+    pointerLeave: () => scene.pointerLeave(),
+    setDensity: (density) => scene.setDensity(density),
+    setVisible: (visible) => (visible ? loop.start() : loop.stop()),
+    setConfig: (config) => scene.setConfig(config),
+    dispose: () => loop.stop(),
+  };
+}
+
+function mountInWorker<Name extends SceneName>(
+  canvas: HTMLCanvasElement,
+  options: MountCanvasSceneOptions<Name>,
+  mode: "worker" | "worker-shared"
+): Controller<Name> {
+  const { onFrame, onWorkerError } = options;
+  const worker = new Worker(
+    new URL("./worker/canvas.worker.ts", import.meta.url),
+    { type: "module" }
+  );
+  let offscreen: OffscreenCanvas;
+  try {
+    offscreen = canvas.transferControlToOffscreen();
+  } catch (error) {
+    worker.terminate();
+    throw error;
+  }
+  const pointerBuffer =
+    mode === "worker-shared"
+      ? new SharedArrayBuffer(POINTER_BUFFER_BYTES)
+      : null;
+  const sharedPointer = pointerBuffer ? new SharedPointer(pointerBuffer) : null;
+
+  const setCssSize = (width: number, height: number) => {
+    canvas.style.width = `${width}px`;
+    canvas.style.height = `${height}px`;
+  };
+  setCssSize(options.width, options.height);
+
+  const init: InitMessage<Name> = {
+    op: WorkerOp.Init,
+    scene: options.scene,
+    canvas: offscreen,
+    config: options.config,
+    width: options.width,
+    height: options.height,
+    dpr: options.dpr,
+    pointerBuffer,
+  };
+  worker.postMessage(init, [offscreen]);
+
+  // The worker draws on its own; the main thread only takes frames when a
+  // caller needs per-frame DOM work (e.g. the Waves cursor dot).
+  const frames = onFrame
+    ? frameScheduler.subscribe((time) => onFrame(time), {
+        priority: "render",
+      })
+    : null;
+
+  let disposed = false;
+  const dispose = () => {
+    if (disposed) return;
+    disposed = true;
+    stopWatching();
+    frames?.unsubscribe();
+    worker.postMessage(encodeDispose());
+    worker.terminate();
+  };
+  const stopWatching = onWorkerFailure(worker, (error) => {
+    console.warn("Canvas worker failed, using main thread:", error);
+    dispose();
+    onWorkerError?.(error);
+  });
+
+  return {
+    mode,
+    resize: (width, height, dpr) => {
+      setCssSize(width, height);
+      worker.postMessage(encodeResize(width, height, dpr));
+    },
+    pointerMove: (x, y) => {
+      if (sharedPointer) sharedPointer.write(x, y);
+      else worker.postMessage(encodePointer(x, y));
+    },
+    pointerLeave: () => {
+      if (sharedPointer) sharedPointer.leave();
+      else worker.postMessage(encodePointerLeave());
+    },
+    setDensity: (density) => worker.postMessage(encodeDensity(density)),
+    setVisible: (visible) => {
+      worker.postMessage(encodeVisibility(visible));
+      frames?.setActive(visible);
+    },
+    setConfig: (config) => {
+      const message: ConfigMessage<Name> = { op: WorkerOp.Config, config };
+      worker.postMessage(message);
+    },
+    dispose,
+  };
+}
+
+/**
+ * Start rendering `options.scene` into `canvas`. With `worker: true` the
+ * canvas is transferred to a worker when OffscreenCanvas is supported;
+ * otherwise, or if the transfer fails, it renders on the main thread.
+ * The canvas must be fresh: once transferred it cannot be reused, so
+ * callers create it per mount, and remount on a new canvas in main-thread
+ * mode when `onWorkerError` reports that the worker died.
+ */
+export function mountCanvasScene<Name extends SceneName>(
+  canvas: HTMLCanvasElement,
+  options: MountCanvasSceneOptions<Name>
+): Controller<Name> | null {
+  const mode = selectRenderMode(
+    options.worker ?? false,
+    detectCanvasCapabilities()
+  );
+  if (mode !== "main") {
+    try {
+      return mountInWorker(canvas, options, mode);
+    } catch (error) {
+      console.warn("Canvas worker unavailable, using main thread:", error);
+    }
+  }
+  return mountOnMainThread(canvas, options);
+}
@@ -0,0 +1,42 @@
+import type { WavePointer } from "./waveField";
+
+// Smoothed pointer state for the Waves field. `move()` records the raw
+// position; `update()` eases the smoothed position and velocity towards it
+// and is called once per frame.
+
+export class PointerTracker implements WavePointer {
+  x = -10;
+  y = 0;
+  lx = 0;
+  ly = 0;
+  sx = 0;
+  sy = 0;
+  v = 0;
+  vs = 0;
+  a = 0;
+  set = false;
+
+  move(x: number, y: number): void {
+    this.x = x;
+    this.y = y;
+    if (!this.set) {
+      this.sx = this.lx = x;
+      this.sy = this.ly = y;
+      this.set = true;
+    }
+  }
+
+  update(): void {
+    this.sx += (this.x - this.sx) * 0.1;
+    this.sy += (this.y - this.sy) * 0.1;
+    const dx = this.x - this.lx,
+      dy = this.y - this.ly;
+    const d = Math.hypot(dx, dy);
+    this.v = d;
+    this.vs += (d - this.vs) * 0.1;
+    this.vs = Math.min(100, this.vs);
+    this.lx = this.x;
+    this.ly = this.y;
+    this.a = Math.atan2(dy, dx);
+  }
+}
@@ -0,0 +1,91 @@
+import {
+  sizeCanvas,
+  type AnyCanvas,
+  type Canvas2DContext,
+} from "@/lib/canvas/dpr";
+import type {
+  FrameSource,
+  FrameSubscription,
+} from "@/lib/scheduler/frameScheduler";
+import type { CanvasScene } from "./scenes/types";
+
+type FrameCallback = (time: number) => void;
+
+// Dedicated workers expose requestAnimationFrame in Chromium and Firefox;
+// elsewhere fall back to a 60Hz timer.
+const requestFrame = (callback: FrameCallback): number =>
+  typeof requestAnimationFrame === "function"
+    ? requestAnimationFrame(callback)
+    : (setTimeout(() => callback(performance.now()), 16) as unknown as number);
+
+const cancelFrame = (id: number): void => {
+  if (typeof cancelAnimationFrame === "function") cancelAnimationFrame(id);
+  else clearTimeout(id);
+};
+
+/**
+ * Drives a scene against a canvas: sizing, the frame loop and pausing.
+ * On the main thread it renders from the shared frame scheduler; inside the
+ * canvas worker, which has no scheduler, it runs its own frame loop.
+ */
+export class SceneLoop<Config> {
+  readonly scene: CanvasScene<Config>;
+  private readonly canvas: AnyCanvas;
+  private readonly ctx: Canvas2DContext;
+  private readonly onFrame?: FrameCallback;
+  private readonly frames?: FrameSource;
+  private subscription: FrameSubscription | null = null;
+  private frameId: number | null = null;
+  private running = false;
+
+  constructor(
+    canvas: AnyCanvas,
+    ctx: Canvas2DContext,
+    scene: CanvasScene<Config>,
+    onFrame?: FrameCallback,
+    frames?: FrameSource
+  ) {
+    this.canvas = canvas;
+    this.ctx = ctx;
+    this.scene = scene;
+    this.onFrame = onFrame;
+    this.frames = frames;
+  }
+
+  resize(width: number, height: number, dpr: number): void {
+    sizeCanvas(this.canvas, this.ctx, width, height, dpr);
+    this.scene.resize(width, height, dpr);
+  }
+
+  start(): void {
+    if (this.running) return;
+    this.running = true;
+    if (this.frames) {
+      // Decorative canvases yield first when a frame is over budget
+      this.subscription = this.frames.subscribe(this.render, {
+        priority: "background",
+      });
+    } else {
+      this.frameId = requestFrame(this.tick);
+    }
+  }
+
+  stop(): void {
+    this.running = false;
+    this.subscription?.unsubscribe();
+    this.subscription = null;
+    if (this.frameId !== null) cancelFrame(this.frameId);
+    this.frameId = null;
+  }
+
+  private render = (time: number): void => {
+    this.scene.render(time, this.ctx);
+    this.onFrame?.(time);
+  };
+
+  private tick = (time: number): void => {
+    if (!this.running) return;
+    this.render(time);
+    this.frameId = requestFrame(this.tick);
+  };
+}
@@ -0,0 +1,277 @@
+import { DotBatch } from "@/lib/canvas/dotBatch";
+import type { Canvas2DContext } from "@/lib/canvas/dpr";
+import type { CanvasScene } from "./types";
+
+interface Dot {
+  x: number;
+  y: number;
+  originalX: number;
+  originalY: number;
+  displacedX: number;
+  displacedY: number;
+  targetOpacity: number;
+  currentOpacity: number;
+  opacitySpeed: number;
+  baseRadius: number;
+  currentRadius: number;
+}
+
+// The dots field has no tunable props today; the scene still accepts a
+// config object so it shares the CanvasScene contract with Waves.
+export type DotsSceneConfig = Record<string, never>;
+
+const DOT_SPACING = 15;
+const BASE_OPACITY_MIN = 0.3;
+const BASE_OPACITY_MAX = 0.4;
+const BASE_RADIUS = 1.2;
+const DOT_COLOR = "rgb(156, 163, 175)";
+
+// Mouse interaction zones
+const DENSITY_RADIUS = 150; // Outer zone where dots become denser
+const REPULSION_RADIUS = 75; // Inner zone where dots repel
+const DENSITY_RADIUS_SQ = DENSITY_RADIUS * DENSITY_RADIUS;
+const REPULSION_RADIUS_SQ = REPULSION_RADIUS * REPULSION_RADIUS;
+
+const OPACITY_BOOST = 0.5;
+const RADIUS_BOOST = 2;
+const GRID_CELL_SIZE = Math.max(50, Math.floor(DENSITY_RADIUS / 1.5));
+const ATTRACTION_STRENGTH = 0.5; // For density zone
+const REPULSION_STRENGTH = 0.4; // For inner repulsion
+const MIN_DOT_DISTANCE = 8;
+const VIEWPORT_BUFFER = 100; // Extra pixels to render beyond viewport
+const LERP_FACTOR = 0.15;
+
+function randomBaseOpacity(): number {
+  return (
+    Math.random() * (BASE_OPACITY_MAX - BASE_OPACITY_MIN) + BASE_OPACITY_MIN
+  );
+}
+
+export class DotsScene implements CanvasScene<DotsSceneConfig> {
+  private dots: Dot[] = [];
+  // Dot indices bucketed by grid cell, cells stored row-major
+  private grid: number[][] = [];
+  private gridCols = 0;
+  private gridRows = 0;
+  // Frame stamp per dot marking it as near the cursor this frame
+  private nearStamp = new Uint32Array(0);
+  private frame = 0;
+  private mouseX: number | null = null;
+  private mouseY: number | null = null;
+  private width = 0;
+  private height = 0;
+  private spacing = DOT_SPACING;
+  private readonly batch = new DotBatch({
+    color: DOT_COLOR,
+    minRadius: BASE_RADIUS,
+    maxRadius: BASE_RADIUS + RADIUS_BOOST,
+    radiusLevels: 8,
+    opacityLevels: 32,
+  });
+
+  /** Number of dots in the current layout */
+  get dotCount(): number {
+    return this.dots.length;
+  }
+
+  setConfig(): void {}
+
+  resize(width: number, height: number): void {
+    const changed = width !== this.width || height !== this.height;
+    this.width = width;
+    this.height = height;
+    if (changed) this.createDots();
+  }
+
+  pointerMove(x: number, y: number): void {
+    this.mouseX = x;
+    this.mouseY = y;
+  }
+
+  pointerLeave(): void {
+    this.mouseX = null;
+    this.mouseY = null;
+  }
+
+  setDensity(density: number): void {
+    const spacing = DOT_SPACING / Math.sqrt(density);
+    if (spacing === this.spacing) return;
+    this.spacing = spacing;
+    this.createDots();
+  }
+
+  private createDots(): void {
+    const { width, height } = this;
+    this.dots = [];
+    this.grid = [];
+    if (width === 0 || height === 0) return;
+
+    const { spacing } = this;
+    const cols = Math.ceil(width / spacing);
+    const rows = Math.ceil(height / spacing);
+    this.gridCols = Math.ceil(width / GRID_CELL_SIZE) + 1;
+    this.gridRows = Math.ceil(height / GRID_CELL_SIZE) + 1;
+    for (let c = 0; c < this.gridCols * this.gridRows; c++) this.grid.push([]);
+
+    for (let i = 0; i < cols; i++) {
+      for (let j = 0; j < rows; j++) {
+        const x = i * spacing + spacing / 2;
+        const y = j * spacing + spacing / 2;
+        const cellX = Math.floor(x / GRID_CELL_SIZE);
+        const cellY = Math.floor(y / GRID_CELL_SIZE);
+        this.grid[cellY * this.gridCols + cellX].push(this.dots.length);
+
+        const baseOpacity = randomBaseOpacity();
+        this.dots.push({
+          x,
+          y,
+          originalX: x,
+          originalY: y,
+          displacedX: x,
+          displacedY: y,
+          targetOpacity: baseOpacity,
+          currentOpacity: baseOpacity,
+          opacitySpeed: Math.random() * 0.005 + 0.002,
+          baseRadius: BASE_RADIUS,
+          currentRadius: BASE_RADIUS,
+        });
+      }
+    }
+    this.nearStamp = new Uint32Array(this.dots.length);
+    this.frame = 0;
+  }
+
+  // Stamp every dot in the grid cells around the cursor for this frame
+  private markDotsNearMouse(mouseX: number, mouseY: number): number {
+    const frame = ++this.frame;
+    const mouseCellX = Math.floor(mouseX / GRID_CELL_SIZE);
+    const mouseCellY = Math.floor(mouseY / GRID_CELL_SIZE);
+    const searchRadius = Math.ceil(DENSITY_RADIUS / GRID_CELL_SIZE);
+    for (let i = -searchRadius; i <= searchRadius; i++) {
+      const cellX = mouseCellX + i;
+      if (cellX < 0 || cellX >= this.gridCols) continue;
+      for (let j = -searchRadius; j <= searchRadius; j++) {
+        const cellY = mouseCellY + j;
+        if (cellY < 0 || cellY >= this.gridRows) continue;
+        const cell = this.grid[cellY * this.gridCols + cellX];
+        for (let k = 0; k < cell.length; k++) this.nearStamp[cell[k]] = frame;
+      }
+    }
+    return frame;
+  }
+
+  render(_time: number, ctx: Canvas2DContext): number {
+    const { dots, width, height, batch, mouseX, mouseY } = this;
+    if (width === 0 || height === 0) return 0;
+
+    ctx.clearRect(0, 0, width, height);
+    batch.begin();
+
+    const hasMouse = mouseX !== null && mouseY !== null;
+    const nearFrame = hasMouse ? this.markDotsNearMouse(mouseX, mouseY) : -1;
+
+    for (let index = 0; index < dots.length; index++) {
+      const dot = dots[index];
+      // Skip dots outside viewport buffer for performance
+      if (
+        dot.x < -VIEWPORT_BUFFER ||
+        dot.x > width + VIEWPORT_BUFFER ||
+        dot.y < -VIEWPORT_BUFFER ||
+        dot.y > height + VIEWPORT_BUFFER
+      ) {
+        continue;
+      }
+
+      dot.currentOpacity += dot.opacitySpeed;
+      if (
+        dot.currentOpacity >= dot.targetOpacity ||
+        dot.currentOpacity <= BASE_OPACITY_MIN
+      ) {
+        dot.opacitySpeed = -dot.opacitySpeed;
+        dot.currentOpacity = Math.max(
+          BASE_OPACITY_MIN,
+          Math.min(dot.currentOpacity, BASE_OPACITY_MAX)
+        );
+        dot.targetOpacity = randomBaseOpacity();
+      }
+
+      let interactionFactor = 0;
+
+      // Calculate two-zone displacement
+      let displacementX = 0;
+      let displacementY = 0;
+
+      if (hasMouse && this.nearStamp[index] === nearFrame) {
+        const dx = dot.originalX - mouseX;
+        const dy = dot.originalY - mouseY;
+        const distSq = dx * dx + dy * dy;
+
+        if (distSq < DENSITY_RADIUS_SQ && distSq > 0) {
+          const distance = Math.sqrt(distSq);
+
+          // Visual interaction factor (opacity and size)
+          interactionFactor = Math.max(0, 1 - distance / DENSITY_RADIUS);
+          interactionFactor = interactionFactor * interactionFactor;
+
+          if (distSq < REPULSION_RADIUS_SQ) {
+            // Inner zone: repel dots
+            const repulsionInfluence = Math.max(
+              0,
+              1 - distance / REPULSION_RADIUS
+            );
+            const repulsionFactor =
+              repulsionInfluence * repulsionInfluence * REPULSION_STRENGTH;
+
+            // Push dots away from mouse
+            displacementX = dx * repulsionFactor;
+            displacementY = dy * repulsionFactor;
+
+            // Ensure minimum distance
+            const newDx = dot.originalX + displacementX - mouseX;
+            const newDy = dot.originalY + displacementY - mouseY;
+            const newDistSq = newDx * newDx + newDy * newDy;
+
+            if (newDistSq < MIN_DOT_DISTANCE * MIN_DOT_DISTANCE) {
+              const angle = Math.atan2(dy, dx);
+              displacementX =
+                mouseX + Math.cos(angle) * MIN_DOT_DISTANCE - dot.originalX;
+              displacementY =
+                mouseY + Math.sin(angle) * MIN_DOT_DISTANCE - dot.originalY;
+            }
+          } else {
+            // Outer zone: attract dots (create density)
+            const attractionInfluence = Math.max(
+              0,
+              (distance - REPULSION_RADIUS) /
+                (DENSITY_RADIUS - REPULSION_RADIUS)
+            );
+            const attractionFactor =
+              (1 - attractionInfluence) * ATTRACTION_STRENGTH;
+
+            // Pull dots towards mouse edge (but not into repulsion zone)
+            displacementX = -dx * attractionFactor * 0.3;
+            displacementY = -dy * attractionFactor * 0.3;
+          }
+        }
+      }
+
+      // Smooth interpolation to target position
+      dot.displacedX +=
+        (dot.originalX + displacementX - dot.displacedX) * LERP_FACTOR;
+      dot.displacedY +=
+        (dot.originalY + displacementY - dot.displacedY) * LERP_FACTOR;
+      dot.x = dot.displacedX;
+      dot.y = dot.displacedY;
+
+      const finalOpacity = Math.min(
+        1,
+        dot.currentOpacity + interactionFactor * OPACITY_BOOST
+      );
+      dot.currentRadius = dot.baseRadius + interactionFactor * RADIUS_BOOST;
+
+      batch.add(dot.x, dot.y, dot.currentRadius, finalOpacity);
+    }
+
+    return batch.flush(ctx);
+  }
+}
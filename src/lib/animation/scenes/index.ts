@@ -0,0 +1,31 @@
+import { DotsScene, type DotsSceneConfig } from "./dotsScene";
+import { WavesScene, type WavesSceneConfig } from "./wavesScene";
+import type { CanvasScene } from "./types";
+
+export { DotsScene, WavesScene };
+export type { CanvasScene, DotsSceneConfig, WavesSceneConfig };
+
+export interface SceneConfigs {
+  waves: WavesSceneConfig;
+  dots: DotsSceneConfig;
+}
+
+export type SceneName = keyof SceneConfigs;
+
+export function createScene<Name extends SceneName>(
+  name: Name,
+  config: SceneConfigs[Name]
+): CanvasScene<SceneConfigs[Name]> {
+  let scene: CanvasScene<WavesSceneConfig> | CanvasScene<DotsSceneConfig>;
+  switch (name) {
+    case "waves":
+      scene = new WavesScene(config as WavesSceneConfig);
+      break;
+    case "dots":
+      scene = new DotsScene();
+      break;
+    default:
+      throw new Error(`Unknown canvas scene: ${name}`);
+  }
+  return scene as unknown as CanvasScene<SceneConfigs[Name]>;
+}
@@ -0,0 +1,17 @@
+import type { Canvas2DContext } from "@/lib/canvas/dpr";
+
+// A scene owns the simulation and drawing for one background canvas. It has
+// no DOM dependencies so the same instance type can run on the main thread
+// or inside a worker against an OffscreenCanvas.
+export interface CanvasScene<Config> {
+  setConfig(config: Config): void;
+  /** Canvas size in CSS pixels; the context is already scaled by `dpr` */
+  resize(width: number, height: number, dpr: number): void;
+  /** Pointer position in canvas CSS pixels */
+  pointerMove(x: number, y: number): void;
+  pointerLeave(): void;
+  /** Fraction of the full dot density to draw, in (0, 1] */
+  setDensity(density: number): void;
+  /** Advance the simulation and draw. Returns the number of draw calls. */
+  render(time: number, ctx: Canvas2DContext): number;
+}
@@ -0,0 +1,142 @@
+import { DotBatch } from "@/lib/canvas/dotBatch";
+import type { Canvas2DContext } from "@/lib/canvas/dpr";
+import { PointerTracker } from "../pointerTracker";
+import { WaveField, type WaveFieldConfig } from "../waveField";
+import type { CanvasScene } from "./types";
+
+export interface WavesSceneConfig extends WaveFieldConfig {
+  lineColor: string;
+  xGap: number;
+  yGap: number;
+  dotSpacing: number;
+  dotSize: number;
+  gradientRadius: number;
+  gradientFalloff: number;
+}
+
+export class WavesScene implements CanvasScene<WavesSceneConfig> {
+  readonly pointer = new PointerTracker();
+  private readonly field = new WaveField();
+  private config: WavesSceneConfig;
+  private batch: DotBatch;
+  private width = 0;
+  private height = 0;
+  private density = 1;
+
+  constructor(config: WavesSceneConfig) {
+    this.config = config;
+    this.batch = WavesScene.createBatch(config);
+  }
+
+  /** Number of simulated wave points in the current layout */
+  get pointCount(): number {
+    return this.field.count;
+  }
+
+  private static createBatch({ lineColor, dotSize }: WavesSceneConfig) {
+    return new DotBatch({
+      color: lineColor,
+      minRadius: dotSize,
+      maxRadius: dotSize,
+      opacityLevels: 16,
+    });
+  }
+
+  setConfig(config: WavesSceneConfig): void {
+    const previous = this.config;
+    this.config = config;
+    if (
+      previous.lineColor !== config.lineColor ||
+      previous.dotSize !== config.dotSize
+    ) {
+      this.batch = WavesScene.createBatch(config);
+    }
+    if (previous.xGap !== config.xGap || previous.yGap !== config.yGap) {
+      this.layout();
+    }
+  }
+
+  resize(width: number, height: number): void {
+    this.width = width;
+    this.height = height;
+    this.layout();
+  }
+
+  pointerMove(x: number, y: number): void {
+    this.pointer.move(x, y);
+  }
+
+  pointerLeave(): void {}
+
+  setDensity(density: number): void {
+    this.density = density;
+  }
+
+  render(time: number, ctx: Canvas2DContext): number {
+    this.pointer.update();
+    this.field.step(time, this.pointer, this.config);
+    return this.draw(ctx);
+  }
+
+  private layout(): void {
+    const { xGap, yGap } = this.config;
+    this.field.resize(this.width, this.height, xGap, yGap);
+  }
+
+  private draw(ctx: Canvas2DContext): number {
+    const { dotSpacing, dotSize, gradientRadius, gradientFalloff } =
+      this.config;
+    const { pointer, field, batch } = this;
+    const { lines, rows, baseX, baseY, waveX, waveY, cursorX, cursorY } =
+      field;
+
+    ctx.clearRect(0, 0, this.width, this.height);
+    batch.begin();
+
+    for (let line = 0; line < lines; line++) {
+      const offset = line * rows;
+      for (let i = 0; i < rows - 1; i++) {
+        const isLast = i === rows - 2;
+        const a = offset + i,
+          b = a + 1;
+        // The first and last segment endpoints stay pinned to the wave so
+        // the line ends don't follow the cursor.
+        const c1 = !isLast && i !== 0 ? 1 : 0;
+        const c2 = !isLast ? 1 : 0;
+        const x1 =
+          Math.round((baseX[a] + waveX[a] + cursorX[a] * c1) * 10) / 10;
+        const y1 =
+          Math.round((baseY[a] + waveY[a] + cursorY[a] * c1) * 10) / 10;
+        const x2 =
+          Math.round((baseX[b] + waveX[b] + cursorX[b] * c2) * 10) / 10;
+        const y2 =
+          Math.round((baseY[b] + waveY[b] + cursorY[b] * c2) * 10) / 10;
+
+        const dx = x2 - x1;
+        const dy = y2 - y1;
+        const distance = Math.sqrt(dx * dx + dy * dy);
+        const steps = Math.floor((distance * this.density) / dotSpacing);
+
+        for (let j = 0; j <= steps; j++) {
+          const t = j / (steps || 1);
+          const x = x1 + dx * t;
+          const y = y1 + dy * t;
+
+          // Fade dots out beyond the gradient radius around the cursor
+          const mx = x - pointer.sx,
+            my = y - pointer.sy;
+          const mouseDistance = Math.sqrt(mx * mx + my * my);
+          let opacity = 1;
+          if (mouseDistance > gradientRadius) {
+            const fadeDistance = mouseDistance - gradientRadius;
+            opacity = Math.max(0, 1 - fadeDistance / gradientFalloff);
+          }
+
+          batch.add(x, y, dotSize, opacity);
+        }
+      }
+    }
+
+    return batch.flush(ctx);
+  }
+}
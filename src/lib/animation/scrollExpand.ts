@@ -0,0 +1,199 @@
+// Gesture state and geometry for the ScrollHero media expansion.
+//
+// While the media is collapsed the page is pinned at the top and wheel or
+// touch movement drives `progress` from 0 to 1 instead of scrolling. Once
+// fully expanded, a small extra buffer of scrolling is swallowed before
+// the page is allowed to move, and scrolling back up at the top of the
+// page collapses the media again. Nothing here touches the DOM; the
+// component feeds events in and writes `expandFrame` output to styles.
+
+/** Extra scroll (px) swallowed after full expansion before the page moves */
+export const SCROLL_BUFFER_THRESHOLD = 40;
+
+const WHEEL_FACTOR = 0.0009;
+const TOUCH_FACTOR_DOWN = 0.005;
+const TOUCH_FACTOR_UP = 0.008;
+// How far from the top the page may be and still collapse the media
+const TOP_TOLERANCE_PX = 5;
+const COLLAPSE_SWIPE_PX = 20;
+
+const clamp01 = (value: number): number => Math.min(Math.max(value, 0), 1);
+
+export class ScrollExpandGesture {
+  progress = 0;
+  expanded = false;
+  private buffer = 0;
+  private touchStartY = 0;
+  private pendingWheel: number | null = null;
+  private readonly onChange: () => void;
+
+  /** `onChange` runs whenever progress or the expanded state changes */
+  constructor(onChange: () => void) {
+    this.onChange = onChange;
+  }
+
+  reset(): void {
+    this.progress = 0;
+    this.expanded = false;
+    this.buffer = 0;
+    this.pendingWheel = null;
+    this.onChange();
+  }
+
+  /**
+   * Jump to the fully expanded state with the buffer spent, for a page
+   * that is already scrolled down when the gesture starts.
+   */
+  expand(): void {
+    this.progress = 1;
+    this.expanded = true;
+    this.buffer = SCROLL_BUFFER_THRESHOLD;
+    this.pendingWheel = null;
+    this.onChange();
+  }
+
+  /** Returns true when the event's default scrolling must be prevented */
+  wheel(deltaY: number, scrollY: number): boolean {
+    if (this.expanded) {
+      if (deltaY < 0 && scrollY <= TOP_TOLERANCE_PX) {
+        this.collapse();
+        return true;
+      }
+      if (deltaY > 0 && this.buffer < SCROLL_BUFFER_THRESHOLD) {
+        this.fillBuffer(deltaY);
+        return true;
+      }
+      return false;
+    }
+    // The expansion speed is tuned for one wheel step per frame, so
+    // further events within the same frame are dropped.
+    if (this.pendingWheel === null) {
+      this.pendingWheel = deltaY;
+      this.onChange();
+    }
+    return true;
+  }
+
+  touchStart(y: number): void {
+    this.touchStartY = y;
+  }
+
+  /** Returns true when the event's default scrolling must be prevented */
+  touchMove(y: number, scrollY: number): boolean {
+    if (!this.touchStartY) return false;
+    const deltaY = this.touchStartY - y;
+
+    if (this.expanded) {
+      if (deltaY < -COLLAPSE_SWIPE_PX && scrollY <= TOP_TOLERANCE_PX) {
+        this.collapse();
+        return true;
+      }
+      if (deltaY > 0) {
+        this.touchStartY = y;
+        if (this.buffer < SCROLL_BUFFER_THRESHOLD) {
+          this.fillBuffer(deltaY);
+          return true;
+        }
+      }
+      return false;
+    }
+
+    const factor = deltaY < 0 ? TOUCH_FACTOR_UP : TOUCH_FACTOR_DOWN;
+    this.touchStartY = y;
+    this.advance(deltaY * factor);
+    return true;
+  }
+
+  touchEnd(): void {
+    this.touchStartY = 0;
+  }
+
+  /** Apply the wheel step queued for this frame, if any */
+  flush(): void {
+    if (this.pendingWheel === null) return;
+    const deltaY = this.pendingWheel;
+    this.pendingWheel = null;
+    if (!this.expanded) this.advance(deltaY * WHEEL_FACTOR);
+  }
+
+  private advance(delta: number): void {
+    const next = clamp01(this.progress + delta);
+    if (next === this.progress) return;
+    this.progress = next;
+    if (next >= 1) {
+      this.expanded = true;
+      this.buffer = 0;
+    }
+    this.onChange();
+  }
+
+  private collapse(): void {
+    this.expanded = false;
+    this.buffer = 0;
+    this.onChange();
+  }
+
+  private fillBuffer(delta: number): void {
+    this.buffer = Math.min(
+      this.buffer + Math.abs(delta),
+      SCROLL_BUFFER_THRESHOLD
+    );
+  }
+}
+
+export interface ExpandFrame {
+  clipPath: string;
+  /** Position of the media centre, in percent of its container */
+  topPercent: number;
+  leftPercent: number;
+  /** Whether the media has grown enough to cast a drop shadow */
+  shadow: boolean;
+}
+
+// Circle size relative to the media box, by media width breakpoint
+function initialCircleScale(width: number): number {
+  if (width < 768) return 0.4; // mobile
+  if (width < 1280) return 0.45; // small laptop
+  if (width < 1536) return 0.5; // laptop
+  return 0.6; // desktop
+}
+
+// Starting position, lower on small screens to keep clear of the heading
+function startPercent(width: number): number {
+  if (width < 768) return 75; // mobile - further down
+  if (width < 1280) return 70; // small laptop - lower to avoid text
+  if (width < 1536) return 67; // laptop
+  return 65; // desktop
+}
+
+const END_PERCENT = 50;
+const END_CORNER_PX = 60; // rounded-rect corner at end
+const SHADOW_FROM_PROGRESS = 0.7;
+
+/**
+ * Media mask and position for `progress` in a box of `width` x `height`
+ * px: a circle at 0 that morphs into a full rounded rectangle at 1.
+ */
+export function expandFrame(
+  progress: number,
+  width: number,
+  height: number
+): ExpandFrame {
+  const initialSquare = Math.max(
+    50,
+    Math.min(height, width) * initialCircleScale(width)
+  );
+  const insetX = Math.max((width - initialSquare) / 2, 0) * (1 - progress);
+  const insetY = Math.max((height - initialSquare) / 2, 0) * (1 - progress);
+  const startCorner = initialSquare / 2; // perfect circle at start
+  const corner = startCorner + (END_CORNER_PX - startCorner) * progress;
+  const start = startPercent(width);
+  const position = start + (END_PERCENT - start) * progress;
+
+  return {
+    clipPath: `inset(${insetY}px ${insetX}px ${insetY}px ${insetX}px round ${corner}px)`,
+    topPercent: position,
+    leftPercent: position,
+    shadow: progress > SHADOW_FROM_PROGRESS,
+  };
+}
@@ -0,0 +1,249 @@
+import { Noise } from "./noise";
+
+// Struct-of-arrays simulation core for the Waves background.
+//
+// Every grid point's state lives in preallocated Float32Arrays indexed by
+// `line * rows + point`. A frame only touches the points inside the grid
+// window around the smoothed cursor plus the points that are still settling
+// back to rest, and the noise pass is skipped when both wave amplitudes are
+// zero. Nothing is allocated per frame; buffers only grow on resize.
+
+export interface WaveFieldConfig {
+  waveSpeedX: number;
+  waveSpeedY: number;
+  waveAmpX: number;
+  waveAmpY: number;
+  friction: number;
+  tension: number;
+  maxCursorMove: number;
+}
+
+export interface WavePointer {
+  /** Smoothed cursor position in canvas space */
+  sx: number;
+  sy: number;
+  /** Smoothed cursor velocity */
+  vs: number;
+  /** Cursor heading in radians */
+  a: number;
+  /** False until the first pointer event arrives */
+  set: boolean;
+}
+
+const CURSOR_RADIUS = 175;
+// Below this (in px and px/frame) a point is considered at rest and snapped
+// to zero. Drawing rounds positions to 0.1px, so this is invisible.
+const SETTLE_EPSILON = 0.005;
+
+export class WaveField {
+  /** Number of vertical lines */
+  lines = 0;
+  /** Number of points per line */
+  rows = 0;
+  count = 0;
+
+  xStart = 0;
+  yStart = 0;
+  xGap = 1;
+  yGap = 1;
+
+  baseX = new Float32Array(0);
+  baseY = new Float32Array(0);
+  waveX = new Float32Array(0);
+  waveY = new Float32Array(0);
+  cursorX = new Float32Array(0);
+  cursorY = new Float32Array(0);
+  cursorVX = new Float32Array(0);
+  cursorVY = new Float32Array(0);
+
+  private active = new Uint32Array(0);
+  private activeCount = 0;
+  private mark = new Uint32Array(0);
+  private frame = 0;
+  private waveDirty = false;
+  private readonly noise: Noise;
+
+  constructor(seed = Math.random()) {
+    this.noise = new Noise(seed);
+  }
+
+  /** Number of points currently being integrated (cursor window + settling) */
+  get activePoints(): number {
+    return this.activeCount;
+  }
+
+  /**
+   * Lay the grid out for a canvas of the given CSS size. The grid overscans
+   * 200px horizontally and 30px vertically, matching the original layout.
+   */
+  resize(width: number, height: number, xGap: number, yGap: number): void {
+    const oWidth = width + 200,
+      oHeight = height + 30;
+    const totalLines = Math.ceil(oWidth / xGap);
+    const totalPoints = Math.ceil(oHeight / yGap);
+
+    this.lines = totalLines + 1;
+    this.rows = totalPoints + 1;
+    this.count = this.lines * this.rows;
+    this.xGap = xGap;
+    this.yGap = yGap;
+    this.xStart = (width - xGap * totalLines) / 2;
+    this.yStart = (height - yGap * totalPoints) / 2;
+
+    if (this.baseX.length < this.count) {
+      const n = this.count;
+      this.baseX = new Float32Array(n);
+      this.baseY = new Float32Array(n);
+      this.waveX = new Float32Array(n);
+      this.waveY = new Float32Array(n);
+      this.cursorX = new Float32Array(n);
+      this.cursorY = new Float32Array(n);
+      this.cursorVX = new Float32Array(n);
+      this.cursorVY = new Float32Array(n);
+      this.active = new Uint32Array(n);
+      this.mark = new Uint32Array(n);
+    } else {
+      this.waveX.fill(0);
+      this.waveY.fill(0);
+      this.cursorX.fill(0);
+      this.cursorY.fill(0);
+      this.cursorVX.fill(0);
+      this.cursorVY.fill(0);
+      this.mark.fill(0);
+    }
+    this.activeCount = 0;
+    this.frame = 0;
+    this.waveDirty = false;
+
+    for (let i = 0; i < this.lines; i++) {
+      const x = this.xStart + xGap * i;
+      const offset = i * this.rows;
+      for (let j = 0; j < this.rows; j++) {
+        this.baseX[offset + j] = x;
+        this.baseY[offset + j] = this.yStart + yGap * j;
+      }
+    }
+  }
+
+  step(time: number, pointer: WavePointer, config: WaveFieldConfig): void {
+    if (this.count === 0) return;
+    this.stepWaves(time, config);
+    this.stepCursor(pointer, config);
+  }
+
+  private stepWaves(time: number, config: WaveFieldConfig): void {
+    const { waveSpeedX, waveSpeedY, waveAmpX, waveAmpY } = config;
+    const { waveX, waveY } = this;
+
+    if (waveAmpX === 0 && waveAmpY === 0) {
+      if (this.waveDirty) {
+        waveX.fill(0);
+        waveY.fill(0);
+        this.waveDirty = false;
+      }
+      return;
+    }
+
+    const { baseX, baseY, noise, count } = this;
+    const tx = time * waveSpeedX,
+      ty = time * waveSpeedY;
+    for (let k = 0; k < count; k++) {
+      const move =
+        noise.perlin2((baseX[k] + tx) * 0.002, (baseY[k] + ty) * 0.0015) * 12;
+      waveX[k] = Math.cos(move) * waveAmpX;
+      waveY[k] = Math.sin(move) * waveAmpY;
+    }
+    this.waveDirty = true;
+  }
+
+  private stepCursor(pointer: WavePointer, config: WaveFieldConfig): void {
+    const { friction, tension, maxCursorMove } = config;
+    const { baseX, baseY, cursorX, cursorY, cursorVX, cursorVY } = this;
+    const { active, mark, rows, xStart, yStart, xGap, yGap } = this;
+    const frame = ++this.frame;
+    const previousCount = this.activeCount;
+    let count = 0;
+
+    // Carry over points that were still moving last frame.
+    for (let k = 0; k < previousCount; k++) {
+      const idx = active[k];
+      mark[idx] = frame;
+      active[count++] = idx;
+    }
+
+    // Apply the cursor impulse to points inside its radius, visiting only
+    // the grid cells that can intersect it.
+    if (pointer.set && pointer.vs > 0) {
+      const l = Math.max(CURSOR_RADIUS, pointer.vs);
+      const l2 = l * l;
+      const impulse = l * pointer.vs * 0.00025;
+      const ix = Math.cos(pointer.a) * impulse,
+        iy = Math.sin(pointer.a) * impulse;
+      const i0 = Math.max(0, Math.floor((pointer.sx - l - xStart) / xGap));
+      const i1 = Math.min(
+        this.lines - 1,
+        Math.ceil((pointer.sx + l - xStart) / xGap)
+      );
+      const j0 = Math.max(0, Math.floor((pointer.sy - l - yStart) / yGap));
+      const j1 = Math.min(
+        rows - 1,
+        Math.ceil((pointer.sy + l - yStart) / yGap)
+      );
+
+      for (let i = i0; i <= i1; i++) {
+        const offset = i * rows;
+        for (let j = j0; j <= j1; j++) {
+          const idx = offset + j;
+          const dx = baseX[idx] - pointer.sx,
+            dy = baseY[idx] - pointer.sy;
+          const d2 = dx * dx + dy * dy;
+          if (d2 >= l2) continue;
+          const dist = Math.sqrt(d2);
+          const f = Math.cos(dist * 0.001) * (1 - dist / l);
+          cursorVX[idx] += ix * f;
+          cursorVY[idx] += iy * f;
+          if (mark[idx] !== frame) {
+            mark[idx] = frame;
+            active[count++] = idx;
+          }
+        }
+      }
+    }
+
+    // Integrate the spring for every active point and drop the ones that
+    // have come to rest.
+    let kept = 0;
+    for (let k = 0; k < count; k++) {
+      const idx = active[k];
+      let vx = cursorVX[idx],
+        vy = cursorVY[idx],
+        x = cursorX[idx],
+        y = cursorY[idx];
+      vx = (vx - x * tension) * friction;
+      vy = (vy - y * tension) * friction;
+      x += vx * 2;
+      y += vy * 2;
+      if (x > maxCursorMove) x = maxCursorMove;
+      else if (x < -maxCursorMove) x = -maxCursorMove;
+      if (y > maxCursorMove) y = maxCursorMove;
+      else if (y < -maxCursorMove) y = -maxCursorMove;
+
+      if (
+        Math.abs(x) < SETTLE_EPSILON &&
+        Math.abs(y) < SETTLE_EPSILON &&
+        Math.abs(vx) < SETTLE_EPSILON &&
+        Math.abs(vy) < SETTLE_EPSILON
+      ) {
+        cursorX[idx] = cursorY[idx] = cursorVX[idx] = cursorVY[idx] = 0;
+        continue;
+      }
+
+      cursorX[idx] = x;
+      cursorY[idx] = y;
+      cursorVX[idx] = vx;
+      cursorVY[idx] = vy;
+      active[kept++] = idx;
+    }
+    this.activeCount = kept;
+  }
+}
@@ -0,0 +1,84 @@
+import { createScene, type SceneName } from "../scenes";
+import { SceneLoop } from "../sceneLoop";
+import {
+  SharedPointer,
+  WorkerOp,
+  opcodeOf,
+  type ConfigMessage,
+  type InitMessage,
+  type WorkerMessage,
+} from "./protocol";
+
+// Worker entry for background canvases. Owns the OffscreenCanvas transferred
+// from the page and runs the scene's simulation and rasterization off the
+// main thread.
+
+let loop: SceneLoop<unknown> | null = null;
+let sharedPointer: SharedPointer | null = null;
+
+function pollSharedPointer(): void {
+  if (!sharedPointer || !loop) return;
+  const update = sharedPointer.read();
+  if (update === "move") {
+    loop.scene.pointerMove(sharedPointer.x, sharedPointer.y);
+  } else if (update === "leave") {
+    loop.scene.pointerLeave();
+  }
+}
+
+function init(message: InitMessage<SceneName>): void {
+  const ctx = message.canvas.getContext("2d");
+  // Thrown so the page sees an error event and falls back to main thread
+  if (!ctx) throw new Error("No 2D context for the transferred canvas");
+  const scene = createScene(message.scene, message.config);
+  sharedPointer = message.pointerBuffer
+    ? new SharedPointer(message.pointerBuffer)
+    : null;
+  loop = new SceneLoop<unknown>(
+    message.canvas,
+    ctx,
+    scene,
+    // Shared pointer memory is sampled once per frame, after rendering, so
+    // the next frame sees the latest position.
+    sharedPointer ? pollSharedPointer : undefined
+  );
+  loop.resize(message.width, message.height, message.dpr);
+  loop.start();
+}
+
+self.addEventListener("message", (event: MessageEvent<WorkerMessage>) => {
+  const message = event.data;
+  switch (opcodeOf(message)) {
+    case WorkerOp.Init:
+      init(message as InitMessage);
+      return;
+    case WorkerOp.Config:
+      loop?.scene.setConfig((message as ConfigMessage).config);
+      return;
+  }
+
+  if (!loop || !Array.isArray(message)) return;
+  switch (message[0]) {
+    case WorkerOp.Resize:
+      loop.resize(message[1], message[2], message[3]);
+      break;
+    case WorkerOp.Pointer:
+      loop.scene.pointerMove(message[1], message[2]);
+      break;
+    case WorkerOp.PointerLeave:
+      loop.scene.pointerLeave();
+      break;
+    case WorkerOp.Density:
+      loop.scene.setDensity(message[1]);
+      break;
+    case WorkerOp.Visibility:
+      if (message[1]) loop.start();
+      else loop.stop();
+      break;
+    case WorkerOp.Dispose:
+      loop.stop();
+      loop = null;
+      self.close();
+      break;
+  }
+});
@@ -0,0 +1,202 @@
+import assert from "node:assert/strict";
+import { describe, it } from "node:test";
+import {
+  POINTER_BUFFER_BYTES,
+  SharedPointer,
+  WorkerOp,
+  encodeDensity,
+  encodeDispose,
+  encodePointer,
+  encodePointerLeave,
+  encodeResize,
+  encodeVisibility,
+  onWorkerFailure,
+  opcodeOf,
+  type WorkerMessage,
+} from "./protocol";
+
+describe("WorkerOp", () => {
+  it("uses a distinct code per message", () => {
+    const codes = Object.values(WorkerOp);
+    assert.equal(new Set(codes).size, codes.length);
+  });
+});
+
+describe("encoders", () => {
+  it("encodes resize", () => {
+    assert.deepEqual(encodeResize(1280, 720, 2), [
+      WorkerOp.Resize,
+      1280,
+      720,
+      2,
+    ]);
+  });
+
+  it("encodes pointer moves", () => {
+    assert.deepEqual(encodePointer(12.5, -3), [WorkerOp.Pointer, 12.5, -3]);
+  });
+
+  it("encodes pointer leave", () => {
+    assert.deepEqual(encodePointerLeave(), [WorkerOp.PointerLeave]);
+  });
+
+  it("encodes visibility as 0 or 1", () => {
+    assert.deepEqual(encodeVisibility(true), [WorkerOp.Visibility, 1]);
+    assert.deepEqual(encodeVisibility(false), [WorkerOp.Visibility, 0]);
+  });
+
+  it("encodes dispose", () => {
+    assert.deepEqual(encodeDispose(), [WorkerOp.Dispose]);
+  });
+
+  it("encodes density", () => {
+    assert.deepEqual(encodeDensity(0.5), [WorkerOp.Density, 0.5]);
+  });
+});
+
+describe("opcodeOf", () => {
+  it("reads the opcode of every tuple message", () => {
+    assert.equal(opcodeOf(encodeResize(1, 1, 1)), WorkerOp.Resize);
+    assert.equal(opcodeOf(encodePointer(0, 0)), WorkerOp.Pointer);
+    assert.equal(opcodeOf(encodePointerLeave()), WorkerOp.PointerLeave);
+    assert.equal(opcodeOf(encodeVisibility(true)), WorkerOp.Visibility);
+    assert.equal(opcodeOf(encodeDispose()), WorkerOp.Dispose);
+    assert.equal(opcodeOf(encodeDensity(1)), WorkerOp.Density);
+  });
+
+  it("reads the opcode of object messages", () => {
+    const init = {
+      op: WorkerOp.Init,
+      scene: "dots",
+      canvas: {},
+      config: {},
+      width: 1,
+      height: 1,
+      dpr: 1,
+      pointerBuffer: null,
+    } as unknown as WorkerMessage;
+    const config = { op: WorkerOp.Config, config: {} } as WorkerMessage;
+    assert.equal(opcodeOf(init), WorkerOp.Init);
+    assert.equal(opcodeOf(config), WorkerOp.Config);
+  });
+});
+
+describe("SharedPointer", () => {
+  // Writer and reader live on different threads and only share the buffer
+  function pair() {
+    const buffer = new ArrayBuffer(POINTER_BUFFER_BYTES);
+    return {
+      buffer,
+      writer: new SharedPointer(buffer),
+      reader: new SharedPointer(buffer),
+    };
+  }
+
+  it("reports nothing before the first write", () => {
+    const { reader } = pair();
+    assert.equal(reader.read(), null);
+  });
+
+  it("reports a move once per write", () => {
+    const { writer, reader } = pair();
+    writer.write(10, 20);
+    assert.equal(reader.read(), "move");
+    assert.equal(reader.x, 10);
+    assert.equal(reader.y, 20);
+    assert.equal(reader.read(), null);
+  });
+
+  it("coalesces writes between reads into the latest position", () => {
+    const { writer, reader } = pair();
+    writer.write(1, 2);
+    writer.write(3, 4);
+    assert.equal(reader.read(), "move");
+    assert.deepEqual([reader.x, reader.y], [3, 4]);
+    assert.equal(reader.read(), null);
+  });
+
+  it("reports a leave once", () => {
+    const { writer, reader } = pair();
+    writer.write(5, 5);
+    reader.read();
+    writer.leave();
+    assert.equal(reader.read(), "leave");
+    assert.equal(reader.read(), null);
+  });
+
+  it("lets the last update win between reads", () => {
+    const { writer, reader } = pair();
+    writer.write(5, 5);
+    writer.leave();
+    assert.equal(reader.read(), "leave");
+
+    writer.leave();
+    writer.write(7, 8);
+    assert.equal(reader.read(), "move");
+    assert.deepEqual([reader.x, reader.y], [7, 8]);
+  });
+
+  it("tracks the last read per reader", () => {
+    const { buffer, writer, reader } = pair();
+    const other = new SharedPointer(buffer);
+    writer.write(1, 1);
+    assert.equal(reader.read(), "move");
+    assert.equal(other.read(), "move");
+  });
+});
+
+// Stands in for a Worker that has been sent Init: posted messages are
+// recorded and failures are dispatched by the test.
+class FakeWorker extends EventTarget {
+  posted: unknown[] = [];
+  postMessage(message: unknown) {
+    this.posted.push(message);
+  }
+  fail(type: "error" | "messageerror", error?: unknown) {
+    const event = new Event(type, { cancelable: true });
+    Object.assign(event, { error });
+    this.dispatchEvent(event);
+    return event;
+  }
+}
+
+describe("onWorkerFailure", () => {
+  it("reports a worker that throws after init", () => {
+    const worker = new FakeWorker();
+    const failures: unknown[] = [];
+    onWorkerFailure(worker, (reason) => failures.push(reason));
+    worker.postMessage(encodeResize(100, 100, 1));
+
+    const boom = new Error("scene init failed");
+    const event = worker.fail("error", boom);
+    assert.deepEqual(failures, [boom]);
+    assert.equal(event.defaultPrevented, true);
+  });
+
+  it("reports messages the worker couldn't deserialize", () => {
+    const worker = new FakeWorker();
+    const failures: unknown[] = [];
+    onWorkerFailure(worker, (reason) => failures.push(reason));
+    worker.fail("messageerror");
+    assert.deepEqual(failures, ["messageerror"]);
+  });
+
+  it("reports once", () => {
+    const worker = new FakeWorker();
+    let calls = 0;
+    onWorkerFailure(worker, () => calls++);
+    worker.fail("error");
+    worker.fail("messageerror");
+    assert.equal(calls, 1);
+  });
+
+  it("stops listening when unsubscribed", () => {
+    const worker = new FakeWorker();
+    let calls = 0;
+    const stop = onWorkerFailure(worker, () => calls++);
+    stop();
+    const event = worker.fail("error");
+    assert.equal(calls, 0);
+    assert.equal(event.defaultPrevented, false);
+  });
+});
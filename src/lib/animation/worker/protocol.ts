@@ -0,0 +1,173 @@
+import type { SceneConfigs, SceneName } from "../scenes";
+
+// Message protocol between the main thread and the canvas worker.
+//
+// Init and config updates are rare and sent as objects. Everything that
+// fires during interaction (pointer, resize, visibility) is a short numeric
+// tuple keyed by opcode so the structured clone stays tiny. When the page is
+// cross-origin isolated, pointer updates skip postMessage entirely and go
+// through a SharedPointer backed by a SharedArrayBuffer.
+
+export const WorkerOp = {
+  Init: 0,
+  Config: 1,
+  Resize: 2,
+  Pointer: 3,
+  PointerLeave: 4,
+  Visibility: 5,
+  Dispose: 6,
+  Density: 7,
+} as const;
+
+export type WorkerOpCode = (typeof WorkerOp)[keyof typeof WorkerOp];
+
+export interface InitMessage<Name extends SceneName = SceneName> {
+  op: typeof WorkerOp.Init;
+  scene: Name;
+  canvas: OffscreenCanvas;
+  config: SceneConfigs[Name];
+  width: number;
+  height: number;
+  dpr: number;
+  /** Present when pointer updates are shared instead of posted */
+  pointerBuffer: SharedArrayBuffer | null;
+}
+
+export interface ConfigMessage<Name extends SceneName = SceneName> {
+  op: typeof WorkerOp.Config;
+  config: SceneConfigs[Name];
+}
+
+export type ResizeMessage = [
+  op: typeof WorkerOp.Resize,
+  width: number,
+  height: number,
+  dpr: number,
+];
+export type PointerMessage = [
+  op: typeof WorkerOp.Pointer,
+  x: number,
+  y: number,
+];
+export type PointerLeaveMessage = [op: typeof WorkerOp.PointerLeave];
+export type VisibilityMessage = [
+  op: typeof WorkerOp.Visibility,
+  visible: 0 | 1,
+];
+export type DisposeMessage = [op: typeof WorkerOp.Dispose];
+export type DensityMessage = [op: typeof WorkerOp.Density, density: number];
+
+export type WorkerMessage =
+  | InitMessage
+  | ConfigMessage
+  | ResizeMessage
+  | PointerMessage
+  | PointerLeaveMessage
+  | VisibilityMessage
+  | DisposeMessage
+  | DensityMessage;
+
+export function opcodeOf(message: WorkerMessage): WorkerOpCode {
+  return Array.isArray(message) ? message[0] : message.op;
+}
+
+export const encodeResize = (
+  width: number,
+  height: number,
+  dpr: number
+): ResizeMessage => [WorkerOp.Resize, width, height, dpr];
+
+export const encodePointer = (x: number, y: number): PointerMessage => [
+  WorkerOp.Pointer,
+  x,
+  y,
+];
+
+export const encodePointerLeave = (): PointerLeaveMessage => [
+  WorkerOp.PointerLeave,
+];
+
+export const encodeVisibility = (visible: boolean): VisibilityMessage => [
+  WorkerOp.Visibility,
+  visible ? 1 : 0,
+];
+
+export const encodeDispose = (): DisposeMessage => [WorkerOp.Dispose];
+
+export const encodeDensity = (density: number): DensityMessage => [
+  WorkerOp.Density,
+  density,
+];
+
+type WorkerEvents = Pick<Worker, "addEventListener" | "removeEventListener">;
+
+/**
+ * Call `onFailure` once, on the first uncaught error in `worker` (a failed
+ * chunk load, or a scene throwing during Init) or message it couldn't
+ * deserialize. Returns a function that stops listening.
+ */
+export function onWorkerFailure(
+  worker: WorkerEvents,
+  onFailure: (reason: unknown) => void
+): () => void {
+  const handle = (event: Event) => {
+    stop();
+    // Reported by the caller; keep it from surfacing as uncaught as well
+    event.preventDefault();
+    const { error, message } = event as ErrorEvent;
+    onFailure(error ?? message ?? event.type);
+  };
+  const stop = () => {
+    worker.removeEventListener("error", handle);
+    worker.removeEventListener("messageerror", handle);
+  };
+  worker.addEventListener("error", handle);
+  worker.addEventListener("messageerror", handle);
+  return stop;
+}
+
+// Shared pointer layout: two float32 coordinates followed by two int32
+// words, [inside, sequence]. The writer bumps the sequence after updating
+// the coordinates so the reader only acts on new values.
+export const POINTER_BUFFER_BYTES = 16;
+
+export type SharedPointerUpdate = "move" | "leave" | null;
+
+export class SharedPointer {
+  private readonly coords: Float32Array;
+  private readonly state: Int32Array;
+  private lastSeen = 0;
+
+  constructor(buffer: SharedArrayBuffer | ArrayBuffer) {
+    this.coords = new Float32Array(buffer, 0, 2);
+    this.state = new Int32Array(buffer, 8, 2);
+  }
+
+  get x(): number {
+    return this.coords[0];
+  }
+
+  get y(): number {
+    return this.coords[1];
+  }
+
+  write(x: number, y: number): void {
+    this.coords[0] = x;
+    this.coords[1] = y;
+    Atomics.store(this.state, 0, 1);
+    Atomics.add(this.state, 1, 1);
+  }
+
+  leave(): void {
+    Atomics.store(this.state, 0, 0);
+    Atomics.add(this.state, 1, 1);
+  }
+
+  /** Returns what changed since the last read, if anything */
+  read(): SharedPointerUpdate {
+    const seq = Atomics.load(this.state, 1);
+    if (seq === this.lastSeen) return null;
+    this.lastSeen = seq;
+    return Atomics.load(this.state, 0) === 1 ? "move" : "leave";
+  }
+}
@@ -0,0 +1,115 @@
+import assert from "node:assert/strict";
+import { describe, it } from "node:test";
+import {
+  detectCanvasCapabilities,
+  selectRenderMode,
+  type CanvasCapabilities,
+  type CapabilityScope,
+} from "./renderMode";
+
+class FakeCanvas {
+  transferControlToOffscreen(): void {}
+}
+
+// A cross-origin isolated browser with everything worker mode needs
+function fullScope(): CapabilityScope {
+  return {
+    Worker: class {},
+    OffscreenCanvas: class {},
+    HTMLCanvasElement: FakeCanvas,
+    SharedArrayBuffer,
+    crossOriginIsolated: true,
+  };
+}
+
+const ALL_CAPABILITIES: CanvasCapabilities = {
+  worker: true,
+  offscreenCanvas: true,
+  transferControl: true,
+  sharedMemory: true,
+};
+
+describe("detectCanvasCapabilities", () => {
+  it("reports every capability of a full scope", () => {
+    assert.deepEqual(detectCanvasCapabilities(fullScope()), ALL_CAPABILITIES);
+  });
+
+  it("reports nothing for an empty scope", () => {
+    assert.deepEqual(detectCanvasCapabilities({}), {
+      worker: false,
+      offscreenCanvas: false,
+      transferControl: false,
+      sharedMemory: false,
+    });
+  });
+
+  const missing = [
+    ["Worker", "worker"],
+    ["OffscreenCanvas", "offscreenCanvas"],
+    ["HTMLCanvasElement", "transferControl"],
+    ["SharedArrayBuffer", "sharedMemory"],
+  ] as const;
+
+  for (const [global, capability] of missing) {
+    it(`clears ${capability} when ${global} is missing`, () => {
+      const scope = fullScope();
+      delete scope[global];
+      assert.deepEqual(detectCanvasCapabilities(scope), {
+        ...ALL_CAPABILITIES,
+        [capability]: false,
+      });
+    });
+  }
+
+  it("clears transferControl when canvases can't be transferred", () => {
+    const scope = { ...fullScope(), HTMLCanvasElement: class {} };
+    assert.equal(detectCanvasCapabilities(scope).transferControl, false);
+  });
+
+  it("clears sharedMemory when the page isn't cross-origin isolated", () => {
+    for (const crossOriginIsolated of [false, undefined]) {
+      const scope = { ...fullScope(), crossOriginIsolated };
+      assert.equal(detectCanvasCapabilities(scope).sharedMemory, false);
+    }
+  });
+});
+
+describe("selectRenderMode", () => {
+  it("stays on the main thread unless worker mode is requested", () => {
+    assert.equal(selectRenderMode(false, ALL_CAPABILITIES), "main");
+  });
+
+  it("uses shared pointer memory when available", () => {
+    assert.equal(selectRenderMode(true, ALL_CAPABILITIES), "worker-shared");
+  });
+
+  it("posts pointer updates when memory can't be shared", () => {
+    const capabilities = { ...ALL_CAPABILITIES, sharedMemory: false };
+    assert.equal(selectRenderMode(true, capabilities), "worker");
+  });
+
+  for (const capability of [
+    "worker",
+    "offscreenCanvas",
+    "transferControl",
+  ] as const) {
+    it(`falls back to the main thread without ${capability}`, () => {
+      for (const sharedMemory of [true, false]) {
+        const capabilities = {
+          ...ALL_CAPABILITIES,
+          sharedMemory,
+          [capability]: false,
+        };
+        assert.equal(selectRenderMode(true, capabilities), "main");
+      }
+    });
+  }
+
+  it("falls back when the detected scope isn't isolated", () => {
+    const scope = { ...fullScope(), crossOriginIsolated: false };
+    assert.equal(
+      selectRenderMode(true, detectCanvasCapabilities(scope)),
+      "worker"
+    );
+  });
+});
@@ -0,0 +1,58 @@
+// Decides whether a background canvas runs on the main thread or in a
+// worker. Detection reads only globals and selection is a pure function, so
+// both run headless in Node.
+
+export type CanvasRenderMode = "main" | "worker" | "worker-shared";
+
+export interface CanvasCapabilities {
+  worker: boolean;
+  offscreenCanvas: boolean;
+  /** HTMLCanvasElement.prototype.transferControlToOffscreen exists */
+  transferControl: boolean;
+  /** SharedArrayBuffer is usable (page is cross-origin isolated) */
+  sharedMemory: boolean;
+}
+
+export type CapabilityScope = {
+  Worker?: unknown;
+  OffscreenCanvas?: unknown;
+  HTMLCanvasElement?: unknown;
+  SharedArrayBuffer?: unknown;
+  crossOriginIsolated?: boolean;
+};
+
+function canTransferControl(canvasConstructor: unknown): boolean {
+  return (
+    typeof canvasConstructor === "function" &&
+    "transferControlToOffscreen" in canvasConstructor.prototype
+  );
+}
+
+export function detectCanvasCapabilities(
+  scope: CapabilityScope = globalThis as CapabilityScope
+): CanvasCapabilities {
+  return {
+    worker: typeof scope.Worker === "function",
+    offscreenCanvas: typeof scope.OffscreenCanvas === "function",
+    transferControl: canTransferControl(scope.HTMLCanvasElement),
+    sharedMemory:
+      typeof scope.SharedArrayBuffer === "function" &&
+      scope.crossOriginIsolated === true,
+  };
+}
+
+/**
+ * Worker mode is opt-in. It needs a Worker, OffscreenCanvas and
+ * transferControlToOffscreen; anything missing falls back to the main
+ * thread. Shared pointer memory is used on top when available.
+ */
+export function selectRenderMode(
+  requested: boolean,
+  capabilities: CanvasCapabilities
+): CanvasRenderMode {
+  if (!requested) return "main";
+  const { worker, offscreenCanvas, transferControl, sharedMemory } =
+    capabilities;
+  if (!worker || !offscreenCanvas || !transferControl) return "main";
+  return sharedMemory ? "worker-shared" : "worker";
+}
@@ -0,0 +1,122 @@
+import type { Canvas2DContext } from "./dpr";
+
+// Batched renderer for large numbers of small round dots.
+//
+// Dots are quantized into opacity x radius buckets while a frame is being
+// built, then each bucket is drawn as a single combined path with one fill.
+// A full-screen dot field goes from one path per dot to a few dozen fills
+// per frame. Bucket storage grows on demand and is reused, so
+// steady-state frames allocate nothing.
+
+export interface DotBatchOptions {
+  /** Fill colour; per-dot opacity is applied on top via globalAlpha */
+  color: string;
+  minRadius: number;
+  maxRadius: number;
+  /** Number of distinct radii between minRadius and maxRadius */
+  radiusLevels?: number;
+  /** Number of distinct opacities in (0, 1] */
+  opacityLevels?: number;
+}
+
+const TAU = Math.PI * 2;
+const INITIAL_BUCKET_CAPACITY = 64;
+
+export class DotBatch {
+  private readonly color: string;
+  private readonly minRadius: number;
+  private readonly maxRadius: number;
+  private readonly radiusLevels: number;
+  private readonly opacityLevels: number;
+
+  private readonly counts: Uint32Array;
+  private readonly coords: Float32Array[];
+
+  constructor({
+    color,
+    minRadius,
+    maxRadius,
+    radiusLevels = 8,
+    opacityLevels = 16,
+  }: DotBatchOptions) {
+    this.color = color;
+    this.minRadius = minRadius;
+    this.maxRadius = Math.max(minRadius, maxRadius);
+    this.radiusLevels = this.maxRadius > minRadius ? radiusLevels : 1;
+    this.opacityLevels = opacityLevels;
+
+    const buckets = this.radiusLevels * (opacityLevels + 1);
+    this.counts = new Uint32Array(buckets);
+    this.coords = [];
+    for (let i = 0; i < buckets; i++) {
+      this.coords.push(new Float32Array(INITIAL_BUCKET_CAPACITY * 2));
+    }
+  }
+
+  /** Start a new frame */
+  begin(): void {
+    this.counts.fill(0);
+  }
+
+  add(x: number, y: number, radius: number, opacity: number): void {
+    const o = Math.round(Math.min(1, opacity) * this.opacityLevels);
+    if (o <= 0) return;
+
+    let r = 0;
+    if (this.radiusLevels > 1) {
+      const t = (radius - this.minRadius) / (this.maxRadius - this.minRadius);
+      r = Math.round(Math.min(1, Math.max(0, t)) * (this.radiusLevels - 1));
+    }
+
+    const bucket = o * this.radiusLevels + r;
+    const n = this.counts[bucket];
+    let coords = this.coords[bucket];
+    if (n * 2 + 2 > coords.length) {
+      const grown = new Float32Array(coords.length * 2);
+      grown.set(coords);
+      this.coords[bucket] = coords = grown;
+    }
+    coords[n * 2] = x;
+    coords[n * 2 + 1] = y;
+    this.counts[bucket] = n + 1;
+  }
+
+  /** Draw every queued dot. Returns the number of draw calls issued. */
+  flush(ctx: Canvas2DContext): number {
+    const { counts, coords, radiusLevels, opacityLevels } = this;
+    const previousAlpha = ctx.globalAlpha;
+    let drawCalls = 0;
+
+    ctx.fillStyle = this.color;
+    for (let bucket = radiusLevels; bucket < counts.length; bucket++) {
+      const n = counts[bucket];
+      if (n === 0) continue;
+
+      const level = (bucket / radiusLevels) | 0;
+      const radius = this.radiusFor(bucket - level * radiusLevels);
+      const points = coords[bucket];
+      ctx.globalAlpha = level / opacityLevels;
+
+      ctx.beginPath();
+      for (let k = 0; k < n; k++) {
+        const x = points[k * 2],
+          y = points[k * 2 + 1];
+        ctx.moveTo(x + radius, y);
+        ctx.arc(x, y, radius, 0, TAU);
+      }
+      ctx.fill();
+      drawCalls++;
+    }
+
+    ctx.globalAlpha = previousAlpha;
+    return drawCalls;
+  }
+
+  private radiusFor(level: number): number {
+    if (this.radiusLevels === 1) return this.minRadius;
+    return (
+      this.minRadius +
+      ((this.maxRadius - this.minRadius) * level) / (this.radiusLevels - 1)
+    );
+  }
+}
@@ -0,0 +1,173 @@
+"use client";
+
+import { useEffect, useRef, useState, type RefObject } from "react";
+import {
+  mountCanvasScene,
+  type CanvasSceneController,
+} from "@/lib/animation/mountCanvasScene";
+import type { SceneConfigs, SceneName } from "@/lib/animation/scenes";
+import { getDevicePixelRatio } from "@/lib/canvas/dpr";
+import { adaptiveQuality } from "@/lib/scheduler/adaptiveQuality";
+import { inputBus } from "@/lib/scheduler/inputBus";
+import {
+  isDocumentVisible,
+  observeElementVisibility,
+  subscribeDocumentVisibility,
+} from "@/lib/scheduler/visibility";
+
+export interface UseCanvasSceneOptions<Name extends SceneName> {
+  scene: Name;
+  /** Read once per mount; push later changes through the returned ref */
+  config: SceneConfigs[Name];
+  /**
+   * Render in a worker via OffscreenCanvas when supported. If the worker
+   * fails, the scene is remounted on the main thread.
+   */
+  worker?: boolean;
+  /** Class for the canvas element created inside the host */
+  canvasClassName?: string;
+  /** Size the canvas to the viewport instead of the host element */
+  viewport?: boolean;
+  /**
+   * Element whose presence on screen gates rendering. Defaults to the
+   * canvas itself; pass the content that covers a fixed background so it
+   * pauses once that content scrolls away.
+   */
+  visibilityRef?: RefObject<Element | null>;
+  /** Pointer position in canvas CSS pixels, once per frame at most */
+  onPointer?: (x: number, y: number) => void;
+  /** Main-thread work once per rendered frame */
+  onFrame?: (time: number) => void;
+}
+
+/**
+ * Mount a background canvas scene into `hostRef` and wire it to the shared
+ * input bus, visibility tracking and adaptive quality. Returns a ref to
+ * the scene controller for pushing config updates.
+ */
+export function useCanvasScene<Name extends SceneName>(
+  hostRef: RefObject<HTMLElement | null>,
+  options: UseCanvasSceneOptions<Name>
+): RefObject<CanvasSceneController<SceneConfigs[Name]> | null> {
+  const controllerRef = useRef<CanvasSceneController<
+    SceneConfigs[Name]
+  > | null>(null);
+  const optionsRef = useRef(options);
+
+  useEffect(() => {
+    optionsRef.current = options;
+  });
+
+  // Set once the worker dies; the transferred canvas is unusable, so the
+  // effect reruns on a fresh canvas in main-thread mode.
+  const [workerFailed, setWorkerFailed] = useState(false);
+  const { scene, viewport = false } = options;
+  const worker = (options.worker ?? false) && !workerFailed;
+
+  useEffect(() => {
+    const host = hostRef.current;
+    if (!host) return;
+    const { canvasClassName, visibilityRef } = optionsRef.current;
+
+    // Created per mount: in worker mode control of the canvas is
+    // transferred to the worker, which can only happen once per element.
+    const canvas = document.createElement("canvas");
+    if (canvasClassName) canvas.className = canvasClassName;
+    host.appendChild(canvas);
+
+    const bounds = { left: 0, top: 0, width: 0, height: 0 };
+    const measure = () => {
+      if (viewport) {
+        bounds.width = window.innerWidth;
+        bounds.height = window.innerHeight;
+        return;
+      }
+      const rect = host.getBoundingClientRect();
+      bounds.left = rect.left;
+      bounds.top = rect.top;
+      bounds.width = rect.width;
+      bounds.height = rect.height;
+    };
+    measure();
+
+    let maxDpr = adaptiveQuality.level.maxDpr;
+    let density = 1;
+    const dpr = () => Math.min(getDevicePixelRatio(), maxDpr);
+
+    const controller = mountCanvasScene(canvas, {
+      scene,
+      config: optionsRef.current.config,
+      width: bounds.width,
+      height: bounds.height,
+      dpr: dpr(),
+      worker,
+      onFrame: optionsRef.current.onFrame
+        ? (time) => optionsRef.current.onFrame?.(time)
+        : undefined,
+      onWorkerError: () => setWorkerFailed(true),
+    });
+    controllerRef.current = controller;
+    if (!controller) {
+      canvas.remove();
+      return;
+    }
+
+    const unsubscribePointer = inputBus.onPointer((pointer) => {
+      if (!pointer.active) return;
+      if (!pointer.inside) {
+        controller.pointerLeave();
+        return;
+      }
+      const x = pointer.x - bounds.left;
+      const y = pointer.y - bounds.top;
+      controller.pointerMove(x, y);
+      optionsRef.current.onPointer?.(x, y);
+    });
+
+    const unsubscribeResize = inputBus.onResize(() => {
+      measure();
+      controller.resize(bounds.width, bounds.height, dpr());
+    });
+
+    // The main-thread scheduler already stops on hidden tabs; a worker
+    // loop has to be told.
+    let pageVisible = isDocumentVisible();
+    let onScreen = true;
+    const updateVisible = () => controller.setVisible(pageVisible && onScreen);
+    const unsubscribePage = subscribeDocumentVisibility((visible) => {
+      pageVisible = visible;
+      updateVisible();
+    });
+    const unobserve = observeElementVisibility(
+      visibilityRef?.current ?? canvas,
+      (visible) => {
+        onScreen = visible;
+        updateVisible();
+      }
+    );
+
+    const unsubscribeQuality = adaptiveQuality.subscribe((level) => {
+      if (level.maxDpr !== maxDpr) {
+        maxDpr = level.maxDpr;
+        controller.resize(bounds.width, bounds.height, dpr());
+      }
+      if (level.density !== density) {
+        density = level.density;
+        controller.setDensity(density);
+      }
+    });
+
+    return () => {
+      unsubscribeQuality();
+      unobserve();
+      unsubscribePage();
+      unsubscribeResize();
+      unsubscribePointer();
+      controller.dispose();
+      controllerRef.current = null;
+      canvas.remove();
+    };
+  }, [hostRef, scene, worker, viewport]);
+
+  return controllerRef;
+}
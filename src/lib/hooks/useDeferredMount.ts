@@ -0,0 +1,55 @@
+"use client";
+
+import { useEffect, useState, type RefObject } from "react";
+import { scheduleIdle } from "@/lib/scheduler/idle";
+import { onceNearViewport } from "@/lib/scheduler/visibility";
+
+/**
+ * "idle": once the browser is idle after hydration, or at the user's
+ * first interaction, whichever comes first.
+ * "visible": once `targetRef` is within a viewport's height of the screen.
+ */
+export type DeferredMountTrigger = "idle" | "visible";
+
+// Interactions that should bring idle islands forward
+const INTERACTION_EVENTS = ["pointerdown", "keydown", "wheel", "touchstart"];
+
+/**
+ * False on the server and the first client render, true once `trigger`
+ * has fired. Client islands render their deferred content behind this,
+ * so its code is fetched and hydrated after the page is interactive.
+ */
+export function useDeferredMount(
+  trigger: DeferredMountTrigger,
+  targetRef?: RefObject<Element | null>
+): boolean {
+  const [mounted, setMounted] = useState(false);
+
+  useEffect(() => {
+    if (mounted) return;
+    const mount = () => setMounted(true);
+
+    if (trigger === "visible") {
+      const target = targetRef?.current;
+      if (!target) {
+        mount();
+        return;
+      }
+      return onceNearViewport(target, mount);
+    }
+
+    const cancelIdle = scheduleIdle(mount);
+    const options = { capture: true, passive: true, once: true };
+    INTERACTION_EVENTS.forEach((type) =>
+      window.addEventListener(type, mount, options)
+    );
+    return () => {
+      cancelIdle();
+      INTERACTION_EVENTS.forEach((type) =>
+        window.removeEventListener(type, mount, options)
+      );
+    };
+  }, [trigger, targetRef, mounted]);
+
+  return mounted;
+}
@@ -0,0 +1,59 @@
+"use client";
+
+import {
+  useCallback,
+  useEffect,
+  useSyncExternalStore,
+  type RefObject,
+} from "react";
+import { videoManager, type VideoLoadState } from "@/lib/media/videoManager";
+
+interface UseManagedVideoOptions {
+  /** Warm the video speculatively, e.g. while its card is near the viewport */
+  preload?: boolean;
+  /** Play the video inside `hostRef` as soon as it is ready */
+  playing?: boolean;
+}
+
+/**
+ * Play a pooled video from the shared video manager inside `hostRef`.
+ * Returns the load state of `url`; the host stays empty until "ready".
+ */
+export function useManagedVideo(
+  url: string,
+  hostRef: RefObject<HTMLElement | null>,
+  { preload = false, playing = false }: UseManagedVideoOptions = {}
+): VideoLoadState {
+  const subscribe = useCallback(
+    (listener: () => void) => videoManager.subscribe(url, listener),
+    [url]
+  );
+  const state = useSyncExternalStore(
+    subscribe,
+    () => videoManager.getState(url),
+    () => "idle" as const
+  );
+
+  useEffect(() => {
+    if (!preload) return;
+    videoManager.preload(url, "low");
+    return () => videoManager.cancel(url);
+  }, [url, preload]);
+
+  // Hover intent: fetch ahead of any speculative preloads
+  useEffect(() => {
+    if (playing) videoManager.preload(url, "high");
+  }, [url, playing]);
+
+  useEffect(() => {
+    const host = hostRef.current;
+    if (!playing || state !== "ready" || !host) return;
+    const video = videoManager.attach(url, host);
+    video?.play().catch((e) => {
+      console.log("Video autoplay failed:", e);
+    });
+    return () => videoManager.detach(url, host);
+  }, [url, hostRef, playing, state]);
+
+  return state;
+}
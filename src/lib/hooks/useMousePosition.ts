@@ -1,6 +1,7 @@
 'use client';
 
 import { useState, useEffect } from 'react';
+import { inputBus } from '@/lib/scheduler/inputBus';
 
 interface MousePosition {
   x: number;
@@ -18,36 +19,14 @@ export function useMousePosition() {
       return; // Don't track mouse on touch devices
     }
 
-    // Direct mouse position update with RAF throttling
-    let rafId: number | null = null;
-    
-    const handleMouseMove = (e: MouseEvent) => {
-      if (rafId !== null) {
-        return;
-      }
-      
-      rafId = requestAnimationFrame(() => {
-        setMousePosition({ x: e.clientX, y: e.clientY });
-        rafId = null;
-      });
-    };
-
-    const handleMouseEnter = (e: MouseEvent) => {
-      setMousePosition({ x: e.clientX, y: e.clientY });
-    };
-
-    window.addEventListener('mousemove', handleMouseMove);
-    window.addEventListener('mouseenter', handleMouseEnter);
-
-    return () => {
-      window.removeEventListener('mousemove', handleMouseMove);
-      window.removeEventListener('mouseenter', handleMouseEnter);
-      
-      if (rafId !== null) {
-        cancelAnimationFrame(rafId);
-      }
-    };
+    // The input bus delivers at most one update per frame
+    return inputBus.onPointer(({ x, y, active }) => {
+      if (!active) return;
+      setMousePosition((current) =>
+        current.x === x && current.y === y ? current : { x, y }
+      );
+    });
   }, []);
 
   return mousePosition;
-}
\ No newline at end of file
+}
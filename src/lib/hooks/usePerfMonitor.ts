@@ -0,0 +1,15 @@
+"use client";
+
+import { useSyncExternalStore } from "react";
+import { perfMonitor, type PerfSnapshot } from "@/lib/perf/perfMonitor";
+
+const subscribe = (listener: () => void) => perfMonitor.subscribe(listener);
+const getSnapshot = () => perfMonitor.getSnapshot();
+
+/**
+ * Live runtime metrics, refreshed about twice a second. Collection (and
+ * reporting to /api/perf) runs while at least one component uses this.
+ */
+export function usePerfMonitor(): PerfSnapshot {
+  return useSyncExternalStore(subscribe, getSnapshot, getSnapshot);
+}
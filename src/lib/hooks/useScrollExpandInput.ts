@@ -0,0 +1,95 @@
+"use client";
+
+import { useLayoutEffect, useRef, useState } from "react";
+import { ScrollExpandGesture } from "@/lib/animation/scrollExpand";
+import {
+  frameScheduler,
+  type FrameSubscription,
+} from "@/lib/scheduler/frameScheduler";
+
+export interface ScrollExpandInput {
+  readonly gesture: ScrollExpandGesture;
+  /**
+   * Called on every frame in which the gesture changed, once attached.
+   * Pass null to detach.
+   */
+  setRenderer(render: (() => void) | null): void;
+  /** Render on the next frame even if the gesture hasn't changed */
+  invalidate(): void;
+}
+
+/**
+ * Input half of the ScrollHero expansion, bound from first hydration: it
+ * owns the gesture, keeps the page pinned at the top while the media is
+ * collapsed, and swallows the wheel and touch movement that drives it.
+ * Whatever draws the expansion can load later and attach a renderer; the
+ * gesture has been tracking input the whole time.
+ */
+export function useScrollExpandInput(): ScrollExpandInput {
+  const frameRef = useRef<FrameSubscription | null>(null);
+  const rendererRef = useRef<(() => void) | null>(null);
+  const [input] = useState<ScrollExpandInput>(() => {
+    const invalidate = () => frameRef.current?.setActive(true);
+    return {
+      gesture: new ScrollExpandGesture(invalidate),
+      setRenderer: (render) => {
+        rendererRef.current = render;
+        invalidate();
+      },
+      invalidate,
+    };
+  });
+
+  useLayoutEffect(() => {
+    const { gesture } = input;
+    const frame = frameScheduler.subscribe(
+      () => {
+        gesture.flush();
+        rendererRef.current?.();
+        frame.setActive(false);
+      },
+      { priority: "render", active: false }
+    );
+    frameRef.current = frame;
+
+    // A visitor who scrolled before hydration keeps their place, with the
+    // media already expanded, instead of being snapped back to the top
+    if (window.scrollY > 0) gesture.expand();
+    else window.dispatchEvent(new Event("resetSection"));
+
+    const handleWheel = (e: WheelEvent): void => {
+      if (gesture.wheel(e.deltaY, window.scrollY)) e.preventDefault();
+    };
+    const handleTouchStart = (e: TouchEvent): void => {
+      gesture.touchStart(e.touches[0].clientY);
+    };
+    const handleTouchMove = (e: TouchEvent): void => {
+      if (gesture.touchMove(e.touches[0].clientY, window.scrollY)) {
+        e.preventDefault();
+      }
+    };
+    const handleTouchEnd = (): void => gesture.touchEnd();
+    // Keep the page pinned at the top until the media is fully expanded
+    const handleScroll = (): void => {
+      if (!gesture.expanded) window.scrollTo(0, 0);
+    };
+
+    window.addEventListener("wheel", handleWheel, { passive: false });
+    window.addEventListener("scroll", handleScroll, { passive: true });
+    window.addEventListener("touchstart", handleTouchStart, { passive: true });
+    window.addEventListener("touchmove", handleTouchMove, { passive: false });
+    window.addEventListener("touchend", handleTouchEnd, { passive: true });
+
+    return () => {
+      window.removeEventListener("wheel", handleWheel);
+      window.removeEventListener("scroll", handleScroll);
+      window.removeEventListener("touchstart", handleTouchStart);
+      window.removeEventListener("touchmove", handleTouchMove);
+      window.removeEventListener("touchend", handleTouchEnd);
+      frame.unsubscribe();
+      frameRef.current = null;
+    };
+  }, [input]);
+
+  return input;
+}
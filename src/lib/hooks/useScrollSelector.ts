@@ -0,0 +1,34 @@
+"use client";
+
+import { useSyncExternalStore } from "react";
+import {
+  getScrollSnapshot,
+  getServerScrollSnapshot,
+  subscribeScroll,
+  type ScrollDirection,
+  type ScrollSnapshot,
+} from "@/lib/scheduler/scrollStore";
+
+/**
+ * Read a value derived from the page scroll position. The component only
+ * re-renders when the selected value changes, so selectors should return
+ * primitives (or otherwise stable values), not fresh objects.
+ */
+export function useScrollSelector<T>(
+  selector: (snapshot: ScrollSnapshot) => T
+): T {
+  return useSyncExternalStore(
+    subscribeScroll,
+    () => selector(getScrollSnapshot()),
+    () => selector(getServerScrollSnapshot())
+  );
+}
+
+/** True once the page has scrolled more than `threshold` px */
+export function useIsScrolled(threshold = 10): boolean {
+  return useScrollSelector((snapshot) => snapshot.y > threshold);
+}
+
+export function useScrollDirection(): ScrollDirection {
+  return useScrollSelector((snapshot) => snapshot.direction);
+}
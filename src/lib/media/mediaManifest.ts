@@ -0,0 +1,139 @@
+import manifestJson from "./media-manifest.json";
+
+// Typed view of media-manifest.json, which `npm run media` regenerates
+// from the files in public/ (see scripts/media/build-media.mjs). Entries
+// are keyed by public URL path ("/case-image-1.png"). Anything missing
+// from the manifest falls back to the original file, so components work
+// before the pipeline has been run.
+
+export type ImageFormat = "avif" | "webp" | "jpeg";
+
+export interface ImageVariant {
+  src: string;
+  width: number;
+  height: number;
+  format: ImageFormat;
+}
+
+export interface ImageAsset {
+  width: number;
+  height: number;
+  /** Tiny base64 WebP for `placeholder="blur"` */
+  blurDataURL: string;
+  /** Resized derivatives, ascending by width within each format */
+  variants: ImageVariant[];
+}
+
+export interface VideoRendition {
+  src: string;
+  width: number;
+  height: number;
+  /** Target video bitrate in kbit/s */
+  bitrate: number;
+  /** MIME type including codecs, for <source type> */
+  type: string;
+}
+
+export interface VideoAsset {
+  width: number;
+  height: number;
+  /** First frame, with the same derivatives as an image */
+  poster: ImageAsset | null;
+  /** Ascending by height */
+  renditions: VideoRendition[];
+}
+
+export interface MediaManifest {
+  version: 1;
+  images: Record<string, ImageAsset>;
+  videos: Record<string, VideoAsset>;
+}
+
+export const mediaManifest = manifestJson as MediaManifest;
+
+// Components reference files with URL-encoded paths ("/a%20b.mp4")
+const manifestKey = (src: string): string => {
+  try {
+    return decodeURI(src);
+  } catch {
+    return src;
+  }
+};
+
+export function getImageAsset(src: string): ImageAsset | undefined {
+  return mediaManifest.images[manifestKey(src)];
+}
+
+export function getVideoAsset(src: string): VideoAsset | undefined {
+  return mediaManifest.videos[manifestKey(src)];
+}
+
+/** Smallest `format` variant at least `minWidth` wide, else the largest */
+export function pickImageVariant(
+  asset: ImageAsset,
+  minWidth: number,
+  format: ImageFormat = "webp"
+): ImageVariant | undefined {
+  const variants = asset.variants.filter((v) => v.format === format);
+  return variants.find((v) => v.width >= minWidth) ?? variants.at(-1);
+}
+
+export interface VideoSource {
+  src: string;
+  type: string;
+  /** Media query for <source media>; the last source has none */
+  media?: string;
+}
+
+// Pixel ratios the video breakpoints are written for; anything denser is
+// treated as the last one
+const VIDEO_DPR_STEPS = [1, 2, 3];
+
+// Viewports up to `width` device pixels wide, whatever the pixel ratio
+const deviceWidthQuery = (width: number): string =>
+  VIDEO_DPR_STEPS.map((dpr, index) => {
+    const query = `(max-width: ${Math.floor(width / dpr)}px)`;
+    return index === VIDEO_DPR_STEPS.length - 1
+      ? query
+      : `${query} and (max-resolution: ${dpr}dppx)`;
+  }).join(", ");
+
+/**
+ * <source> list for a video: each rendition is used while the viewport is
+ * at most as many device pixels wide as it was encoded for, the largest one
+ * everywhere else. Browsers take the first matching source, so the list
+ * runs smallest first.
+ */
+export function videoSources(asset: VideoAsset): VideoSource[] {
+  const { renditions } = asset;
+  return renditions.map((rendition, index) =>
+    index === renditions.length - 1
+      ? { src: rendition.src, type: rendition.type }
+      : {
+          src: rendition.src,
+          type: rendition.type,
+          media: deviceWidthQuery(rendition.width),
+        }
+  );
+}
+
+/**
+ * Single URL for places that can't use <source> (the pooled card videos):
+ * the smallest rendition covering `minHeight` device pixels.
+ */
+export function resolveVideoSrc(src: string, minHeight: number): string {
+  const renditions = getVideoAsset(src)?.renditions;
+  if (!renditions || renditions.length === 0) return src;
+  return (
+    renditions.find((r) => r.height >= minHeight) ?? renditions.at(-1)!
+  ).src;
+}
+
+/** Poster URL for a video, if the pipeline produced one */
+export function videoPosterSrc(
+  src: string,
+  minWidth: number
+): string | undefined {
+  const poster = getVideoAsset(src)?.poster;
+  return poster ? pickImageVariant(poster, minWidth)?.src : undefined;
+}
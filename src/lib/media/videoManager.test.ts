@@ -0,0 +1,71 @@
+import assert from "node:assert/strict";
+import { describe, it } from "node:test";
+import { MAX_CONCURRENT_LOADS, VideoManager } from "./videoManager";
+
+// Just enough of a <video> for the manager to load into
+class FakeVideo extends EventTarget {
+  load(): void {}
+  pause(): void {}
+  remove(): void {}
+  removeAttribute(): void {}
+}
+
+// A hover-capable browser that isn't saving data
+Object.assign(globalThis, {
+  window: { matchMedia: () => ({ matches: true }) },
+  document: { createElement: () => new FakeVideo() },
+});
+globalThis.navigator ??= {} as Navigator;
+
+// A manager whose load slots are all taken, so further preloads queue
+function busyManager(): VideoManager {
+  const manager = new VideoManager();
+  for (let i = 0; i < MAX_CONCURRENT_LOADS; i++) {
+    manager.preload(`busy-${i}.mp4`, "low");
+  }
+  return manager;
+}
+
+describe("VideoManager.cancel", () => {
+  it("drops a queued preload", () => {
+    const manager = busyManager();
+    manager.preload("card.mp4", "low");
+    assert.equal(manager.getState("card.mp4"), "queued");
+
+    manager.cancel("card.mp4");
+    assert.equal(manager.getState("card.mp4"), "idle");
+  });
+
+  it("keeps a shared preload until every requester cancels", () => {
+    const manager = busyManager();
+    manager.preload("shared.mp4", "low");
+    manager.preload("shared.mp4", "low");
+
+    manager.cancel("shared.mp4");
+    assert.equal(manager.getState("shared.mp4"), "queued");
+
+    manager.cancel("shared.mp4");
+    assert.equal(manager.getState("shared.mp4"), "idle");
+  });
+
+  it("ignores cancels without a matching preload", () => {
+    const manager = busyManager();
+    manager.preload("shared.mp4", "low");
+    manager.cancel("shared.mp4");
+    manager.cancel("shared.mp4");
+
+    manager.preload("shared.mp4", "low");
+    manager.preload("shared.mp4", "low");
+    manager.cancel("shared.mp4");
+    assert.equal(manager.getState("shared.mp4"), "queued");
+  });
+
+  it("keeps hover requests queued", () => {
+    const manager = busyManager();
+    manager.preload("card.mp4", "low");
+    manager.preload("card.mp4", "high");
+
+    manager.cancel("card.mp4");
+    assert.equal(manager.getState("card.mp4"), "queued");
+  });
+});
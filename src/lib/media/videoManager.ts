@@ -0,0 +1,268 @@
+// Loads and recycles the hover videos on case-study cards.
+//
+// Cards don't own <video> elements. The manager keeps a small pool of
+// them, each holding at most one URL, so a URL shared by several cards is
+// fetched and decoded once. Loads go through a queue capped at a few
+// concurrent downloads; hover requests jump ahead of speculative ones.
+// When a card plays a video the pooled element is moved into the card and
+// handed back to the pool afterwards, keeping its buffered data.
+
+export type VideoLoadState = "idle" | "queued" | "loading" | "ready" | "error";
+
+/** "low" for speculative preloads, "high" when the user is about to watch */
+export type VideoPriority = "low" | "high";
+
+/** Most video elements (and decoders) alive at once */
+export const MAX_POOLED_VIDEOS = 3;
+/** Most videos downloading at once */
+export const MAX_CONCURRENT_LOADS = 2;
+
+interface PooledVideo {
+  element: HTMLVideoElement;
+  url: string | null;
+  /** Holds one of the concurrent-load slots */
+  loading: boolean;
+  attached: boolean;
+  lastUsed: number;
+}
+
+interface Entry {
+  url: string;
+  state: VideoLoadState;
+  priority: VideoPriority;
+  /** Low-priority preloads requested and not yet cancelled */
+  preloads: number;
+  video: PooledVideo | null;
+  listeners: Set<() => void>;
+}
+
+type NetworkInformation = { saveData?: boolean };
+
+export class VideoManager {
+  private entries = new Map<string, Entry>();
+  private pool: PooledVideo[] = [];
+  private queue: Entry[] = [];
+  private loads = 0;
+  private clock = 0;
+
+  getState(url: string): VideoLoadState {
+    return this.entries.get(url)?.state ?? "idle";
+  }
+
+  /** Called whenever the load state of `url` changes */
+  subscribe(url: string, listener: () => void): () => void {
+    const entry = this.entry(url);
+    entry.listeners.add(listener);
+    return () => entry.listeners.delete(listener);
+  }
+
+  /**
+   * Start loading `url` unless it is already loaded or on its way.
+   * Low-priority preloads are skipped on devices that can't hover (the
+   * video would never play) and when the user asked to save data. Each
+   * low-priority call should be paired with a `cancel`.
+   */
+  preload(url: string, priority: VideoPriority = "low"): void {
+    const entry = this.entry(url);
+    if (priority === "low") {
+      // Counted even when skipped so the matching cancel stays balanced
+      entry.preloads++;
+      if (!this.canPreload()) return;
+    }
+
+    if (priority === "high" && entry.priority === "low") {
+      entry.priority = "high";
+      if (entry.state === "queued") {
+        // Move ahead of speculative loads
+        this.queue = [entry, ...this.queue.filter((e) => e !== entry)];
+      }
+    }
+    if (
+      entry.state === "idle" ||
+      (entry.state === "error" && priority === "high")
+    ) {
+      this.setState(entry, "queued");
+      if (priority === "high") this.queue.unshift(entry);
+      else this.queue.push(entry);
+    }
+    this.pump();
+  }
+
+  /**
+   * Withdraw a low-priority preload. Several cards can share a URL, so the
+   * load is only dropped once every requester has cancelled, and only if
+   * it hasn't started yet.
+   */
+  cancel(url: string): void {
+    const entry = this.entries.get(url);
+    if (!entry || entry.preloads === 0) return;
+    entry.preloads--;
+    if (
+      entry.preloads > 0 ||
+      entry.state !== "queued" ||
+      entry.priority === "high"
+    ) {
+      return;
+    }
+    this.queue = this.queue.filter((e) => e !== entry);
+    this.setState(entry, "idle");
+  }
+
+  /**
+   * Move the loaded element for `url` into `host` for playback. Returns
+   * null until the video is ready.
+   */
+  attach(url: string, host: HTMLElement): HTMLVideoElement | null {
+    const entry = this.entries.get(url);
+    const video = entry?.video;
+    if (!entry || entry.state !== "ready" || !video) return null;
+    video.attached = true;
+    video.lastUsed = ++this.clock;
+    host.appendChild(video.element);
+    return video.element;
+  }
+
+  /** Stop playback in `host` and return the element to the pool */
+  detach(url: string, host: HTMLElement): void {
+    const video = this.entries.get(url)?.video;
+    if (!video || video.element.parentNode !== host) return;
+    video.element.pause();
+    video.element.currentTime = 0;
+    video.element.remove();
+    video.attached = false;
+    video.lastUsed = ++this.clock;
+    this.pump();
+  }
+
+  private entry(url: string): Entry {
+    let entry = this.entries.get(url);
+    if (!entry) {
+      entry = {
+        url,
+        state: "idle",
+        priority: "low",
+        preloads: 0,
+        video: null,
+        listeners: new Set(),
+      };
+      this.entries.set(url, entry);
+    }
+    return entry;
+  }
+
+  private setState(entry: Entry, state: VideoLoadState): void {
+    if (entry.state === state) return;
+    entry.state = state;
+    entry.listeners.forEach((listener) => listener());
+  }
+
+  private canPreload(): boolean {
+    if (typeof window === "undefined") return false;
+    const connection = (
+      navigator as Navigator & { connection?: NetworkInformation }
+    ).connection;
+    if (connection?.saveData) return false;
+    return window.matchMedia("(hover: hover)").matches;
+  }
+
+  private pump(): void {
+    while (this.loads < MAX_CONCURRENT_LOADS && this.queue.length > 0) {
+      const video = this.acquire();
+      if (!video) return;
+      const entry = this.queue.shift()!;
+      this.load(entry, video);
+    }
+  }
+
+  // A free pool element: a new one while under the cap, otherwise the
+  // least recently used element that is neither playing nor loading.
+  private acquire(): PooledVideo | null {
+    if (this.pool.length < MAX_POOLED_VIDEOS) {
+      const video = this.createVideo();
+      this.pool.push(video);
+      return video;
+    }
+    let candidate: PooledVideo | null = null;
+    for (const video of this.pool) {
+      if (video.attached || video.loading) continue;
+      if (!candidate || video.lastUsed < candidate.lastUsed) {
+        candidate = video;
+      }
+    }
+    if (candidate) this.evict(candidate);
+    return candidate;
+  }
+
+  private evict(video: PooledVideo): void {
+    const entry = video.url ? this.entries.get(video.url) : undefined;
+    video.url = null;
+    // Dropping the source releases the buffered data and the decoder
+    video.element.removeAttribute("src");
+    video.element.load();
+    if (entry) {
+      entry.video = null;
+      entry.priority = "low";
+      this.setState(entry, "idle");
+    }
+  }
+
+  private load(entry: Entry, video: PooledVideo): void {
+    entry.video = video;
+    video.url = entry.url;
+    video.loading = true;
+    video.lastUsed = ++this.clock;
+    this.loads++;
+    this.setState(entry, "loading");
+    video.element.src = entry.url;
+    video.element.load();
+  }
+
+  private releaseSlot(video: PooledVideo): void {
+    if (!video.loading) return;
+    video.loading = false;
+    this.loads--;
+    this.pump();
+  }
+
+  private createVideo(): PooledVideo {
+    const element = document.createElement("video");
+    element.muted = true;
+    element.defaultMuted = true;
+    element.loop = true;
+    element.playsInline = true;
+    element.preload = "auto";
+    element.disablePictureInPicture = true;
+    element.disableRemotePlayback = true;
+    element.className = "w-full h-full object-cover";
+
+    const video: PooledVideo = {
+      element,
+      url: null,
+      loading: false,
+      attached: false,
+      lastUsed: 0,
+    };
+    const current = () => (video.url ? this.entries.get(video.url) : null);
+
+    element.addEventListener("loadeddata", () => {
+      const entry = current();
+      if (entry) this.setState(entry, "ready");
+    });
+    // The browser has buffered enough or paused the download: free the
+    // slot for the next video in the queue.
+    element.addEventListener("canplaythrough", () => this.releaseSlot(video));
+    element.addEventListener("suspend", () => this.releaseSlot(video));
+    element.addEventListener("error", () => {
+      const entry = current();
+      if (!entry) return;
+      console.error(`Video failed to load: ${entry.url}`, element.error);
+      entry.video = null;
+      video.url = null;
+      this.setState(entry, "error");
+      this.releaseSlot(video);
+    });
+    return video;
+  }
+}
+
+export const videoManager = new VideoManager();
@@ -0,0 +1,27 @@
+// Kept apart from perfMonitor.ts, which pulls in the frame scheduler: the
+// overlay checks this on every page and only loads the monitor when it
+// returns true.
+
+const PERF_STORAGE_KEY = "perf-overlay";
+
+/**
+ * Whether monitoring was requested: NEXT_PUBLIC_PERF_OVERLAY=1 at build
+ * time, or a `?perf` query parameter, which sticks for the session.
+ */
+export function isPerfMonitorEnabled(): boolean {
+  if (process.env.NEXT_PUBLIC_PERF_OVERLAY === "1") return true;
+  if (typeof window === "undefined") return false;
+  try {
+    const params = new URLSearchParams(window.location.search);
+    if (params.has("perf")) {
+      const off = params.get("perf") === "0";
+      if (off) sessionStorage.removeItem(PERF_STORAGE_KEY);
+      else sessionStorage.setItem(PERF_STORAGE_KEY, "1");
+      return !off;
+    }
+    return sessionStorage.getItem(PERF_STORAGE_KEY) === "1";
+  } catch {
+    // Storage can be unavailable (privacy mode, sandboxed frames)
+    return false;
+  }
+}
@@ -0,0 +1,255 @@
+import {
+  adaptiveQuality,
+  QUALITY_LEVELS,
+} from "@/lib/scheduler/adaptiveQuality";
+import { frameScheduler } from "@/lib/scheduler/frameScheduler";
+
+// Opt-in runtime metrics: frame times from the shared frame scheduler,
+// long tasks, and the LCP / CLS / INP web vitals from PerformanceObserver.
+// Snapshots are published to listeners about twice a second and posted
+// to /api/perf periodically and when the page is hidden. Whether the
+// monitor is wanted at all is decided by perfFlag.ts, which the page can
+// check without loading this module.
+//
+// Frame times are only sampled while something is animating through the
+// scheduler; the monitor never keeps the loop running on its own.
+
+export interface PerfSnapshot {
+  /** Frames per second over the recent window, 0 when idle */
+  fps: number;
+  /** Median and 95th percentile frame interval in ms */
+  frameP50: number;
+  frameP95: number;
+  /** 95th percentile main-thread time spent in frame subscribers, ms */
+  workP95: number;
+  /** Frames over 1.5x the 60Hz budget since the monitor started */
+  slowFrames: number;
+  /** Background frame callbacks skipped over budget since the start */
+  skippedBackground: number;
+  longTasks: number;
+  /** Total duration of long tasks in ms */
+  longTaskMs: number;
+  /** Largest contentful paint in ms, null until reported */
+  lcp: number | null;
+  /** Cumulative layout shift score */
+  cls: number;
+  /** Slowest interaction latency in ms, null before any interaction */
+  inp: number | null;
+  /** Current adaptive quality level index */
+  qualityLevel: number;
+}
+
+export const PERF_ENDPOINT = "/api/perf";
+
+const FRAME_WINDOW = 120;
+const PUBLISH_INTERVAL_MS = 500;
+const REPORT_INTERVAL_MS = 15_000;
+const SLOW_FRAME_MS = (1000 / 60) * 1.5;
+
+const EMPTY_SNAPSHOT: PerfSnapshot = {
+  fps: 0,
+  frameP50: 0,
+  frameP95: 0,
+  workP95: 0,
+  slowFrames: 0,
+  skippedBackground: 0,
+  longTasks: 0,
+  longTaskMs: 0,
+  lcp: null,
+  cls: 0,
+  inp: null,
+  qualityLevel: 0,
+};
+
+type SnapshotListener = (snapshot: PerfSnapshot) => void;
+
+// Entry types missing from lib.dom
+interface LayoutShiftEntry extends PerformanceEntry {
+  value: number;
+  hadRecentInput: boolean;
+}
+interface EventTimingEntry extends PerformanceEntry {
+  interactionId?: number;
+}
+
+function percentile(sorted: Float64Array, p: number): number {
+  if (sorted.length === 0) return 0;
+  const index = Math.min(sorted.length - 1, Math.floor(sorted.length * p));
+  return sorted[index];
+}
+
+export class PerfMonitor {
+  private listeners = new Set<SnapshotListener>();
+  private snapshot = EMPTY_SNAPSHOT;
+  private stopCollecting: (() => void) | null = null;
+
+  // Ring buffers of the most recent frames
+  private frameTimes = new Float64Array(FRAME_WINDOW);
+  private workTimes = new Float64Array(FRAME_WINDOW);
+  private frameCount = 0;
+  private frameCursor = 0;
+  private lastFrameAt = 0;
+
+  private slowFrames = 0;
+  private skippedBackground = 0;
+  private longTasks = 0;
+  private longTaskMs = 0;
+  private lcp: number | null = null;
+  private cls = 0;
+  private interactions = new Map<number, number>();
+  private qualityLevel = 0;
+
+  getSnapshot(): PerfSnapshot {
+    return this.snapshot;
+  }
+
+  /** Start collecting on first subscription, stop after the last one */
+  subscribe(listener: SnapshotListener): () => void {
+    this.listeners.add(listener);
+    if (!this.stopCollecting) this.stopCollecting = this.start();
+    return () => {
+      this.listeners.delete(listener);
+      if (this.listeners.size === 0) {
+        this.stopCollecting?.();
+        this.stopCollecting = null;
+      }
+    };
+  }
+
+  private start(): () => void {
+    const cleanups: (() => void)[] = [];
+
+    cleanups.push(
+      frameScheduler.onFrameStats((workMs, frameMs, skippedBackground) => {
+        this.frameTimes[this.frameCursor] = frameMs;
+        this.workTimes[this.frameCursor] = workMs;
+        this.frameCursor = (this.frameCursor + 1) % FRAME_WINDOW;
+        this.frameCount = Math.min(this.frameCount + 1, FRAME_WINDOW);
+        this.lastFrameAt = performance.now();
+        if (frameMs > SLOW_FRAME_MS) this.slowFrames++;
+        this.skippedBackground += skippedBackground;
+      })
+    );
+
+    cleanups.push(
+      adaptiveQuality.subscribe((level) => {
+        this.qualityLevel = QUALITY_LEVELS.indexOf(level);
+      })
+    );
+
+    this.observe(cleanups, "longtask", (entry) => {
+      this.longTasks++;
+      this.longTaskMs += entry.duration;
+    });
+    this.observe(cleanups, "largest-contentful-paint", (entry) => {
+      this.lcp = entry.startTime;
+    });
+    this.observe(cleanups, "layout-shift", (entry) => {
+      const shift = entry as LayoutShiftEntry;
+      if (!shift.hadRecentInput) this.cls += shift.value;
+    });
+    // INP is the worst interaction once duplicates of the same interaction
+    // (pointerdown/up/click) are merged; exact enough below 50 interactions
+    this.observe(
+      cleanups,
+      "event",
+      (entry) => {
+        const id = (entry as EventTimingEntry).interactionId;
+        if (!id) return;
+        const previous = this.interactions.get(id) ?? 0;
+        this.interactions.set(id, Math.max(previous, entry.duration));
+      },
+      { durationThreshold: 16 }
+    );
+
+    const publish = window.setInterval(
+      () => this.publish(),
+      PUBLISH_INTERVAL_MS
+    );
+    const report = window.setInterval(() => this.report(), REPORT_INTERVAL_MS);
+    const onHidden = () => {
+      if (document.visibilityState === "hidden") this.report();
+    };
+    const onPageHide = () => this.report();
+    document.addEventListener("visibilitychange", onHidden);
+    window.addEventListener("pagehide", onPageHide);
+    cleanups.push(() => {
+      window.clearInterval(publish);
+      window.clearInterval(report);
+      document.removeEventListener("visibilitychange", onHidden);
+      window.removeEventListener("pagehide", onPageHide);
+    });
+
+    this.publish();
+    return () => cleanups.forEach((cleanup) => cleanup());
+  }
+
+  private observe(
+    cleanups: (() => void)[],
+    type: string,
+    onEntry: (entry: PerformanceEntry) => void,
+    options: Record<string, unknown> = {}
+  ): void {
+    if (
+      typeof PerformanceObserver === "undefined" ||
+      !PerformanceObserver.supportedEntryTypes?.includes(type)
+    ) {
+      return;
+    }
+    const observer = new PerformanceObserver((list) =>
+      list.getEntries().forEach(onEntry)
+    );
+    observer.observe({ type, buffered: true, ...options });
+    cleanups.push(() => observer.disconnect());
+  }
+
+  private publish(): void {
+    // Frames stop arriving when nothing animates; don't report stale fps
+    const idle = performance.now() - this.lastFrameAt > 1000;
+    const count = idle ? 0 : this.frameCount;
+    const frames = this.frameTimes.slice(0, count).sort();
+    const work = this.workTimes.slice(0, count).sort();
+    let total = 0;
+    for (let i = 0; i < frames.length; i++) total += frames[i];
+
+    let inp: number | null = null;
+    for (const duration of this.interactions.values()) {
+      inp = Math.max(inp ?? 0, duration);
+    }
+
+    this.snapshot = {
+      fps: total > 0 ? Math.round((frames.length * 1000) / total) : 0,
+      frameP50: percentile(frames, 0.5),
+      frameP95: percentile(frames, 0.95),
+      workP95: percentile(work, 0.95),
+      slowFrames: this.slowFrames,
+      skippedBackground: this.skippedBackground,
+      longTasks: this.longTasks,
+      longTaskMs: Math.round(this.longTaskMs),
+      lcp: this.lcp === null ? null : Math.round(this.lcp),
+      cls: Math.round(this.cls * 1000) / 1000,
+      inp,
+      qualityLevel: this.qualityLevel,
+    };
+    this.listeners.forEach((listener) => listener(this.snapshot));
+  }
+
+  private report(): void {
+    this.publish();
+    const body = JSON.stringify({
+      url: window.location.pathname,
+      time: Date.now(),
+      viewport: [window.innerWidth, window.innerHeight],
+      dpr: window.devicePixelRatio,
+      ...this.snapshot,
+    });
+    const blob = new Blob([body], { type: "application/json" });
+    if (!navigator.sendBeacon?.(PERF_ENDPOINT, blob)) {
+      fetch(PERF_ENDPOINT, { method: "POST", body, keepalive: true }).catch(
+        () => {}
+      );
+    }
+  }
+}
+
+export const perfMonitor = new PerfMonitor();
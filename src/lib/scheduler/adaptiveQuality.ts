@@ -0,0 +1,98 @@
+import { frameScheduler, type FrameScheduler } from "./frameScheduler";
+
+// Steps canvas quality down when frames run long and back up when there is
+// headroom again. Levels first cap the canvas pixel ratio, then thin out
+// dot density. Downgrades react within about half a second; upgrades wait
+// for several seconds of smooth frames so the level doesn't oscillate.
+
+export interface QualityLevel {
+  /** Upper bound applied on top of the device pixel ratio */
+  maxDpr: number;
+  /** Fraction of the full dot density to draw, in (0, 1] */
+  density: number;
+}
+
+export const QUALITY_LEVELS: readonly QualityLevel[] = [
+  { maxDpr: 2, density: 1 },
+  { maxDpr: 1.5, density: 1 },
+  { maxDpr: 1, density: 1 },
+  { maxDpr: 1, density: 0.75 },
+  { maxDpr: 1, density: 0.5 },
+];
+
+const TARGET_FRAME_MS = 1000 / 60;
+const DOWNGRADE_FRAME_MS = TARGET_FRAME_MS * 1.25;
+const UPGRADE_FRAME_MS = TARGET_FRAME_MS * 1.05;
+const DOWNGRADE_AFTER_FRAMES = 30;
+const UPGRADE_AFTER_FRAMES = 240;
+const SMOOTHING = 0.1;
+
+type QualityListener = (level: QualityLevel) => void;
+
+export class AdaptiveQuality {
+  private readonly scheduler: FrameScheduler;
+  private listeners = new Set<QualityListener>();
+  private index = 0;
+  private average = TARGET_FRAME_MS;
+  private slowFrames = 0;
+  private fastFrames = 0;
+  private stopMeasuring: (() => void) | null = null;
+
+  constructor(scheduler: FrameScheduler) {
+    this.scheduler = scheduler;
+  }
+
+  get level(): QualityLevel {
+    return QUALITY_LEVELS[this.index];
+  }
+
+  /** Receive the current level immediately and on every change */
+  subscribe(listener: QualityListener): () => void {
+    this.listeners.add(listener);
+    listener(this.level);
+    if (!this.stopMeasuring) {
+      this.stopMeasuring = this.scheduler.onFrameStats((_work, frameMs) =>
+        this.measure(frameMs)
+      );
+    }
+    return () => {
+      this.listeners.delete(listener);
+      if (this.listeners.size === 0) {
+        this.stopMeasuring?.();
+        this.stopMeasuring = null;
+      }
+    };
+  }
+
+  private measure(frameMs: number): void {
+    this.average += (frameMs - this.average) * SMOOTHING;
+
+    if (this.average > DOWNGRADE_FRAME_MS) {
+      this.fastFrames = 0;
+      if (++this.slowFrames >= DOWNGRADE_AFTER_FRAMES) {
+        this.setIndex(this.index + 1);
+      }
+    } else if (this.average < UPGRADE_FRAME_MS) {
+      this.slowFrames = 0;
+      if (++this.fastFrames >= UPGRADE_AFTER_FRAMES) {
+        this.setIndex(this.index - 1);
+      }
+    } else {
+      this.slowFrames = 0;
+      this.fastFrames = 0;
+    }
+  }
+
+  private setIndex(index: number): void {
+    this.slowFrames = 0;
+    this.fastFrames = 0;
+    const next = Math.min(QUALITY_LEVELS.length - 1, Math.max(0, index));
+    if (next === this.index) return;
+    this.index = next;
+    // Let the new level settle before judging it
+    this.average = TARGET_FRAME_MS;
+    this.listeners.forEach((listener) => listener(this.level));
+  }
+}
+
+export const adaptiveQuality = new AdaptiveQuality(frameScheduler);
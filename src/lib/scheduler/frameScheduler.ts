@@ -0,0 +1,212 @@
+import { isDocumentVisible, subscribeDocumentVisibility } from "./visibility";
+
+// Single requestAnimationFrame loop shared by every animation on the page.
+//
+// Subscribers run in priority order once per frame. Background-priority
+// work is skipped for the frame once the time budget has been spent, so a
+// busy frame drops decorative work before it drops input handling. The
+// background pass starts at a different subscriber each frame, and one that
+// has been skipped MAX_BACKGROUND_SKIPS frames in a row runs regardless of
+// the budget, so no background subscriber is starved for long. The loop
+// only runs while at least one subscriber is active and the tab is visible;
+// an idle or hidden page schedules no frames at all.
+
+export type FramePriority = "input" | "animation" | "render" | "background";
+
+const PRIORITY_ORDER: Record<FramePriority, number> = {
+  input: 0,
+  animation: 1,
+  render: 2,
+  background: 3,
+};
+
+export type FrameCallback = (time: number, delta: number) => void;
+
+export interface FrameSubscription {
+  setActive(active: boolean): void;
+  unsubscribe(): void;
+}
+
+export interface FrameSubscribeOptions {
+  priority?: FramePriority;
+  /** Start paused; call setActive(true) to begin receiving frames */
+  active?: boolean;
+}
+
+/** Anything that can drive per-frame callbacks (the scheduler, or a stub) */
+export interface FrameSource {
+  subscribe(
+    callback: FrameCallback,
+    options?: FrameSubscribeOptions
+  ): FrameSubscription;
+}
+
+/**
+ * Main-thread time spent in subscribers, the interval since last frame, and
+ * how many active background subscribers were skipped over budget
+ */
+export type FrameStatsCallback = (
+  workMs: number,
+  frameMs: number,
+  skippedBackground: number
+) => void;
+
+interface Subscriber {
+  callback: FrameCallback;
+  order: number;
+  active: boolean;
+  /** Consecutive frames this background subscriber was skipped */
+  skipped: number;
+}
+
+// Leaves headroom in a 16.7ms frame for style, layout and paint.
+const DEFAULT_BUDGET_MS = 10;
+// Intervals longer than this are treated as a pause, not a slow frame.
+const MAX_FRAME_GAP_MS = 250;
+// A background subscriber skipped this many frames in a row runs anyway.
+const MAX_BACKGROUND_SKIPS = 4;
+
+export class FrameScheduler implements FrameSource {
+  budgetMs = DEFAULT_BUDGET_MS;
+  private subscribers: Subscriber[] = [];
+  private statsListeners = new Set<FrameStatsCallback>();
+  private frameId: number | null = null;
+  private lastTime = 0;
+  // Background subscriber the next frame's background pass starts from
+  private backgroundCursor = 0;
+  private visible = true;
+  private unsubscribeVisibility: (() => void) | null = null;
+
+  subscribe(
+    callback: FrameCallback,
+    { priority = "animation", active = true }: FrameSubscribeOptions = {}
+  ): FrameSubscription {
+    const subscriber: Subscriber = {
+      callback,
+      order: PRIORITY_ORDER[priority],
+      active,
+      skipped: 0,
+    };
+    // Copy on write so (un)subscribing from inside a callback is safe
+    this.subscribers = [...this.subscribers, subscriber].sort(
+      (a, b) => a.order - b.order
+    );
+    this.watchVisibility();
+    this.schedule();
+
+    return {
+      setActive: (next) => {
+        if (subscriber.active === next) return;
+        subscriber.active = next;
+        if (next) this.schedule();
+      },
+      unsubscribe: () => {
+        subscriber.active = false;
+        this.subscribers = this.subscribers.filter((s) => s !== subscriber);
+        if (this.subscribers.length === 0) this.release();
+      },
+    };
+  }
+
+  /** Observe per-frame cost, e.g. for adaptive quality */
+  onFrameStats(callback: FrameStatsCallback): () => void {
+    this.statsListeners.add(callback);
+    return () => this.statsListeners.delete(callback);
+  }
+
+  private watchVisibility(): void {
+    if (this.unsubscribeVisibility) return;
+    this.visible = isDocumentVisible();
+    this.unsubscribeVisibility = subscribeDocumentVisibility((visible) => {
+      this.visible = visible;
+      if (visible) {
+        this.lastTime = 0;
+        this.schedule();
+      } else {
+        this.cancel();
+      }
+    });
+  }
+
+  private release(): void {
+    this.cancel();
+    this.unsubscribeVisibility?.();
+    this.unsubscribeVisibility = null;
+  }
+
+  private schedule(): boolean {
+    if (this.frameId !== null) return true;
+    if (!this.visible || typeof requestAnimationFrame === "undefined") {
+      return false;
+    }
+    if (!this.subscribers.some((s) => s.active)) return false;
+    this.frameId = requestAnimationFrame(this.tick);
+    return true;
+  }
+
+  private cancel(): void {
+    if (this.frameId !== null) cancelAnimationFrame(this.frameId);
+    this.frameId = null;
+    this.lastTime = 0;
+  }
+
+  private tick = (time: number): void => {
+    this.frameId = null;
+    const frameMs = this.lastTime ? time - this.lastTime : 0;
+    this.lastTime = time;
+
+    const start = performance.now();
+    const subscribers = this.subscribers;
+    const backgroundOrder = PRIORITY_ORDER.background;
+    let firstBackground = subscribers.length;
+    for (let i = 0; i < subscribers.length; i++) {
+      const subscriber = subscribers[i];
+      if (subscriber.order === backgroundOrder) {
+        firstBackground = i;
+        break;
+      }
+      if (subscriber.active) this.run(subscriber, time, frameMs);
+    }
+
+    const backgroundCount = subscribers.length - firstBackground;
+    let skippedBackground = 0;
+    if (backgroundCount > 0) {
+      const offset = this.backgroundCursor % backgroundCount;
+      this.backgroundCursor = (offset + 1) % backgroundCount;
+      for (let k = 0; k < backgroundCount; k++) {
+        const subscriber =
+          subscribers[firstBackground + ((offset + k) % backgroundCount)];
+        if (!subscriber.active) continue;
+        if (
+          subscriber.skipped < MAX_BACKGROUND_SKIPS &&
+          performance.now() - start > this.budgetMs
+        ) {
+          subscriber.skipped++;
+          skippedBackground++;
+          continue;
+        }
+        subscriber.skipped = 0;
+        this.run(subscriber, time, frameMs);
+      }
+    }
+    const workMs = performance.now() - start;
+
+    if (frameMs > 0 && frameMs < MAX_FRAME_GAP_MS) {
+      this.statsListeners.forEach((callback) =>
+        callback(workMs, frameMs, skippedBackground)
+      );
+    }
+    // When the loop goes idle, the gap until it restarts isn't a frame
+    if (!this.schedule()) this.lastTime = 0;
+  };
+
+  private run(subscriber: Subscriber, time: number, frameMs: number): void {
+    try {
+      subscriber.callback(time, frameMs);
+    } catch (error) {
+      console.error("Frame subscriber failed:", error);
+    }
+  }
+}
+
+export const frameScheduler = new FrameScheduler();
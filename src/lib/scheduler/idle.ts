@@ -0,0 +1,29 @@
+// Idle-time callbacks for work that shouldn't compete with first paint or
+// input, such as fetching and hydrating deferred client islands.
+
+// Safari has no requestIdleCallback; a short timeout still yields to the
+// work queued by hydration.
+const FALLBACK_DELAY_MS = 200;
+
+/**
+ * Run `callback` once the browser is idle, or after `timeoutMs` at the
+ * latest. Returns a function that cancels it.
+ */
+export function scheduleIdle(
+  callback: () => void,
+  timeoutMs = 2000
+): () => void {
+  if (typeof window === "undefined") return () => {};
+
+  if (typeof window.requestIdleCallback === "function") {
+    const handle = window.requestIdleCallback(() => callback(), {
+      timeout: timeoutMs,
+    });
+    return () => window.cancelIdleCallback(handle);
+  }
+  const handle = window.setTimeout(
+    callback,
+    Math.min(FALLBACK_DELAY_MS, timeoutMs)
+  );
+  return () => window.clearTimeout(handle);
+}
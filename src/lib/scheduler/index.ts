@@ -0,0 +1,27 @@
+export {
+  frameScheduler,
+  FrameScheduler,
+  type FrameCallback,
+  type FramePriority,
+  type FrameSource,
+  type FrameSubscription,
+} from "./frameScheduler";
+export { inputBus, type PointerState, type ViewportState } from "./inputBus";
+export {
+  adaptiveQuality,
+  QUALITY_LEVELS,
+  type QualityLevel,
+} from "./adaptiveQuality";
+export {
+  getScrollSnapshot,
+  subscribeScroll,
+  type ScrollDirection,
+  type ScrollSnapshot,
+} from "./scrollStore";
+export { scheduleIdle } from "./idle";
+export {
+  isDocumentVisible,
+  observeElementVisibility,
+  onceNearViewport,
+  subscribeDocumentVisibility,
+} from "./visibility";
@@ -0,0 +1,197 @@
+import { frameScheduler, type FrameSubscription } from "./frameScheduler";
+
+// One set of window listeners for pointer, scroll and resize input.
+//
+// Event handlers only record the latest values and mark a channel dirty.
+// Subscribers are notified at most once per frame, at input priority,
+// before any animation runs in that frame. Listeners are attached when the
+// first subscriber arrives and removed with the last one.
+
+export interface PointerState {
+  /** Client coordinates of the last pointer or touch move */
+  x: number;
+  y: number;
+  /** True once any pointer movement has been seen */
+  active: boolean;
+  /** False after the pointer leaves the document */
+  inside: boolean;
+  pressed: boolean;
+  /** Element under the pointer at the last move */
+  target: Element | null;
+}
+
+export interface ViewportState {
+  scrollX: number;
+  scrollY: number;
+  width: number;
+  height: number;
+}
+
+type Channel = "pointer" | "scroll" | "resize";
+type Listener<T> = (state: T) => void;
+
+class InputBus {
+  readonly pointer: PointerState = {
+    x: 0,
+    y: 0,
+    active: false,
+    inside: false,
+    pressed: false,
+    target: null,
+  };
+  readonly viewport: ViewportState = {
+    scrollX: 0,
+    scrollY: 0,
+    width: 0,
+    height: 0,
+  };
+
+  private pointerListeners = new Set<Listener<PointerState>>();
+  private scrollListeners = new Set<Listener<ViewportState>>();
+  private resizeListeners = new Set<Listener<ViewportState>>();
+  private dirty = { pointer: false, scroll: false, resize: false };
+  private frame: FrameSubscription | null = null;
+  private attached = false;
+
+  onPointer(listener: Listener<PointerState>): () => void {
+    return this.add(this.pointerListeners, listener);
+  }
+
+  onScroll(listener: Listener<ViewportState>): () => void {
+    return this.add(this.scrollListeners, listener);
+  }
+
+  onResize(listener: Listener<ViewportState>): () => void {
+    return this.add(this.resizeListeners, listener);
+  }
+
+  private add<T>(listeners: Set<Listener<T>>, listener: Listener<T>) {
+    listeners.add(listener);
+    this.attach();
+    return () => {
+      listeners.delete(listener);
+      if (
+        this.pointerListeners.size === 0 &&
+        this.scrollListeners.size === 0 &&
+        this.resizeListeners.size === 0
+      ) {
+        this.detach();
+      }
+    };
+  }
+
+  private markDirty(channel: Channel): void {
+    this.dirty[channel] = true;
+    this.frame?.setActive(true);
+  }
+
+  private flush = (): void => {
+    const { dirty } = this;
+    this.frame?.setActive(false);
+    if (dirty.pointer) {
+      dirty.pointer = false;
+      this.pointerListeners.forEach((listener) => listener(this.pointer));
+    }
+    if (dirty.scroll) {
+      dirty.scroll = false;
+      this.scrollListeners.forEach((listener) => listener(this.viewport));
+    }
+    if (dirty.resize) {
+      dirty.resize = false;
+      this.resizeListeners.forEach((listener) => listener(this.viewport));
+    }
+  };
+
+  private handlePointerMove = (event: PointerEvent | MouseEvent): void => {
+    this.movePointer(event.clientX, event.clientY, event.target);
+  };
+
+  private handleTouchMove = (event: TouchEvent): void => {
+    const touch = event.touches[0];
+    if (touch) this.movePointer(touch.clientX, touch.clientY, event.target);
+  };
+
+  private movePointer(x: number, y: number, target: EventTarget | null) {
+    const { pointer } = this;
+    pointer.x = x;
+    pointer.y = y;
+    pointer.active = true;
+    pointer.inside = true;
+    pointer.target = target instanceof Element ? target : null;
+    this.markDirty("pointer");
+  }
+
+  private handlePointerDown = (): void => {
+    this.pointer.pressed = true;
+    this.markDirty("pointer");
+  };
+
+  private handlePointerUp = (): void => {
+    this.pointer.pressed = false;
+    this.markDirty("pointer");
+  };
+
+  private handlePointerLeave = (): void => {
+    this.pointer.inside = false;
+    this.markDirty("pointer");
+  };
+
+  private handleScroll = (): void => {
+    this.viewport.scrollX = window.scrollX;
+    this.viewport.scrollY = window.scrollY;
+    this.markDirty("scroll");
+  };
+
+  private handleResize = (): void => {
+    this.viewport.width = window.innerWidth;
+    this.viewport.height = window.innerHeight;
+    this.markDirty("resize");
+  };
+
+  private attach(): void {
+    if (this.attached || typeof window === "undefined") return;
+    this.attached = true;
+    this.viewport.scrollX = window.scrollX;
+    this.viewport.scrollY = window.scrollY;
+    this.viewport.width = window.innerWidth;
+    this.viewport.height = window.innerHeight;
+    this.frame = frameScheduler.subscribe(this.flush, {
+      priority: "input",
+      active: false,
+    });
+
+    const passive = { passive: true };
+    window.addEventListener("pointermove", this.handlePointerMove, passive);
+    window.addEventListener("touchmove", this.handleTouchMove, passive);
+    window.addEventListener("pointerdown", this.handlePointerDown, passive);
+    window.addEventListener("pointerup", this.handlePointerUp, passive);
+    window.addEventListener("scroll", this.handleScroll, passive);
+    window.addEventListener("resize", this.handleResize);
+    document.documentElement.addEventListener(
+      "mouseleave",
+      this.handlePointerLeave
+    );
+  }
+
+  private detach(): void {
+    if (!this.attached) return;
+    this.attached = false;
+    this.frame?.unsubscribe();
+    this.frame = null;
+
+    window.removeEventListener("pointermove", this.handlePointerMove);
+    window.removeEventListener("touchmove", this.handleTouchMove);
+    window.removeEventListener("pointerdown", this.handlePointerDown);
+    window.removeEventListener("pointerup", this.handlePointerUp);
+    window.removeEventListener("scroll", this.handleScroll);
+    window.removeEventListener("resize", this.handleResize);
+    document.documentElement.removeEventListener(
+      "mouseleave",
+      this.handlePointerLeave
+    );
+  }
+}
+
+export type { InputBus };
+
+export const inputBus = new InputBus();
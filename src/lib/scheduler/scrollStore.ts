@@ -0,0 +1,63 @@
+import { inputBus } from "./inputBus";
+
+// Page scroll position as a tiny external store. It is fed by the input
+// bus, so it updates at most once per frame and shares its scroll listener
+// with everything else. React components read it via useScrollSelector;
+// canvases and other non-React code can call subscribeScroll directly.
+
+export type ScrollDirection = "up" | "down" | null;
+
+export interface ScrollSnapshot {
+  x: number;
+  y: number;
+  /** Direction of the last vertical movement, null before any */
+  direction: ScrollDirection;
+}
+
+type ScrollListener = (snapshot: ScrollSnapshot) => void;
+
+const SERVER_SNAPSHOT: ScrollSnapshot = { x: 0, y: 0, direction: null };
+
+let snapshot = SERVER_SNAPSHOT;
+const listeners = new Set<ScrollListener>();
+let stopInput: (() => void) | null = null;
+
+function update(x: number, y: number, trackDirection = true): void {
+  if (x === snapshot.x && y === snapshot.y) return;
+  let { direction } = snapshot;
+  if (trackDirection && y !== snapshot.y) {
+    direction = y > snapshot.y ? "down" : "up";
+  }
+  // Snapshots are immutable so useSyncExternalStore can compare them
+  snapshot = { x, y, direction };
+  listeners.forEach((listener) => listener(snapshot));
+}
+
+/** Current scroll position; stable between scroll updates */
+export function getScrollSnapshot(): ScrollSnapshot {
+  return snapshot;
+}
+
+export function getServerScrollSnapshot(): ScrollSnapshot {
+  return SERVER_SNAPSHOT;
+}
+
+/** Called with the new snapshot at most once per frame while scrolling */
+export function subscribeScroll(listener: ScrollListener): () => void {
+  listeners.add(listener);
+  if (!stopInput && typeof window !== "undefined") {
+    // Catch up on scrolling that happened while nobody was listening,
+    // without guessing a direction from it
+    update(window.scrollX, window.scrollY, false);
+    stopInput = inputBus.onScroll(({ scrollX, scrollY }) =>
+      update(scrollX, scrollY)
+    );
+  }
+  return () => {
+    listeners.delete(listener);
+    if (listeners.size === 0) {
+      stopInput?.();
+      stopInput = null;
+    }
+  };
+}
@@ -0,0 +1,111 @@
+// Page and element visibility shared by every animated component. Each
+// listener type is registered once per page, however many components ask.
+
+type VisibilityCallback = (visible: boolean) => void;
+
+const documentListeners = new Set<VisibilityCallback>();
+let documentListening = false;
+
+function onVisibilityChange(): void {
+  const visible = document.visibilityState === "visible";
+  documentListeners.forEach((callback) => callback(visible));
+}
+
+export function isDocumentVisible(): boolean {
+  return typeof document === "undefined"
+    ? true
+    : document.visibilityState === "visible";
+}
+
+/** Called whenever the tab is hidden or shown */
+export function subscribeDocumentVisibility(
+  callback: VisibilityCallback
+): () => void {
+  documentListeners.add(callback);
+  if (!documentListening && typeof document !== "undefined") {
+    document.addEventListener("visibilitychange", onVisibilityChange);
+    documentListening = true;
+  }
+  return () => {
+    documentListeners.delete(callback);
+    if (documentListeners.size === 0 && documentListening) {
+      document.removeEventListener("visibilitychange", onVisibilityChange);
+      documentListening = false;
+    }
+  };
+}
+
+const elementListeners = new Map<Element, Set<VisibilityCallback>>();
+let observer: IntersectionObserver | null = null;
+
+function getObserver(): IntersectionObserver {
+  if (!observer) {
+    observer = new IntersectionObserver((entries) => {
+      entries.forEach((entry) => {
+        elementListeners
+          .get(entry.target)
+          ?.forEach((callback) => callback(entry.isIntersecting));
+      });
+    });
+  }
+  return observer;
+}
+
+/**
+ * Called with true while any part of `element` is inside the viewport.
+ * Falls back to always-visible where IntersectionObserver is missing.
+ */
+export function observeElementVisibility(
+  element: Element,
+  callback: VisibilityCallback
+): () => void {
+  if (typeof IntersectionObserver === "undefined") {
+    callback(true);
+    return () => {};
+  }
+
+  let callbacks = elementListeners.get(element);
+  if (!callbacks) {
+    callbacks = new Set();
+    elementListeners.set(element, callbacks);
+    getObserver().observe(element);
+  }
+  callbacks.add(callback);
+
+  return () => {
+    const current = elementListeners.get(element);
+    if (!current) return;
+    current.delete(callback);
+    if (current.size === 0) {
+      elementListeners.delete(element);
+      observer?.unobserve(element);
+    }
+  };
+}
+
+/**
+ * Called once when `element` comes within `rootMargin` of the viewport,
+ * e.g. to start loading content before it scrolls into view. Returns a
+ * function that cancels the observation.
+ */
+export function onceNearViewport(
+  element: Element,
+  callback: () => void,
+  rootMargin = "100% 0px"
+): () => void {
+  if (typeof IntersectionObserver === "undefined") {
+    callback();
+    return () => {};
+  }
+
+  const nearObserver = new IntersectionObserver(
+    (entries) => {
+      if (!entries.some((entry) => entry.isIntersecting)) return;
+      nearObserver.disconnect();
+      callback();
+    },
+    { rootMargin }
+  );
+  nearObserver.observe(element);
+  return () => nearObserver.disconnect();
+}